@@ -0,0 +1,130 @@
+import hashlib
+import json
+from typing import Any, Dict, Tuple
+
+from .collection import route_key
+from .diff import HASH_KEY, item_digest
+from .encoding import json_default
+
+
+def sort_keys(value: Any) -> Any:
+    """
+    Get a copy of a JSON value with the keys of every object sorted.
+
+    Args:
+        value (Any): The JSON value.
+
+    Returns:
+        Any: The sorted copy.
+    """
+    if isinstance(value, dict):
+        return {
+            key: sort_keys(value[key])
+            for key in sorted(value, key=str)
+        }
+    if isinstance(value, list):
+        return [sort_keys(item) for item in value]
+    return value
+
+
+def content_hash(item: Dict[str, Any]) -> str:
+    """
+    Get the content hash of an item, ignoring its own hash.
+
+    Args:
+        item (Dict[str, Any]): The Postman item.
+
+    Returns:
+        str: The hex digest of the canonical JSON of the item.
+    """
+    return item_digest(item)
+
+
+def _item_order(item: Dict[str, Any], input_host: str) -> Tuple[str, str]:
+    method, path = route_key(item, input_host).split(" ", 1)
+    return path, method
+
+
+def _canonical_item(item: Dict[str, Any]) -> None:
+    request = item.get("request")
+    if isinstance(request, dict):
+        if isinstance(request.get("params"), list):
+            request["params"] = sorted(
+                request["params"],
+                key=lambda param: (
+                    str(param.get("in", "")),
+                    str(param.get("name", "")),
+                ),
+            )
+        if isinstance(request.get("responses"), dict):
+            request["responses"] = sort_keys(request["responses"])
+    item[HASH_KEY] = content_hash(item)
+
+
+def canonicalize_collection(
+    collection: Dict[str, Any],
+    input_host: str = "",
+) -> Dict[str, Any]:
+    """
+    Sort a collection into its canonical order and stamp content
+    hashes, in place.
+
+    Folders are sorted by name, items by method and path, parameters
+    by location and name, and the keys of response schemas
+    alphabetically. Every item gets its content hash under
+    ``x-fast-man-hash``, and ``info`` the hash of the whole
+    collection, computed from the item hashes.
+
+    Args:
+        collection (Dict[str, Any]):
+            The Postman collection.
+        input_host (str):
+            The host URL the collection was generated with.
+
+    Returns:
+        Dict[str, Any]: The canonical collection.
+    """
+    folders = []
+    for folder in collection.get("item", []):
+        if isinstance(folder.get("item"), list):
+            for item in folder["item"]:
+                _canonical_item(item)
+            folder["item"] = sorted(
+                folder["item"],
+                key=lambda item: _item_order(item, input_host),
+            )
+        else:
+            _canonical_item(folder)
+        folders.append(folder)
+    collection["item"] = sorted(
+        folders,
+        key=lambda folder: str(folder.get("name", "")),
+    )
+
+    info = collection.setdefault("info", {})
+    info.pop(HASH_KEY, None)
+    summary = {
+        "info": info,
+        "auth": collection.get("auth"),
+        "item": [
+            {
+                "name": folder.get("name"),
+                "description": folder.get("description"),
+                "item": [
+                    item.get(HASH_KEY) for item in folder.get("item", [])
+                ],
+            }
+            if isinstance(folder.get("item"), list)
+            else folder.get(HASH_KEY)
+            for folder in collection["item"]
+        ],
+    }
+    info[HASH_KEY] = hashlib.sha1(
+        json.dumps(
+            summary,
+            sort_keys=True,
+            separators=(",", ":"),
+            default=json_default,
+        ).encode()
+    ).hexdigest()
+    return collection
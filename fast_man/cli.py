@@ -0,0 +1,836 @@
+import argparse
+import json
+import logging
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Only the standard library is imported at module level: FastAPI,
+# Pydantic and the generation modules are imported by each command
+# once its arguments are parsed, so --help and argument errors don't
+# pay for them.
+
+
+def import_app(path: str) -> Any:
+    """
+    Import an object from a ``module:variable`` path.
+
+    Args:
+        path (str): The path to the object, e.g. ``core.main:app``.
+
+    Returns:
+        Any: The imported object.
+    """
+    app_module, app_var = path.split(":")
+    return getattr(
+        __import__(
+            app_module,
+            fromlist=[app_var]
+        ),
+        app_var
+    )
+
+
+def diff_main(argv: List[str]) -> None:
+    """
+    Report the routes added, removed and changed since a collection
+    was generated, and optionally write an RFC 6902 patch.
+
+    Args:
+        argv (List[str]): The command-line arguments of ``diff``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="fast-man diff",
+        description="Diff a Postman collection against a FastAPI app.",
+    )
+    parser.add_argument(
+        "collection",
+        help="Path to the existing Postman collection",
+    )
+    parser.add_argument(
+        "--app",
+        required=True,
+        help="Path to the FastAPI app",
+    )
+    parser.add_argument(
+        "--name",
+        default="API Collection",
+        help="Name of the Postman collection",
+    )
+    parser.add_argument(
+        "--host",
+        default="http://localhost",
+        help="Host URL for the API",
+    )
+    parser.add_argument(
+        "--readme",
+        default="README.md",
+        help="Path to the README.md file for documentation",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for synthesised request body examples",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Output file for the diff report (default: stdout)",
+    )
+    parser.add_argument(
+        "--patch",
+        default=None,
+        help="Output file for the RFC 6902 JSON Patch",
+    )
+
+    args = parser.parse_args(argv)
+
+    from .collection import iter_collection_items
+    from .converter import build_postman_collection
+    from .diff import diff_collections
+    from .encoding import json_default
+
+    try:
+        app = import_app(args.app)
+    except Exception as e:
+        logger.error(
+            f"Error importing FastAPI app from {args.app}: {e}"
+        )
+        return
+
+    try:
+        collection = build_postman_collection(
+            app, args.name, args.host, args.readme, args.seed
+        )
+        result = diff_collections(
+            iter_collection_items(args.collection),
+            collection,
+            args.host,
+        )
+        patch = result.pop("patch")
+        if args.patch:
+            with open(args.patch, "w") as f:
+                json.dump(patch, f, indent=4, default=json_default)
+            logger.info(
+                f"JSON Patch saved to {args.patch}"
+            )
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(result, f, indent=4)
+            logger.info(
+                f"Diff report saved to {args.output}"
+            )
+        else:
+            print(json.dumps(result, indent=4))
+    except Exception as e:
+        logger.error(
+            f"Error diffing {args.collection}: {e}"
+        )
+
+
+def push_main(argv: List[str]) -> None:
+    """
+    Update a remote collection through the Postman API with the
+    items that changed since it was last pushed.
+
+    Args:
+        argv (List[str]): The command-line arguments of ``push``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="fast-man push",
+        description="Push the changed items of a FastAPI app to Postman.",
+    )
+    parser.add_argument(
+        "--app",
+        required=True,
+        help="Path to the FastAPI app",
+    )
+    parser.add_argument(
+        "--collection-id",
+        required=True,
+        help="Uid of the remote Postman collection",
+    )
+    parser.add_argument(
+        "--api-key",
+        default=os.environ.get("POSTMAN_API_KEY"),
+        help="Postman API key (default: $POSTMAN_API_KEY)",
+    )
+    parser.add_argument(
+        "--api-url",
+        default=None,
+        help=(
+            "Base URL of the Postman-compatible API "
+            "(default: https://api.getpostman.com)"
+        ),
+    )
+    parser.add_argument(
+        "--name",
+        default="API Collection",
+        help="Name of the Postman collection",
+    )
+    parser.add_argument(
+        "--host",
+        default="http://localhost",
+        help="Host URL for the API",
+    )
+    parser.add_argument(
+        "--readme",
+        default="README.md",
+        help="Path to the README.md file for documentation",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for synthesised request body examples",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=25,
+        help="Number of item requests per batch",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of concurrent requests",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=3,
+        help="Number of retries for failed requests",
+    )
+
+    args = parser.parse_args(argv)
+    if not args.api_key:
+        parser.error("--api-key or $POSTMAN_API_KEY is required")
+
+    from .converter import build_postman_collection
+    from .sync import POSTMAN_API_URL, push_collection
+
+    try:
+        app = import_app(args.app)
+    except Exception as e:
+        logger.error(
+            f"Error importing FastAPI app from {args.app}: {e}"
+        )
+        return
+
+    try:
+        collection = build_postman_collection(
+            app, args.name, args.host, args.readme, args.seed
+        )
+        push_collection(
+            collection,
+            args.collection_id,
+            args.api_key,
+            api_url=args.api_url or POSTMAN_API_URL,
+            input_host=args.host,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            retries=args.retries,
+        )
+    except Exception as e:
+        logger.error(
+            f"Error pushing collection {args.collection_id}: {e}"
+        )
+
+
+def smoke_main(argv: List[str]) -> None:
+    """
+    Send every generated request to the app in-process and report
+    status mismatches and latency percentiles.
+
+    Args:
+        argv (List[str]): The command-line arguments of ``smoke``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="fast-man smoke",
+        description="Smoke test the generated requests against the app.",
+    )
+    parser.add_argument(
+        "--app",
+        required=True,
+        help="Path to the FastAPI app",
+    )
+    parser.add_argument(
+        "--name",
+        default="API Collection",
+        help="Name of the Postman collection",
+    )
+    parser.add_argument(
+        "--host",
+        default="http://localhost",
+        help="Host URL for the API",
+    )
+    parser.add_argument(
+        "--readme",
+        default="README.md",
+        help="Path to the README.md file for documentation",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for synthesised request body examples",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Number of requests per route",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Maximum number of requests in flight",
+    )
+    parser.add_argument(
+        "--token",
+        default=None,
+        help="Bearer token for authenticated routes",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Output file for the JSON report (default: stdout)",
+    )
+    parser.add_argument(
+        "--annotate",
+        default=None,
+        help="Output file for a collection annotated with latencies",
+    )
+
+    args = parser.parse_args(argv)
+
+    from .converter import build_postman_collection
+    from .encoding import json_default
+    from .smoke import smoke_test
+
+    try:
+        app = import_app(args.app)
+    except Exception as e:
+        logger.error(
+            f"Error importing FastAPI app from {args.app}: {e}"
+        )
+        return
+
+    try:
+        collection = build_postman_collection(
+            app, args.name, args.host, args.readme, args.seed
+        )
+        report = smoke_test(
+            app,
+            collection,
+            args.host,
+            repeat=args.repeat,
+            concurrency=args.concurrency,
+            token=args.token,
+            annotate=bool(args.annotate),
+        )
+        if args.annotate:
+            with open(args.annotate, "w") as f:
+                json.dump(collection, f, indent=4, default=json_default)
+            logger.info(
+                f"Annotated Postman collection saved to {args.annotate}"
+            )
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=4)
+            logger.info(
+                f"Smoke test report saved to {args.output}"
+            )
+        else:
+            print(json.dumps(report, indent=4))
+    except Exception as e:
+        logger.error(
+            f"Error smoke testing {args.app}: {e}"
+        )
+
+
+def serve_main(argv: List[str]) -> None:
+    """
+    Keep a FastAPI app and its collections resident and serve them
+    over a local Unix socket.
+
+    Args:
+        argv (List[str]): The command-line arguments of ``serve``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="fast-man serve",
+        description="Serve Postman collections over a Unix socket.",
+    )
+    parser.add_argument(
+        "--app",
+        required=True,
+        help="Path to the FastAPI app",
+    )
+    parser.add_argument(
+        "--socket",
+        default=".fast-man.sock",
+        help="Path of the Unix socket",
+    )
+    parser.add_argument(
+        "--name",
+        default="API Collection",
+        help="Default name of the Postman collection",
+    )
+    parser.add_argument(
+        "--host",
+        default="http://localhost",
+        help="Default host URL for the API",
+    )
+    parser.add_argument(
+        "--readme",
+        default="README.md",
+        help="Default path to the README.md file for documentation",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Default seed for synthesised request body examples",
+    )
+
+    args = parser.parse_args(argv)
+
+    from .server import serve
+
+    try:
+        app = import_app(args.app)
+    except Exception as e:
+        logger.error(
+            f"Error importing FastAPI app from {args.app}: {e}"
+        )
+        return
+
+    try:
+        serve(
+            app,
+            args.socket,
+            args.name,
+            args.host,
+            args.readme,
+            args.seed,
+        )
+    except FileExistsError as e:
+        logger.error(
+            f"Error serving on {args.socket}: {e}"
+        )
+        raise SystemExit(1)
+
+
+def client_main(argv: List[str]) -> None:
+    """
+    Request a (filtered) collection from a running ``fast-man serve``.
+
+    Args:
+        argv (List[str]): The command-line arguments of ``client``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="fast-man client",
+        description="Get a Postman collection from a fast-man server.",
+    )
+    parser.add_argument(
+        "--socket",
+        default=".fast-man.sock",
+        help="Path of the Unix socket",
+    )
+    parser.add_argument(
+        "--output",
+        default="postman_collection.json",
+        help="Output file for the Postman collection",
+    )
+    parser.add_argument(
+        "--name",
+        default=None,
+        help="Name of the Postman collection",
+    )
+    parser.add_argument(
+        "--host",
+        default=None,
+        help="Host URL for the API",
+    )
+    parser.add_argument(
+        "--tag",
+        action="append",
+        default=[],
+        help="Only include the folder of this tag (repeatable)",
+    )
+    parser.add_argument(
+        "--path",
+        action="append",
+        default=[],
+        help="Only include routes under this path prefix (repeatable)",
+    )
+
+    args = parser.parse_args(argv)
+    request: Dict[str, Any] = {
+        "tags": args.tag,
+        "paths": args.path,
+    }
+    if args.name is not None:
+        request["name"] = args.name
+    if args.host is not None:
+        request["host"] = args.host
+
+    from .server import request_collection
+
+    try:
+        collection = request_collection(args.socket, **request)
+        with open(args.output, "w") as f:
+            json.dump(collection, f, indent=4)
+        logger.info(
+            f"Postman collection saved to {args.output}"
+        )
+    except Exception as e:
+        logger.error(
+            f"Error requesting collection from {args.socket}: {e}"
+        )
+
+
+def _tag_values(
+    parser: argparse.ArgumentParser,
+    option: str,
+    unit: str,
+    values: List[str],
+) -> Dict[str, int]:
+    try:
+        return {
+            tag: int(value)
+            for tag, value in (value.rsplit("=", 1) for value in values)
+        }
+    except ValueError:
+        parser.error(f"{option} expects TAG={unit}")
+
+
+COMMANDS: Dict[str, Callable[[List[str]], None]] = {
+    "diff": diff_main,
+    "push": push_main,
+    "smoke": smoke_main,
+    "serve": serve_main,
+    "client": client_main,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main function to parse arguments
+    and generate the Postman collection.
+
+    Args:
+        argv (Optional[List[str]]):
+            The command-line arguments, defaults to ``sys.argv[1:]``.
+    """
+    logging.basicConfig(level=logging.INFO)
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        COMMANDS[argv[0]](argv[1:])
+        return
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Generate Postman collection from FastAPI app. "
+            f"Other commands: {', '.join(COMMANDS)}."
+        )
+    )
+    parser.add_argument(
+        "--app",
+        default=None,
+        help="Path to the FastAPI app",
+    )
+    parser.add_argument(
+        "--router",
+        action="append",
+        default=[],
+        metavar="MODULE:VAR[@PREFIX]",
+        help=(
+            "Path to an APIRouter to document, optionally with the "
+            "prefix it is included under (repeatable)"
+        ),
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help=(
+            "Output file (default: postman_collection.json, "
+            "locustfile.py or k6_script.js)"
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        choices=("postman", "locust", "k6"),
+        default="postman",
+        help="Write a Postman collection or a Locust/k6 load test",
+    )
+    parser.add_argument(
+        "--tag-weight",
+        action="append",
+        default=[],
+        metavar="TAG=N",
+        help=(
+            "Load test weight of the requests of a tag, their number "
+            "by default (repeatable)"
+        ),
+    )
+    parser.add_argument(
+        "--name",
+        default="API Collection",
+        help="Name of the Postman collection",
+    )
+    parser.add_argument(
+        "--host",
+        default="http://localhost",
+        help="Host URL for the API",
+    )
+    parser.add_argument(
+        "--readme",
+        default="README.md",
+        help="Path to the README.md file for documentation",
+    )
+    parser.add_argument(
+        "--docs-dir",
+        default=None,
+        help="Directory of <tag>.md files describing the tag folders",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for synthesised request body examples",
+    )
+    parser.add_argument(
+        "--merge-into",
+        default=None,
+        help=(
+            "Existing collection whose hand-edited tests, scripts "
+            "and examples are kept on the regenerated items"
+        ),
+    )
+    parser.add_argument(
+        "--slo-ms",
+        type=int,
+        default=None,
+        help="Default response time budget asserted by each item",
+    )
+    parser.add_argument(
+        "--tag-slo",
+        action="append",
+        default=[],
+        metavar="TAG=MS",
+        help="Response time budget for the items of a tag (repeatable)",
+    )
+    parser.add_argument(
+        "--max-schema-bytes",
+        type=int,
+        default=None,
+        help="Summarise schemas and body examples larger than this",
+    )
+    parser.add_argument(
+        "--max-schema-depth",
+        type=int,
+        default=None,
+        help="Cut schemas and body examples nested deeper than this",
+    )
+    parser.add_argument(
+        "--route-timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help=(
+            "Time budget of each route; routes are extracted in forked "
+            "workers and replaced by stub items when over budget"
+        ),
+    )
+    parser.add_argument(
+        "--canonical",
+        action="store_true",
+        help=(
+            "Sort the output canonically and stamp item and collection "
+            "content hashes"
+        ),
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Validate the output against the Postman v2.1 schema",
+    )
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="Print the heaviest routes and models after generation",
+    )
+    parser.add_argument(
+        "--report-file",
+        default=None,
+        help="Output file for the full per-route JSON report",
+    )
+    parser.add_argument(
+        "--report-top",
+        type=int,
+        default=10,
+        help="Number of routes and models listed by --report",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        default=None,
+        help=(
+            "Output file for the run metrics (durations, counts, cache "
+            "hit ratios, output bytes, peak RSS, errors)"
+        ),
+    )
+    parser.add_argument(
+        "--metrics-format",
+        choices=("prometheus", "json"),
+        default=None,
+        help=(
+            "Format of the metrics file, JSON for .json files and a "
+            "Prometheus textfile otherwise by default"
+        ),
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=0,
+        help="Rows of iteration data to write per route for Newman runs",
+    )
+    parser.add_argument(
+        "--iterations-dir",
+        default="iterations",
+        help="Output directory for the iteration data files",
+    )
+    parser.add_argument(
+        "--iterations-format",
+        choices=("csv", "json"),
+        default="csv",
+        help="Format of the iteration data files",
+    )
+
+    args = parser.parse_args(argv)
+    if not args.app and not args.router:
+        parser.error("--app or --router is required")
+    tag_slo_ms = _tag_values(parser, "--tag-slo", "MS", args.tag_slo)
+    tag_weights = _tag_values(parser, "--tag-weight", "N", args.tag_weight)
+
+    from .converter import (
+        build_postman_collection,
+        generate_postman_collection,
+    )
+    from .iterations import write_iterations
+    from .metrics import GenerationMetrics, timed_phase
+    from .report import GenerationReport
+    from .validation import CollectionValidator
+
+    report = (
+        GenerationReport() if args.report or args.report_file else None
+    )
+    validator = CollectionValidator() if args.validate else None
+    metrics = GenerationMetrics(args.name) if args.metrics_file else None
+
+    try:
+        with timed_phase(metrics, "import"):
+            app = import_app(args.app) if args.app else None
+            sources: List[Any] = [app] if app is not None else []
+            for value in args.router:
+                path, _, prefix = value.partition("@")
+                sources.append((import_app(path), prefix))
+
+        if args.format == "postman":
+            generate_postman_collection(
+                sources if len(sources) > 1 else sources[0],
+                args.output or "postman_collection.json",
+                args.name,
+                args.host,
+                args.readme,
+                merge_into=args.merge_into,
+                seed=args.seed,
+                slo_ms=args.slo_ms,
+                tag_slo_ms=tag_slo_ms,
+                report=report,
+                validator=validator,
+                max_schema_bytes=args.max_schema_bytes,
+                max_schema_depth=args.max_schema_depth,
+                docs_dir=args.docs_dir,
+                canonical=args.canonical,
+                route_timeout=args.route_timeout,
+                metrics=metrics,
+                iteration_variables=args.iterations > 0,
+            )
+        else:
+            from .loadtest import LOAD_TEST_OUTPUTS, write_load_test
+
+            with timed_phase(metrics, "build"):
+                collection = build_postman_collection(
+                    sources if len(sources) > 1 else sources[0],
+                    args.name,
+                    args.host,
+                    args.readme,
+                    args.seed,
+                    slo_ms=args.slo_ms,
+                    tag_slo_ms=tag_slo_ms,
+                    report=report,
+                    validator=validator,
+                    max_schema_bytes=args.max_schema_bytes,
+                    max_schema_depth=args.max_schema_depth,
+                    canonical=args.canonical,
+                    route_timeout=args.route_timeout,
+                )
+            output = args.output or LOAD_TEST_OUTPUTS[args.format]
+            with timed_phase(metrics, "write"):
+                write_load_test(
+                    collection,
+                    output,
+                    args.format,
+                    args.host,
+                    tag_weights,
+                )
+            if metrics:
+                metrics.observe_routes(sources)
+                metrics.observe_collection(collection)
+                metrics.observe_output(output)
+        if args.report:
+            print(report.summary(args.report_top))
+        if args.report_file:
+            with open(args.report_file, "w") as f:
+                json.dump(report.to_dict(), f, indent=4)
+            logger.info(
+                f"Generation report saved to {args.report_file}"
+            )
+        if args.iterations > 0:
+            with timed_phase(metrics, "iterations"):
+                write_iterations(
+                    sources,
+                    args.iterations_dir,
+                    args.iterations,
+                    args.iterations_format,
+                    args.seed,
+                )
+        if validator:
+            validator.log_warnings()
+        if validator and validator.errors:
+            validator.log_errors()
+            raise SystemExit(1)
+    except Exception as e:
+        logger.error(
+            f"Error generating from {args.app or args.router}: {e}"
+        )
+    finally:
+        if metrics:
+            metrics.close()
+            try:
+                metrics.write(args.metrics_file, args.metrics_format)
+                logger.info(f"Metrics saved to {args.metrics_file}")
+            except Exception as e:
+                logger.error(
+                    f"Error saving metrics to {args.metrics_file}: {e}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+import json
+import re
+from typing import Any, Dict, Iterator, List, TextIO, Tuple
+from urllib.parse import urlsplit
+
+# (folder names, index path, item)
+CollectionEntry = Tuple[Tuple[str, ...], Tuple[int, ...], Dict[str, Any]]
+
+_VARIABLE_PREFIX = re.compile(r"^\{\{[^}]+\}\}")
+_PATH_VARIABLE = re.compile(r"\{\{([^}]+)\}\}")
+_WHITESPACE = " \t\n\r"
+
+
+def route_key(item: Dict[str, Any], host: str = "") -> str:
+    """
+    Get the stable route identity (method + path) of a Postman item.
+
+    Args:
+        item (Dict[str, Any]): The Postman item.
+        host (str): The host URL the collection was generated with.
+
+    Returns:
+        str: The route identity, e.g. ``"GET /items/{item_id}"``.
+    """
+    request = item.get("request") or {}
+    if isinstance(request, str):
+        request = {"url": request}
+    method = str(request.get("method") or "GET").upper()
+    url = request.get("url") or ""
+    if isinstance(url, dict):
+        url = url.get("raw") or "/" + "/".join(url.get("path") or [])
+    if host and url.startswith(host):
+        path = url[len(host):]
+    else:
+        path = _VARIABLE_PREFIX.sub("", url)
+        if "://" in path:
+            path = urlsplit(path).path
+    # ``{{item_id}}`` iteration variables stand for ``{item_id}``.
+    path = _PATH_VARIABLE.sub(r"{\1}", path.split("?", 1)[0])
+    return f"{method} {path or '/'}"
+
+
+def walk_collection(
+    collection: Dict[str, Any]
+) -> Iterator[CollectionEntry]:
+    """
+    Walk the request items of an in-memory Postman collection.
+
+    Args:
+        collection (Dict[str, Any]): The Postman collection.
+
+    Yields:
+        CollectionEntry:
+            The enclosing folder names, the index path of the item
+            and the item itself.
+    """
+    def _walk(
+        items: List[Dict[str, Any]],
+        folders: Tuple[str, ...],
+        location: Tuple[int, ...],
+    ) -> Iterator[CollectionEntry]:
+        for index, item in enumerate(items):
+            if "item" in item:
+                yield from _walk(
+                    item["item"],
+                    folders + (item.get("name", ""),),
+                    location + (index,),
+                )
+            elif "request" in item:
+                yield folders, location + (index,), item
+
+    yield from _walk(collection.get("item", []), (), ())
+
+
+class _JSONStream:
+    """
+    Minimal pull reader over a JSON text file.
+
+    Only containers that are walked explicitly are kept out of
+    memory; every other value is decoded whole with ``raw_decode``.
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int = 65536) -> None:
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _read(self, size: int) -> None:
+        chunk = self.fp.read(size)
+        if not chunk:
+            self.eof = True
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+
+    def peek(self) -> str:
+        while True:
+            while (
+                self.pos < len(self.buffer)
+                and self.buffer[self.pos] in _WHITESPACE
+            ):
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                break
+            self._read(self.chunk_size)
+        return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                f"Expected {char!r} but found {found!r} in JSON stream"
+            )
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(
+                    self.buffer, self.pos
+                )
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._read(size)
+            size *= 2
+
+
+def _stream_items(
+    stream: _JSONStream,
+    folders: Tuple[str, ...],
+    location: Tuple[int, ...],
+) -> Iterator[CollectionEntry]:
+    stream.expect("[")
+    if stream.peek() == "]":
+        stream.expect("]")
+        return
+    index = 0
+    while True:
+        yield from _stream_node(stream, folders, location + (index,))
+        if stream.peek() == ",":
+            stream.expect(",")
+            index += 1
+            continue
+        stream.expect("]")
+        return
+
+
+def _stream_node(
+    stream: _JSONStream,
+    folders: Tuple[str, ...],
+    location: Tuple[int, ...],
+) -> Iterator[CollectionEntry]:
+    stream.expect("{")
+    node: Dict[str, Any] = {}
+    is_folder = False
+    while stream.peek() != "}":
+        key = stream.value()
+        stream.expect(":")
+        if key == "item" and stream.peek() == "[":
+            is_folder = True
+            yield from _stream_items(
+                stream,
+                folders + (str(node.get("name", "")),),
+                location,
+            )
+        else:
+            node[key] = stream.value()
+        if stream.peek() == ",":
+            stream.expect(",")
+    stream.expect("}")
+    if not is_folder and "request" in node:
+        yield folders, location, node
+
+
+def iter_collection_items(
+    source: str,
+    chunk_size: int = 65536,
+) -> Iterator[CollectionEntry]:
+    """
+    Stream the request items of a Postman collection file.
+
+    Folders are walked incrementally and only one request item is
+    decoded at a time, so the whole collection is never loaded.
+
+    Args:
+        source (str): Path to the Postman collection file.
+        chunk_size (int): Number of characters read at a time.
+
+    Yields:
+        CollectionEntry:
+            The enclosing folder names, the index path of the item
+            and the item itself.
+    """
+    with open(source, "r") as f:
+        stream = _JSONStream(f, chunk_size)
+        stream.expect("{")
+        while stream.peek() != "}":
+            key = stream.value()
+            stream.expect(":")
+            if key == "item" and stream.peek() == "[":
+                yield from _stream_items(stream, (), ())
+            else:
+                stream.value()
+            if stream.peek() == ",":
+                stream.expect(",")
+
+
+def index_items(
+    entries: Iterator[CollectionEntry],
+    host: str = "",
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Index request items by route identity.
+
+    Args:
+        entries (Iterator[CollectionEntry]): The collection entries.
+        host (str): The host URL the collection was generated with.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]:
+            The items for every route identity, in collection order.
+    """
+    index: Dict[str, List[Dict[str, Any]]] = {}
+    for _, _, item in entries:
+        index.setdefault(route_key(item, host), []).append(item)
+    return index
@@ -1,45 +1,281 @@
 import json
 import logging
-from fastapi import FastAPI
+import os
 from fastapi.routing import APIRoute
+from .canonical import canonicalize_collection
+from .collection import route_key, walk_collection
+from .docs import get_folder_doc, read_doc
+from .encoding import encode, json_default
+from .isolation import build_isolated_items, isolation_supported
+from .iterations import apply_iteration_variables
+from .merge import merge_collection
+from .metrics import GenerationMetrics, timed_phase
+from .report import GenerationReport
+from .routes import Router, RouteSources, route_sources
+from .validation import CollectionValidator
 from .utils import (
     get_request_body_example,
     get_headers,
     get_parameters,
     get_responses,
+    get_response_time_tests,
 )
-from typing import Any, Dict
-from fastapi.encoders import jsonable_encoder
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def generate_postman_collection(
-    app: FastAPI,
-    output_file: str = "postman_collection.json",
+def _call(func: Callable[..., Any], *args: Any) -> Any:
+    return func(*args)
+
+
+def build_route_items(
+    route: APIRoute,
+    input_host: str = "http://localhost",
+    seed: int = 0,
+    slo_ms: Optional[int] = None,
+    tag_slo_ms: Optional[Dict[str, int]] = None,
+    report: Optional[GenerationReport] = None,
+    max_schema_bytes: Optional[int] = None,
+    max_schema_depth: Optional[int] = None,
+    prefix: str = "",
+    iteration_variables: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Build the Postman items for a route, one per HTTP method.
+
+    Headers, body example, parameters, responses and tests do not
+    depend on the method, so they are extracted once and shared by the
+    items of a multi-method route.
+
+    Args:
+        route (APIRoute):
+            The route to build the items for.
+        input_host (str):
+            The host URL for the API.
+        seed (int):
+            The seed for synthesised body examples.
+        slo_ms (Optional[int]):
+            The default response time budget, in milliseconds.
+        tag_slo_ms (Optional[Dict[str, int]]):
+            The response time budgets per tag, in milliseconds.
+        report (Optional[GenerationReport]):
+            The report collecting per-route statistics.
+        max_schema_bytes (Optional[int]):
+            The size budget of each schema and body example, in bytes.
+        max_schema_depth (Optional[int]):
+            The nesting budget of each schema and body example.
+        prefix (str):
+            The prefix the route's router is included under.
+        iteration_variables (bool):
+            Whether the items read their parameters and body from the
+            ``--iterations`` data columns.
+
+    Returns:
+        List[Dict[str, Any]]: The Postman items, in method order.
+    """
+    call = report.timed if report else _call
+    # Response schemas come from ``model_json_schema`` and are left to
+    # ``json_default`` at serialisation; only the small body example and
+    # parameters, which may hold enums or ``PydanticUndefined``
+    # defaults, are encoded here.
+    responses = call(
+        get_responses,
+        route,
+        max_schema_bytes,
+        max_schema_depth
+    )
+    headers = call(
+        get_headers,
+        route
+    )
+    body = encode(
+        call(
+            get_request_body_example,
+            route,
+            seed,
+            max_schema_bytes,
+            max_schema_depth
+        )
+    )
+    params = encode(
+        call(
+            get_parameters,
+            route
+        )
+    )
+    events = call(
+        get_response_time_tests,
+        route,
+        responses,
+        slo_ms,
+        tag_slo_ms
+    )
+
+    items = []
+    for method in sorted(route.methods):
+        item = {
+            "name": route.name,
+            "request": {
+                "url": f"{input_host}{prefix}{route.path}",
+                "method": method,
+                "description": route.summary or "",
+                "header": headers,
+                "body": {
+                    "mode": "raw",
+                    "raw": body,
+                },
+                "params": params,
+                "responses": responses,
+            },
+        }
+        if events:
+            item["event"] = events
+        if iteration_variables:
+            apply_iteration_variables(route, item)
+        items.append(item)
+    if report:
+        report.add_route(route, items, prefix)
+    return items
+
+
+def build_route_item(
+    route: APIRoute,
+    input_host: str = "http://localhost",
+    seed: int = 0,
+    slo_ms: Optional[int] = None,
+    tag_slo_ms: Optional[Dict[str, int]] = None,
+    report: Optional[GenerationReport] = None,
+    max_schema_bytes: Optional[int] = None,
+    max_schema_depth: Optional[int] = None,
+    prefix: str = "",
+) -> Dict[str, Any]:
+    """
+    Build the Postman item for the first method of a route.
+
+    Kept for backwards compatibility, see ``build_route_items``.
+
+    Args:
+        route (APIRoute):
+            The route to build the item for.
+        input_host (str):
+            The host URL for the API.
+        seed (int):
+            The seed for synthesised body examples.
+        slo_ms (Optional[int]):
+            The default response time budget, in milliseconds.
+        tag_slo_ms (Optional[Dict[str, int]]):
+            The response time budgets per tag, in milliseconds.
+        report (Optional[GenerationReport]):
+            The report collecting per-route statistics.
+        max_schema_bytes (Optional[int]):
+            The size budget of each schema and body example, in bytes.
+        max_schema_depth (Optional[int]):
+            The nesting budget of each schema and body example.
+        prefix (str):
+            The prefix the route's router is included under.
+
+    Returns:
+        Dict[str, Any]: The Postman item.
+    """
+    return build_route_items(
+        route,
+        input_host,
+        seed,
+        slo_ms,
+        tag_slo_ms,
+        report,
+        max_schema_bytes,
+        max_schema_depth,
+        prefix
+    )[0]
+
+
+def _build_folder(tag: str, docs_dir: Optional[str]) -> Dict[str, Any]:
+    folder: Dict[str, Any] = {"name": tag}
+    if docs_dir:
+        try:
+            description = get_folder_doc(docs_dir, tag)
+            if description is not None:
+                folder["description"] = description
+        except Exception as e:
+            logger.error(
+                f"Error reading documentation of folder {tag}: {e}"
+            )
+    folder["item"] = []
+    return folder
+
+
+def build_postman_collection(
+    app: RouteSources,
     input_name: str = "API Collection",
     input_host: str = "http://localhost",
     readme_file: str = "README.md",
-) -> None:
+    seed: int = 0,
+    slo_ms: Optional[int] = None,
+    tag_slo_ms: Optional[Dict[str, int]] = None,
+    report: Optional[GenerationReport] = None,
+    validator: Optional[CollectionValidator] = None,
+    max_schema_bytes: Optional[int] = None,
+    max_schema_depth: Optional[int] = None,
+    docs_dir: Optional[str] = None,
+    canonical: bool = False,
+    route_timeout: Optional[float] = None,
+    iteration_variables: bool = False,
+) -> Dict[str, Any]:
     """
-    Generate a Postman collection from a FastAPI app.
+    Build a Postman collection from a FastAPI app or routers.
+
+    The routes of several apps or routers are extracted one source
+    after the other and merged in the given order. Extraction is
+    CPU-bound under the GIL, so only forked workers (``route_timeout``)
+    run routes in parallel.
 
     Args:
-        app (FastAPI):
-            The FastAPI app instance.
-        output_file (str):
-            The output file name for the Postman collection.
+        app (RouteSources):
+            The FastAPI app instance, an ``APIRouter``, a
+            ``(router, prefix)`` pair or a list of them.
         input_name (str):
             The name of the Postman collection.
         input_host (str):
             The host URL for the API.
         readme_file (str):
             The path to the README.md file for documentation.
+        seed (int):
+            The seed for synthesised body examples.
+        slo_ms (Optional[int]):
+            The default response time budget, in milliseconds.
+        tag_slo_ms (Optional[Dict[str, int]]):
+            The response time budgets per tag, in milliseconds.
+        report (Optional[GenerationReport]):
+            The report collecting per-route statistics.
+        validator (Optional[CollectionValidator]):
+            The validator checking items against the Postman schema
+            as they are built.
+        max_schema_bytes (Optional[int]):
+            The size budget of each schema and body example, in bytes.
+        max_schema_depth (Optional[int]):
+            The nesting budget of each schema and body example.
+        docs_dir (Optional[str]):
+            The directory of the ``<tag>.md`` folder descriptions.
+        canonical (bool):
+            Whether to sort the collection into its canonical order
+            and stamp item and collection content hashes.
+        route_timeout (Optional[float]):
+            The time budget of each route, in seconds. Routes are then
+            extracted in forked workers, and those failing or running
+            over budget are replaced by stub items.
+        iteration_variables (bool):
+            Whether the items read their parameters and body from the
+            ``--iterations`` data columns.
+
+    Returns:
+        Dict[str, Any]: The Postman collection.
     """
     try:
-        with open(readme_file, "r") as f:
-            readme_content = f.read()
+        readme_content = read_doc(readme_file)
+        if readme_content is None:
+            raise FileNotFoundError(f"No such file: {readme_file!r}")
     except Exception as e:
         logger.error(
             f"Error reading README.md file: {e}"
@@ -68,54 +304,211 @@ def generate_postman_collection(
         },
     }
 
-    folders = {}
+    if route_timeout and not isolation_supported():
+        logger.warning(
+            "Route time budgets need fork(), extracting in-process"
+        )
+        route_timeout = None
+
+    def extract(
+        source: Tuple[Router, str],
+    ) -> List[Tuple[List[str], Dict[str, Any]]]:
+        router, prefix = source
+
+        def build(
+            route: APIRoute,
+            route_report: Optional[GenerationReport],
+        ) -> List[Dict[str, Any]]:
+            return build_route_items(
+                route,
+                input_host,
+                seed,
+                slo_ms,
+                tag_slo_ms,
+                route_report,
+                max_schema_bytes,
+                max_schema_depth,
+                prefix,
+                iteration_variables,
+            )
 
-    for route in app.routes:
-        if isinstance(route, APIRoute):
+        routes = [
+            route for route in router.routes if isinstance(route, APIRoute)
+        ]
+        built = None
+        if route_timeout:
+            built = build_isolated_items(
+                routes,
+                build,
+                route_timeout,
+                input_host,
+                prefix,
+                report,
+                os.cpu_count() or 1,
+            )
+        items = []
+        for index, route in enumerate(routes):
             try:
-                item = {
-                    "name": route.name,
-                    "request": {
-                        "url": f"{input_host}{route.path}",
-                        "method": route.methods.pop(),
-                        "description": route.summary or "",
-                        "header": get_headers(
-                            route
-                        ),
-                        "body": {
-                            "mode": "raw",
-                            "raw": jsonable_encoder(
-                                get_request_body_example(
-                                    route
-                                )
-                            ),
-                        },
-                        "params": jsonable_encoder(
-                            get_parameters(
-                                route
-                            )
-                        ),
-                        "responses": jsonable_encoder(
-                            get_responses(
-                                route
-                            )
-                        ),
-                    },
-                }
-                for tag in route.tags:
-                    if tag not in folders:
-                        folders[tag] = {"name": tag, "item": []}
-                    folders[tag]["item"].append(item)
+                route_items = built[index] if built else build(route, report)
+                for item in route_items:
+                    if validator:
+                        validator.validate_item(
+                            item,
+                            f"{item['request']['method']} "
+                            f"{prefix}{route.path}"
+                        )
+                    items.append((route.tags, item))
             except Exception as e:
                 logger.error(
                     f"Error processing route {route}: {e}"
                 )
+        return items
+
+    extracted = [extract(source) for source in route_sources(app)]
+
+    folders = {}
+    for items in extracted:
+        for tags, item in items:
+            for tag in tags:
+                if tag not in folders:
+                    folders[tag] = _build_folder(tag, docs_dir)
+                folders[tag]["item"].append(item)
 
     collection["item"] = list(folders.values())
+    if validator:
+        validator.validate_collection(collection)
+    if canonical:
+        canonicalize_collection(collection, input_host)
+    return collection
+
+
+def generate_postman_collection(
+    app: RouteSources,
+    output_file: str = "postman_collection.json",
+    input_name: str = "API Collection",
+    input_host: str = "http://localhost",
+    readme_file: str = "README.md",
+    merge_into: Optional[str] = None,
+    seed: int = 0,
+    slo_ms: Optional[int] = None,
+    tag_slo_ms: Optional[Dict[str, int]] = None,
+    report: Optional[GenerationReport] = None,
+    validator: Optional[CollectionValidator] = None,
+    max_schema_bytes: Optional[int] = None,
+    max_schema_depth: Optional[int] = None,
+    docs_dir: Optional[str] = None,
+    canonical: bool = False,
+    route_timeout: Optional[float] = None,
+    metrics: Optional[GenerationMetrics] = None,
+    iteration_variables: bool = False,
+) -> None:
+    """
+    Generate a Postman collection from a FastAPI app or routers.
+
+    Args:
+        app (RouteSources):
+            The FastAPI app instance, an ``APIRouter``, a
+            ``(router, prefix)`` pair or a list of them.
+        output_file (str):
+            The output file name for the Postman collection.
+        input_name (str):
+            The name of the Postman collection.
+        input_host (str):
+            The host URL for the API.
+        readme_file (str):
+            The path to the README.md file for documentation.
+        merge_into (Optional[str]):
+            Path to a previously generated collection whose
+            hand-edited fields (tests, scripts, saved examples)
+            are carried over onto the regenerated items.
+        seed (int):
+            The seed for synthesised body examples.
+        slo_ms (Optional[int]):
+            The default response time budget, in milliseconds.
+        tag_slo_ms (Optional[Dict[str, int]]):
+            The response time budgets per tag, in milliseconds.
+        report (Optional[GenerationReport]):
+            The report collecting per-route statistics.
+        validator (Optional[CollectionValidator]):
+            The validator checking items against the Postman schema
+            as they are built, or after the merge when merging.
+        max_schema_bytes (Optional[int]):
+            The size budget of each schema and body example, in bytes.
+        max_schema_depth (Optional[int]):
+            The nesting budget of each schema and body example.
+        docs_dir (Optional[str]):
+            The directory of the ``<tag>.md`` folder descriptions.
+        canonical (bool):
+            Whether to sort the collection into its canonical order
+            and stamp item and collection content hashes, after the
+            merge.
+        route_timeout (Optional[float]):
+            The time budget of each route, in seconds. Routes are then
+            extracted in forked workers, and those failing or running
+            over budget are replaced by stub items.
+        metrics (Optional[GenerationMetrics]):
+            The metrics timing the build, merge and write phases and
+            counting the routes, items and output bytes.
+        iteration_variables (bool):
+            Whether the items read their parameters and body from the
+            ``--iterations`` data columns.
+    """
+    with timed_phase(metrics, "build"):
+        collection = build_postman_collection(
+            app,
+            input_name,
+            input_host,
+            readme_file,
+            seed,
+            slo_ms,
+            tag_slo_ms,
+            report,
+            # Merged hand-edited fields are validated with the items
+            # once the merge is done.
+            None if merge_into else validator,
+            max_schema_bytes,
+            max_schema_depth,
+            docs_dir,
+            route_timeout=route_timeout,
+            iteration_variables=iteration_variables,
+        )
+
+    if merge_into:
+        try:
+            with timed_phase(metrics, "merge"):
+                merge_collection(
+                    collection,
+                    merge_into,
+                    input_host
+                )
+        except Exception as e:
+            logger.error(
+                f"Error merging into {merge_into}: {e}"
+            )
+        if validator:
+            validated = set()
+            for _, _, item in walk_collection(collection):
+                if id(item) not in validated:
+                    validated.add(id(item))
+                    validator.validate_item(
+                        item,
+                        route_key(item, input_host)
+                    )
+            validator.validate_collection(collection)
+
+    if canonical:
+        with timed_phase(metrics, "canonical"):
+            canonicalize_collection(collection, input_host)
+    if metrics:
+        metrics.observe_routes(app)
+        metrics.observe_collection(collection)
 
     try:
-        with open(output_file, "w") as f:
-            json.dump(collection, f, indent=4)
+        with timed_phase(metrics, "write"):
+            with open(output_file, "w") as f:
+                json.dump(collection, f, indent=4, default=json_default)
+        if metrics:
+            metrics.observe_output(output_file)
         logger.info(
             f"Postman collection saved to {output_file}"
         )
@@ -125,61 +518,20 @@ def generate_postman_collection(
         )
 
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """
     Main function to parse arguments
     and generate the Postman collection.
-    """
-    import argparse
-
-    parser = argparse.ArgumentParser(
-        description="Generate Postman collection from FastAPI app."
-    )
-    parser.add_argument(
-        "--app",
-        required=True,
-        help="Path to the FastAPI app",
-    )
-    parser.add_argument(
-        "--output",
-        default="postman_collection.json",
-        help="Output file for the Postman collection",
-    )
-    parser.add_argument(
-        "--name",
-        default="API Collection",
-        help="Name of the Postman collection",
-    )
-    parser.add_argument(
-        "--host",
-        default="http://localhost",
-        help="Host URL for the API",
-    )
-    parser.add_argument(
-        "--readme",
-        default="README.md",
-        help="Path to the README.md file for documentation",
-    )
 
-    args = parser.parse_args()
+    Kept for backwards compatibility, see ``fast_man.cli.main``.
 
-    try:
-        app_module, app_var = args.app.split(":")
-        app = getattr(
-            __import__(
-                app_module,
-                fromlist=[app_var]
-            ),
-            app_var
-        )
+    Args:
+        argv (Optional[List[str]]):
+            The command-line arguments, defaults to ``sys.argv[1:]``.
+    """
+    from .cli import main as cli_main
 
-        generate_postman_collection(
-            app, args.output, args.name, args.host, args.readme
-        )
-    except Exception as e:
-        logger.error(
-            f"Error importing FastAPI app from {args.app}: {e}"
-        )
+    cli_main(argv)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,191 @@
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .collection import CollectionEntry, route_key, walk_collection
+from .encoding import json_default
+
+# Key of the content hash of an item, and of the collection in ``info``.
+HASH_KEY = "x-fast-man-hash"
+
+# (folder names, route identity)
+_Slot = Tuple[Tuple[str, ...], str]
+
+
+def item_digest(item: Dict[str, Any]) -> str:
+    """
+    Get a digest of the content of a Postman item, ignoring the
+    content hash written by ``--canonical``.
+
+    Args:
+        item (Dict[str, Any]): The Postman item.
+
+    Returns:
+        str: The hex digest of the canonical JSON of the item.
+    """
+    if HASH_KEY in item:
+        item = {key: value for key, value in item.items() if key != HASH_KEY}
+    return hashlib.sha1(
+        json.dumps(
+            item,
+            sort_keys=True,
+            separators=(",", ":"),
+            default=json_default,
+        ).encode()
+    ).hexdigest()
+
+
+def _pointer(location: Tuple[int, ...]) -> str:
+    return "".join(f"/item/{index}" for index in location)
+
+
+def diff_collections(
+    old_entries: Iterable[CollectionEntry],
+    new_collection: Dict[str, Any],
+    input_host: str = "",
+) -> Dict[str, Any]:
+    """
+    Compare an existing collection with a regenerated one.
+
+    Both sides are indexed by route identity (method + path), so the
+    comparison is linear in the number of items. Only a digest of
+    every old item is kept, which lets ``old_entries`` be streamed
+    straight from disk.
+
+    Args:
+        old_entries (Iterable[CollectionEntry]):
+            The entries of the existing collection.
+        new_collection (Dict[str, Any]):
+            The regenerated collection.
+        input_host (str):
+            The host URL both collections were generated with.
+
+    Returns:
+        Dict[str, Any]:
+            The ``added``, ``removed`` and ``changed`` route identities,
+            and the RFC 6902 ``patch`` turning the old collection into
+            the new one.
+    """
+    old: Dict[_Slot, Tuple[Tuple[int, ...], str]] = {}
+    old_folders: Dict[Tuple[str, ...], Tuple[int, ...]] = {}
+    old_counts: Dict[Tuple[str, ...], int] = {}
+    for folders, location, item in old_entries:
+        slot = (folders, route_key(item, input_host))
+        old.setdefault(slot, (location, item_digest(item)))
+        for size in range(1, len(folders) + 1):
+            old_folders.setdefault(folders[:size], location[:size])
+        old_counts[folders] = old_counts.get(folders, 0) + 1
+
+    new: Dict[_Slot, Dict[str, Any]] = {}
+    for folders, _, item in walk_collection(new_collection):
+        new.setdefault((folders, route_key(item, input_host)), item)
+    new_folders = {folders for folders, _ in new}
+
+    replaced: List[Dict[str, Any]] = []
+    removals: List[Tuple[Tuple[int, ...], Tuple[str, ...]]] = []
+    changed = set()
+    for slot, (location, digest) in old.items():
+        if slot not in new:
+            removals.append((location, slot[0]))
+        elif item_digest(new[slot]) != digest:
+            changed.add(slot[1])
+            replaced.append(
+                {
+                    "op": "replace",
+                    "path": _pointer(location),
+                    "value": new[slot],
+                }
+            )
+
+    removed_counts: Dict[Tuple[str, ...], int] = {}
+    for _, folders in removals:
+        removed_counts[folders] = removed_counts.get(folders, 0) + 1
+    dropped_folders = {
+        folders
+        for folders, count in removed_counts.items()
+        if folders
+        and count == old_counts[folders]
+        and folders not in new_folders
+        and not any(
+            other[:len(folders)] == folders and other != folders
+            for other in old_folders
+        )
+    }
+    removal_paths = {
+        old_folders[folders] if folders in dropped_folders else location
+        for location, folders in removals
+    }
+    dropped_locations = [old_folders[folders] for folders in dropped_folders]
+
+    def _folder_pointer(folders: Tuple[str, ...]) -> str:
+        location = list(old_folders.get(folders, ()))
+        for dropped in dropped_locations:
+            level = len(dropped) - 1
+            if (
+                len(location) > level
+                and tuple(location[:level]) == dropped[:level]
+                and old_folders[folders][level] > dropped[level]
+            ):
+                location[level] -= 1
+        return _pointer(tuple(location)) + "/item/-"
+
+    removed_ops = [
+        {"op": "remove", "path": _pointer(location)}
+        for location in sorted(removal_paths, reverse=True)
+    ]
+
+    added_ops: List[Dict[str, Any]] = []
+    created: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+    for slot, item in new.items():
+        if slot in old:
+            continue
+        folders = slot[0]
+        if folders in old_folders or not folders:
+            added_ops.append(
+                {
+                    "op": "add",
+                    "path": _folder_pointer(folders),
+                    "value": item,
+                }
+            )
+            continue
+        depth = max(
+            size
+            for size in range(len(folders))
+            if size == 0 or folders[:size] in old_folders
+        )
+        root = folders[:depth + 1]
+        if root not in created:
+            created[root] = {"name": root[-1], "item": []}
+            added_ops.append(
+                {
+                    "op": "add",
+                    "path": _folder_pointer(folders[:depth]),
+                    "value": created[root],
+                }
+            )
+        parent = created[root]
+        for size in range(depth + 2, len(folders) + 1):
+            child = next(
+                (
+                    entry
+                    for entry in parent["item"]
+                    if entry.get("name") == folders[size - 1]
+                    and "item" in entry
+                ),
+                None,
+            )
+            if child is None:
+                child = {"name": folders[size - 1], "item": []}
+                parent["item"].append(child)
+            parent = child
+        parent["item"].append(item)
+
+    old_keys = {key for _, key in old}
+    new_keys = {key for _, key in new}
+    return {
+        "added": sorted(new_keys - old_keys),
+        "removed": sorted(old_keys - new_keys),
+        "changed": sorted(changed),
+        "patch": replaced + removed_ops + added_ops,
+    }
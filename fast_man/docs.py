@@ -0,0 +1,74 @@
+import os
+import re
+import threading
+from typing import Dict, Optional, Tuple
+
+# path -> ((mtime_ns, size), text), kept for the life of the process,
+# e.g. across the requests of ``fast-man serve``.
+_docs: Dict[str, Tuple[Tuple[int, int], str]] = {}
+_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def read_doc(path: str) -> Optional[str]:
+    """
+    Read a documentation file, cached by path and modification time.
+
+    Args:
+        path (str): The path to the file.
+
+    Returns:
+        Optional[str]: The file content, or ``None`` if it does not
+        exist.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        cached = _docs.get(path)
+    if cached is not None and cached[0] == version:
+        _cache_stats["hits"] += 1
+        return cached[1]
+    _cache_stats["misses"] += 1
+    with open(path, "rb") as f:
+        text = f.read().decode("utf-8")
+    with _lock:
+        _docs[path] = (version, text)
+    return text
+
+
+def cache_info() -> Dict[str, int]:
+    """
+    Get the hits, misses and size of the documentation cache.
+
+    Returns:
+        Dict[str, int]: The cache statistics.
+    """
+    return dict(_cache_stats, size=len(_docs))
+
+
+def _slug(tag: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", tag.lower()).strip("-")
+
+
+def get_folder_doc(docs_dir: str, tag: str) -> Optional[str]:
+    """
+    Get the documentation of a tag folder from ``<tag>.md`` or
+    ``<slug>.md`` in a docs directory, e.g. ``user-accounts.md`` for
+    the ``User Accounts`` tag.
+
+    Args:
+        docs_dir (str): The docs directory.
+        tag (str): The tag name.
+
+    Returns:
+        Optional[str]: The folder documentation, if any.
+    """
+    for name in dict.fromkeys((tag, _slug(tag))):
+        if name and "/" not in name and os.sep not in name:
+            text = read_doc(os.path.join(docs_dir, f"{name}.md"))
+            if text is not None:
+                return text
+    return None
@@ -0,0 +1,120 @@
+import collections
+import dataclasses
+import datetime
+import decimal
+import enum
+import ipaddress
+import pathlib
+import re
+import types
+import uuid
+from collections.abc import Mapping
+from typing import Any, Callable, Dict
+
+from pydantic import AnyUrl, BaseModel, NameEmail, SecretBytes, SecretStr
+from pydantic.color import Color
+from pydantic_core import PydanticUndefined, Url
+
+_NATIVE = (str, int, float, bool, type(None))
+
+
+def _decimal(value: decimal.Decimal) -> Any:
+    exponent = value.as_tuple().exponent
+    if isinstance(exponent, int) and exponent >= 0:
+        return int(value)
+    return float(value)
+
+
+# Exact-type encoders for the non-JSON values fast-man can produce,
+# covering the types of FastAPI's ``ENCODERS_BY_TYPE``.
+_ENCODERS: Dict[type, Callable[[Any], Any]] = {
+    set: list,
+    frozenset: list,
+    collections.deque: list,
+    types.GeneratorType: list,
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.date: datetime.date.isoformat,
+    datetime.time: datetime.time.isoformat,
+    datetime.timedelta: datetime.timedelta.total_seconds,
+    decimal.Decimal: _decimal,
+    uuid.UUID: str,
+    bytes: lambda value: value.decode(),
+    re.Pattern: lambda value: value.pattern,
+    ipaddress.IPv4Address: str,
+    ipaddress.IPv4Interface: str,
+    ipaddress.IPv4Network: str,
+    ipaddress.IPv6Address: str,
+    ipaddress.IPv6Interface: str,
+    ipaddress.IPv6Network: str,
+    Color: str,
+    NameEmail: str,
+    SecretBytes: str,
+    SecretStr: str,
+    Url: str,
+    AnyUrl: str,
+}
+
+
+def json_default(value: Any) -> Any:
+    """
+    Convert a value ``json`` cannot serialise, for ``default=``.
+
+    Handles the values ``jsonable_encoder`` handles: enums, Pydantic
+    models, ``PydanticUndefined``, the types of ``ENCODERS_BY_TYPE``,
+    dataclasses, mappings and objects with attributes. Anything else
+    is converted with ``str``, so an odd default never drops a route.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        Any: The JSON-compatible value.
+    """
+    encoder = _ENCODERS.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+    if value is PydanticUndefined:
+        return None
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", by_alias=True)
+    if isinstance(value, pathlib.PurePath):
+        return str(value)
+    for kind, encoder in _ENCODERS.items():
+        if isinstance(value, kind):
+            return encoder(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, Mapping):
+        return dict(value)
+    if getattr(value, "__dict__", None) and not isinstance(value, type):
+        return vars(value)
+    return str(value)
+
+
+def encode(value: Any) -> Any:
+    """
+    Convert a value to plain JSON types in a single pass.
+
+    Values that are already JSON types are returned as they are; only
+    containers are copied. Use it for values consumed in memory, and
+    ``json_default`` when the value is serialised anyway.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        Any: The JSON-compatible value.
+    """
+    kind = type(value)
+    if kind in _NATIVE:
+        return value
+    if kind is dict:
+        return {
+            key if type(key) in _NATIVE else encode(key): encode(item)
+            for key, item in value.items()
+        }
+    if kind is list or kind is tuple:
+        return [encode(item) for item in value]
+    return encode(json_default(value))
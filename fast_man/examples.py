@@ -0,0 +1,471 @@
+import datetime
+import decimal
+import enum
+import math
+import random
+import re
+import string
+import threading
+import types
+import typing
+import uuid
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+# Generators take the random source and the current model depth.
+ExampleGenerator = Callable[[random.Random, int], Any]
+
+MAX_DEPTH = 4
+
+_CONSTRAINTS = (
+    "gt",
+    "ge",
+    "lt",
+    "le",
+    "multiple_of",
+    "min_length",
+    "max_length",
+    "pattern",
+)
+# Characters that negated and wildcard pattern classes pick from.
+_PATTERN_ALPHABET = string.ascii_letters + string.digits + "-_"
+# Extra repetitions generated for open-ended quantifiers such as ``+``.
+_PATTERN_REPEAT = 3
+# Draws of a pattern value before falling back to the length bounds.
+_PATTERN_ATTEMPTS = 20
+_BASE_DATETIME = datetime.datetime(2024, 1, 1, 12, 0, 0)
+
+_model_generators: Dict[Type[BaseModel], ExampleGenerator] = {}
+_compiling: Dict[Type[BaseModel], ExampleGenerator] = {}
+_lock = threading.RLock()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _constraints(metadata: Any) -> Dict[str, Any]:
+    constraints: Dict[str, Any] = {}
+    for meta in metadata or ():
+        for name in _CONSTRAINTS:
+            value = getattr(meta, name, None)
+            if value is not None:
+                constraints[name] = value
+    return constraints
+
+
+def _bounds(
+    constraints: Dict[str, Any],
+    default_low: float,
+) -> Tuple[float, float]:
+    # Fields with only an upper bound get a range below it.
+    low = constraints.get("ge", constraints.get("gt"))
+    high = constraints.get("le", constraints.get("lt"))
+    if low is None:
+        low = default_low if high is None else min(default_low, high - 100)
+    if high is None:
+        high = low + 100
+    return low, max(low, high)
+
+
+def _int_generator(constraints: Dict[str, Any]) -> ExampleGenerator:
+    low, high = _bounds(constraints, 0)
+    # Without ``ge``/``le`` the bounds are exclusive.
+    low = math.ceil(low) if "ge" in constraints else math.floor(low) + 1
+    high = math.floor(high) if "le" in constraints else math.ceil(high) - 1
+    high = max(low, high)
+    step = max(1, int(constraints.get("multiple_of") or 1))
+    # The multiples of ``step`` in range, as ``first + k * step``.
+    first = -(-low // step) * step
+    count = (high - first) // step + 1 if first <= high else 0
+
+    def generate(rng: random.Random, depth: int) -> int:
+        if step > 1 and count > 0:
+            return first + rng.randrange(count) * step
+        return rng.randint(low, high)
+
+    return generate
+
+
+def _float_generator(constraints: Dict[str, Any]) -> ExampleGenerator:
+    low, high = _bounds(constraints, 0.0)
+    low, high = float(low), float(high)
+    exclusive_low = "ge" not in constraints and "gt" in constraints
+    exclusive_high = "le" not in constraints and "lt" in constraints
+    step = float(constraints.get("multiple_of") or 0)
+
+    def valid(value: float) -> bool:
+        return (
+            (value > low if exclusive_low else value >= low)
+            and (value < high if exclusive_high else value <= high)
+        )
+
+    multiples = range(0)
+    if step > 0:
+        first = math.ceil(low / step)
+        if not valid(first * step):
+            first += 1
+        last = math.floor(high / step)
+        if not valid(last * step):
+            last -= 1
+        multiples = range(first, last + 1)
+
+    def generate(rng: random.Random, depth: int) -> float:
+        if multiples:
+            return rng.choice(multiples) * step
+        value = rng.uniform(low, high)
+        # Round for readability, unless it crosses a bound.
+        for candidate in (round(value, 2), value, (low + high) / 2):
+            if valid(candidate):
+                return candidate
+        return value
+
+    return generate
+
+
+_CATEGORIES = {
+    sre_parse.CATEGORY_DIGIT: r"\d",
+    sre_parse.CATEGORY_NOT_DIGIT: r"\D",
+    sre_parse.CATEGORY_WORD: r"\w",
+    sre_parse.CATEGORY_NOT_WORD: r"\W",
+    sre_parse.CATEGORY_SPACE: r"\s",
+    sre_parse.CATEGORY_NOT_SPACE: r"\S",
+}
+
+
+def _chars(items: Any) -> str:
+    chars = set()
+    for op, av in items:
+        if op == sre_parse.LITERAL:
+            chars.add(chr(av))
+        elif op == sre_parse.RANGE:
+            chars.update(chr(code) for code in range(av[0], av[1] + 1))
+        elif op == sre_parse.CATEGORY:
+            chars.update(
+                char for char in _PATTERN_ALPHABET + " "
+                if re.fullmatch(_CATEGORIES[av], char)
+            )
+        else:
+            raise ValueError(f"unsupported class item {op}")
+    return "".join(sorted(chars))
+
+
+def _pattern_generator(tokens: Any) -> Callable[[random.Random], str]:
+    parts = []
+    for op, av in tokens:
+        if op == sre_parse.LITERAL:
+            char = chr(av)
+            parts.append(lambda rng, char=char: char)
+        elif op in (sre_parse.NOT_LITERAL, sre_parse.ANY, sre_parse.IN):
+            if op == sre_parse.IN:
+                negate = bool(av) and av[0][0] == sre_parse.NEGATE
+                chars = _chars(av[1:] if negate else av)
+            else:
+                negate = op == sre_parse.NOT_LITERAL
+                chars = chr(av) if negate else ""
+            if negate or op == sre_parse.ANY:
+                chars = "".join(
+                    char for char in _PATTERN_ALPHABET if char not in chars
+                )
+            if not chars:
+                raise ValueError("empty character class")
+            parts.append(lambda rng, chars=chars: rng.choice(chars))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            low, high, sub = av
+            high = min(high, low + _PATTERN_REPEAT)
+            item = _pattern_generator(sub)
+            parts.append(
+                lambda rng, low=low, high=high, item=item: "".join(
+                    item(rng) for _ in range(rng.randint(low, high))
+                )
+            )
+        elif op == sre_parse.SUBPATTERN:
+            parts.append(_pattern_generator(av[-1]))
+        elif op == sre_parse.BRANCH:
+            branches = [_pattern_generator(branch) for branch in av[1]]
+            parts.append(
+                lambda rng, branches=branches: rng.choice(branches)(rng)
+            )
+        elif op != sre_parse.AT:
+            raise ValueError(f"unsupported pattern element {op}")
+    return lambda rng: "".join(part(rng) for part in parts)
+
+
+def _str_pattern_generator(pattern: str) -> Optional[ExampleGenerator]:
+    # Patterns the generator cannot follow (lookarounds,
+    # backreferences...) get no generator.
+    try:
+        generate = _pattern_generator(sre_parse.parse(pattern))
+        if not re.search(pattern, generate(random.Random(0))):
+            return None
+    except (re.error, ValueError, KeyError):
+        return None
+    return lambda rng, depth: generate(rng)
+
+
+def _str_generator(constraints: Dict[str, Any]) -> ExampleGenerator:
+    low = int(constraints.get("min_length") or 1)
+    high = max(low, int(constraints.get("max_length") or max(low, 8)))
+    length = min(max(low, 8), high)
+
+    def generate(rng: random.Random, depth: int) -> str:
+        return "".join(
+            rng.choice(string.ascii_lowercase) for _ in range(length)
+        )
+
+    if not constraints.get("pattern"):
+        return generate
+    pattern = _str_pattern_generator(str(constraints["pattern"]))
+    if pattern is None:
+        return generate
+    min_length = constraints.get("min_length") or 0
+    max_length = constraints.get("max_length")
+
+    def generate_pattern(rng: random.Random, depth: int) -> str:
+        # Pattern values outside the length bounds are drawn again,
+        # then left to the length-based generator.
+        for _ in range(_PATTERN_ATTEMPTS):
+            value = pattern(rng, depth)
+            if min_length <= len(value) and (
+                max_length is None or len(value) <= max_length
+            ):
+                return value
+        return generate(rng, depth)
+
+    return generate_pattern
+
+
+def _list_generator(
+    item: ExampleGenerator,
+    constraints: Dict[str, Any],
+) -> ExampleGenerator:
+    size = max(1, int(constraints.get("min_length") or 1))
+    if constraints.get("max_length") is not None:
+        size = min(size, int(constraints["max_length"]))
+
+    def generate(rng: random.Random, depth: int) -> list:
+        if depth >= MAX_DEPTH:
+            return []
+        return [item(rng, depth) for _ in range(size)]
+
+    return generate
+
+
+def _scalar_generator(
+    annotation: Any,
+    constraints: Dict[str, Any],
+) -> Optional[ExampleGenerator]:
+    if annotation is bool:
+        return lambda rng, depth: rng.random() < 0.5
+    if annotation is int:
+        return _int_generator(constraints)
+    if annotation in (float, decimal.Decimal):
+        return _float_generator(constraints)
+    if annotation in (str, bytes):
+        return _str_generator(constraints)
+    if annotation is datetime.datetime:
+        return lambda rng, depth: (
+            _BASE_DATETIME + datetime.timedelta(minutes=rng.randint(0, 100000))
+        ).isoformat()
+    if annotation is datetime.date:
+        return lambda rng, depth: (
+            _BASE_DATETIME.date()
+            + datetime.timedelta(days=rng.randint(0, 365))
+        ).isoformat()
+    if annotation is datetime.time:
+        return lambda rng, depth: datetime.time(
+            rng.randint(0, 23), rng.randint(0, 59)
+        ).isoformat()
+    if annotation is datetime.timedelta:
+        return lambda rng, depth: float(rng.randint(1, 3600))
+    if annotation is uuid.UUID:
+        return lambda rng, depth: str(uuid.UUID(int=rng.getrandbits(128)))
+    name = getattr(annotation, "__name__", "")
+    if name in ("EmailStr", "NameEmail"):
+        return lambda rng, depth: f"user{rng.randint(1, 999)}@example.com"
+    if "Url" in name or "Dsn" in name:
+        return lambda rng, depth: "https://example.com"
+    if isinstance(annotation, type) and issubclass(annotation, str):
+        return _str_generator(constraints)
+    return None
+
+
+def compile_type_example(
+    annotation: Any,
+    metadata: Any = (),
+) -> ExampleGenerator:
+    """
+    Compile an example generator for a type annotation.
+
+    Args:
+        annotation (Any): The type annotation.
+        metadata (Any): The constraints attached to the annotation.
+
+    Returns:
+        ExampleGenerator: The example generator.
+    """
+    constraints = _constraints(metadata)
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is typing.Annotated:
+        return compile_type_example(
+            args[0],
+            list(metadata or ()) + list(annotation.__metadata__),
+        )
+    if origin in (typing.Union, types.UnionType):
+        choices = [
+            compile_type_example(arg, metadata)
+            for arg in args
+            if arg is not type(None)
+        ]
+        if not choices:
+            return lambda rng, depth: None
+        if len(choices) == 1:
+            return choices[0]
+        return lambda rng, depth: rng.choice(choices)(rng, depth)
+    if origin is typing.Literal:
+        return lambda rng, depth: rng.choice(args)
+    if origin in (list, set, frozenset) or annotation in (list, set):
+        return _list_generator(
+            compile_type_example(args[0] if args else str),
+            constraints,
+        )
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return _list_generator(
+                compile_type_example(args[0]), constraints
+            )
+        items = [compile_type_example(arg) for arg in args]
+        return lambda rng, depth: [item(rng, depth) for item in items]
+    if origin is dict or annotation is dict:
+        value = compile_type_example(args[1] if len(args) == 2 else str)
+        return lambda rng, depth: (
+            {} if depth >= MAX_DEPTH else {"key": value(rng, depth)}
+        )
+    if origin is not None:
+        collection = getattr(origin, "__name__", "")
+        if collection in ("Sequence", "MutableSequence", "Iterable"):
+            return compile_type_example(typing.List[args[0]], metadata)
+        if collection in ("Mapping", "MutableMapping"):
+            return compile_type_example(typing.Dict[args], metadata)
+    if isinstance(annotation, type):
+        if issubclass(annotation, enum.Enum):
+            values = [member.value for member in annotation]
+            return lambda rng, depth: rng.choice(values)
+        if issubclass(annotation, BaseModel):
+            return compile_model_example(annotation)
+    scalar = _scalar_generator(annotation, constraints)
+    if scalar is not None:
+        return scalar
+    return lambda rng, depth: "string"
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", by_alias=True)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return value
+
+
+def compile_field_example(field: FieldInfo) -> ExampleGenerator:
+    """
+    Compile an example generator for a model field.
+
+    Field examples win over defaults, and defaults over values
+    synthesised from the annotation and its constraints.
+
+    Args:
+        field (FieldInfo): The model field.
+
+    Returns:
+        ExampleGenerator: The example generator.
+    """
+    if field.examples:
+        example = _default(field.examples[0])
+        return lambda rng, depth: example
+    if field.default is not PydanticUndefined and field.default is not None:
+        default = _default(field.default)
+        return lambda rng, depth: default
+    return compile_type_example(field.annotation, field.metadata)
+
+
+def compile_model_example(model: Type[BaseModel]) -> ExampleGenerator:
+    """
+    Compile, once per model class, an example generator for a model.
+
+    Args:
+        model (Type[BaseModel]): The Pydantic model class.
+
+    Returns:
+        ExampleGenerator: The cached example generator.
+    """
+    generator = _model_generators.get(model)
+    if generator is not None:
+        _cache_stats["hits"] += 1
+        return generator
+    with _lock:
+        _cache_stats["misses"] += 1
+        return _compile_model_example(model)
+
+
+def cache_info() -> Dict[str, int]:
+    """
+    Get the hits, misses and size of the model generator cache.
+
+    Returns:
+        Dict[str, int]: The cache statistics.
+    """
+    return dict(_cache_stats, size=len(_model_generators))
+
+
+def _compile_model_example(model: Type[BaseModel]) -> ExampleGenerator:
+    if model in _model_generators:
+        return _model_generators[model]
+    if model in _compiling:
+        return _compiling[model]
+
+    def reference(rng: random.Random, depth: int) -> Any:
+        if depth >= MAX_DEPTH:
+            return None
+        return _model_generators[model](rng, depth)
+
+    _compiling[model] = reference
+    try:
+        fields = [
+            (
+                field.alias or name,
+                compile_field_example(field),
+            )
+            for name, field in model.model_fields.items()
+        ]
+    finally:
+        del _compiling[model]
+
+    def generate(rng: random.Random, depth: int) -> Dict[str, Any]:
+        return {name: field(rng, depth + 1) for name, field in fields}
+
+    _model_generators[model] = generate
+    return generate
+
+
+def model_example(model: Type[BaseModel], seed: int = 0) -> Dict[str, Any]:
+    """
+    Generate a deterministic example for a model.
+
+    Args:
+        model (Type[BaseModel]): The Pydantic model class.
+        seed (int): The seed of the random source.
+
+    Returns:
+        Dict[str, Any]: The example.
+    """
+    return compile_model_example(model)(random.Random(seed), 0)
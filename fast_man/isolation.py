@@ -0,0 +1,219 @@
+import json
+import logging
+import multiprocessing
+import time
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi.routing import APIRoute
+
+from .encoding import json_default
+from .report import GenerationReport
+
+logger = logging.getLogger(__name__)
+
+# Key of the reason a stub item replaces the item of a route.
+STUB_KEY = "x-fast-man-stub"
+
+# (succeeded, result or failure reason)
+IsolatedResult = Tuple[bool, Any]
+
+
+def isolation_supported() -> bool:
+    """
+    Check whether tasks can run in forked worker processes.
+
+    Returns:
+        bool: Whether the ``fork`` start method is available.
+    """
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _run_child(task: Callable[[], Any], sender: Connection) -> None:
+    try:
+        payload = {"result": task()}
+    except BaseException as e:
+        payload = {"error": f"failed: {type(e).__name__}: {e}"}
+    sender.send_bytes(json.dumps(payload, default=json_default).encode())
+    sender.close()
+
+
+def run_isolated(
+    tasks: List[Callable[[], Any]],
+    timeout: float,
+    workers: int = 1,
+) -> List[IsolatedResult]:
+    """
+    Run every task in its own forked process, at most ``workers`` at
+    a time, killing the tasks that run over their time budget.
+
+    Tasks see the memory of the parent as it was when they were
+    forked, and return their result as JSON.
+
+    Args:
+        tasks (List[Callable[[], Any]]): The tasks to run.
+        timeout (float): The time budget of each task, in seconds.
+        workers (int): The maximum number of concurrent processes.
+
+    Returns:
+        List[IsolatedResult]: For each task, whether it succeeded and
+        its result, or why it failed.
+    """
+    context = multiprocessing.get_context("fork")
+    results: List[IsolatedResult] = [(False, "not run")] * len(tasks)
+    pending = list(enumerate(tasks))[::-1]
+    running: Dict[Connection, Tuple[int, Any, float]] = {}
+
+    while pending or running:
+        while pending and len(running) < max(1, workers):
+            index, task = pending.pop()
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=_run_child,
+                args=(task, sender),
+                daemon=True,
+            )
+            process.start()
+            sender.close()
+            running[receiver] = (index, process, time.monotonic() + timeout)
+
+        next_deadline = min(deadline for _, _, deadline in running.values())
+        for receiver in wait(
+            list(running),
+            timeout=max(0.0, next_deadline - time.monotonic()),
+        ):
+            index, process, _ = running.pop(receiver)
+            try:
+                payload = json.loads(receiver.recv_bytes())
+            except EOFError:
+                process.join()
+                payload = {
+                    "error": f"worker exited with code {process.exitcode}"
+                }
+            receiver.close()
+            process.join()
+            results[index] = (
+                "result" in payload,
+                payload.get("result", payload.get("error")),
+            )
+
+        now = time.monotonic()
+        for receiver, (index, process, deadline) in list(running.items()):
+            if deadline <= now:
+                process.kill()
+                process.join()
+                receiver.close()
+                del running[receiver]
+                results[index] = (
+                    False,
+                    f"exceeded the {timeout:g} s time budget",
+                )
+    return results
+
+
+def stub_item(
+    route: APIRoute,
+    reason: str,
+    input_host: str = "http://localhost",
+    prefix: str = "",
+    method: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build the placeholder item of a route whose extraction failed or
+    ran over budget.
+
+    Args:
+        route (APIRoute): The route.
+        reason (str): Why the route was not extracted.
+        input_host (str): The host URL for the API.
+        prefix (str): The prefix the route's router is included under.
+        method (Optional[str]): The method of the item, the first
+            method of the route by default.
+
+    Returns:
+        Dict[str, Any]: The stub Postman item.
+    """
+    return {
+        "name": route.name,
+        "request": {
+            "url": f"{input_host}{prefix}{route.path}",
+            "method": method or sorted(route.methods)[0],
+            "description": f"fast-man: extraction {reason}",
+            "header": [],
+            "body": {"mode": "raw", "raw": {}},
+            "params": [],
+            "responses": {},
+        },
+        STUB_KEY: reason,
+    }
+
+
+def build_isolated_items(
+    routes: List[APIRoute],
+    build: Callable[
+        [APIRoute, Optional[GenerationReport]], List[Dict[str, Any]]
+    ],
+    timeout: float,
+    input_host: str = "http://localhost",
+    prefix: str = "",
+    report: Optional[GenerationReport] = None,
+    workers: int = 1,
+) -> List[List[Dict[str, Any]]]:
+    """
+    Build the items of routes in isolated workers with a time budget,
+    replacing the routes that fail or run over budget by a stub item
+    per method.
+
+    Args:
+        routes (List[APIRoute]):
+            The routes to build the items of.
+        build (Callable[..., List[Dict[str, Any]]]):
+            Builds the items of a route, given the report to fill.
+        timeout (float):
+            The time budget of each route, in seconds.
+        input_host (str):
+            The host URL for the API.
+        prefix (str):
+            The prefix the routes' router is included under.
+        report (Optional[GenerationReport]):
+            The report collecting per-route statistics and stubs.
+        workers (int):
+            The maximum number of concurrent worker processes.
+
+    Returns:
+        List[List[Dict[str, Any]]]: The items of each route, in route
+        order.
+    """
+
+    def task(route: APIRoute) -> Callable[[], Any]:
+        def run() -> Any:
+            child_report = GenerationReport() if report is not None else None
+            items = build(route, child_report)
+            return {
+                "items": items,
+                "report": child_report.to_dict() if child_report else None,
+            }
+
+        return run
+
+    items = []
+    results = run_isolated([task(route) for route in routes], timeout, workers)
+    for route, (succeeded, result) in zip(routes, results):
+        if succeeded:
+            items.append(result["items"])
+            if report is not None and result["report"]:
+                report.merge(result["report"])
+            continue
+        stubs = []
+        for method in sorted(route.methods):
+            key = f"{method} {prefix}{route.path}"
+            logger.error(
+                f"Route {key} {result}, replaced with a stub item"
+            )
+            if report is not None:
+                report.add_stub(key, result)
+            stubs.append(
+                stub_item(route, result, input_host, prefix, method)
+            )
+        items.append(stubs)
+    return items
@@ -0,0 +1,209 @@
+import csv
+import json
+import logging
+import os
+import random
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+from .examples import (
+    ExampleGenerator,
+    compile_model_example,
+    compile_type_example,
+)
+from .routes import RouteSources, iter_routes
+
+logger = logging.getLogger(__name__)
+
+# Row generators take the random source and return one data row.
+RowGenerator = Callable[[random.Random], Dict[str, Any]]
+
+
+def _cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (bool, dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def _body_model(route: APIRoute) -> Optional[Type[BaseModel]]:
+    body_field = route.body_field
+    if (
+        body_field
+        and isinstance(body_field.type_, type)
+        and issubclass(body_field.type_, BaseModel)
+    ):
+        return body_field.type_
+    return None
+
+
+def compile_route_rows(route: APIRoute) -> Tuple[List[str], RowGenerator]:
+    """
+    Compile, once per route, a generator of iteration data rows.
+
+    Every path and query parameter gets a column with a value
+    generator built from its type; routes with a model body also get
+    a ``body`` column, holding the body as a JSON string.
+
+    Args:
+        route (APIRoute): The route to compile the row generator for.
+
+    Returns:
+        Tuple[List[str], RowGenerator]: The columns and the generator.
+    """
+    generators: List[Tuple[str, ExampleGenerator]] = [
+        (
+            param.name,
+            compile_type_example(
+                param.field_info.annotation,
+                param.field_info.metadata,
+            ),
+        )
+        for param in (
+            route.dependant.path_params + route.dependant.query_params
+        )
+    ]
+    model = _body_model(route)
+    if model is not None:
+        body = compile_model_example(model)
+        generators.append(
+            ("body", lambda rng, depth: json.dumps(body(rng, depth)))
+        )
+
+    def generate(rng: random.Random) -> Dict[str, Any]:
+        return {name: value(rng, 0) for name, value in generators}
+
+    return [name for name, _ in generators], generate
+
+
+def apply_iteration_variables(
+    route: APIRoute,
+    item: Dict[str, Any],
+) -> None:
+    """
+    Make an item read its parameters and body from the iteration data
+    columns of its route, as ``{{column}}`` variables, in place.
+
+    Path placeholders become variables, every query parameter is added
+    to the URL and the raw body is replaced by ``{{body}}``, so a
+    ``newman run --folder <item> -d <data file>`` run sends one request
+    per row.
+
+    Args:
+        route (APIRoute): The route the item was built for.
+        item (Dict[str, Any]): The Postman item.
+    """
+    request = item["request"]
+    url = request["url"]
+    for param in route.dependant.path_params:
+        url = url.replace(f"{{{param.alias}}}", f"{{{{{param.name}}}}}")
+    query = "&".join(
+        f"{param.alias}={{{{{param.name}}}}}"
+        for param in route.dependant.query_params
+    )
+    request["url"] = f"{url}?{query}" if query else url
+    if _body_model(route) is not None:
+        request["body"] = {
+            "mode": "raw",
+            "raw": "{{body}}",
+            "options": {"raw": {"language": "json"}},
+        }
+
+
+def write_iteration_data(
+    route: APIRoute,
+    output_file: str,
+    iterations: int,
+    file_format: str = "csv",
+    seed: int = 0,
+) -> None:
+    """
+    Stream iteration data rows for a route straight to disk.
+
+    Rows are written one at a time and never held in memory.
+
+    Args:
+        route (APIRoute):
+            The route to write iteration data for.
+        output_file (str):
+            The output file for the iteration data.
+        iterations (int):
+            The number of rows to write.
+        file_format (str):
+            Either ``csv`` or ``json``.
+        seed (int):
+            The seed of the random source.
+    """
+    columns, generate = compile_route_rows(route)
+    rng = random.Random(f"{seed}:{route.path}")
+    with open(output_file, "w", newline="") as f:
+        if file_format == "csv":
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for _ in range(iterations):
+                row = generate(rng)
+                writer.writerow([_cell(row[column]) for column in columns])
+        else:
+            f.write("[")
+            for index in range(iterations):
+                f.write(",\n" if index else "\n")
+                f.write(json.dumps(generate(rng)))
+            f.write("\n]\n")
+
+
+def write_iterations(
+    app: RouteSources,
+    output_dir: str,
+    iterations: int,
+    file_format: str = "csv",
+    seed: int = 0,
+) -> List[str]:
+    """
+    Write a Postman/Newman iteration data file for every route.
+
+    Args:
+        app (RouteSources):
+            The FastAPI app instance, routers or a list of them.
+        output_dir (str):
+            The directory for the iteration data files.
+        iterations (int):
+            The number of rows per route.
+        file_format (str):
+            Either ``csv`` or ``json``.
+        seed (int):
+            The seed of the random source.
+
+    Returns:
+        List[str]: The written files.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    written: List[str] = []
+    for _, route in iter_routes(app):
+        name = route.name
+        output_file = os.path.join(output_dir, f"{name}.{file_format}")
+        suffix = 2
+        while output_file in written:
+            output_file = os.path.join(
+                output_dir, f"{name}_{suffix}.{file_format}"
+            )
+            suffix += 1
+        try:
+            write_iteration_data(
+                route,
+                output_file,
+                iterations,
+                file_format,
+                seed,
+            )
+            written.append(output_file)
+        except Exception as e:
+            logger.error(
+                f"Error writing iteration data for {route}: {e}"
+            )
+    logger.info(
+        f"Iteration data for {len(written)} routes saved to {output_dir}"
+    )
+    return written
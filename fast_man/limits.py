@@ -0,0 +1,109 @@
+import json
+from typing import Any, Optional, Tuple
+
+from .encoding import json_default
+
+# Key of the marker replacing the parts of a schema cut by a budget.
+TRUNCATED_KEY = "x-fast-man-truncated"
+
+_SUMMARY_KEYS = ("title", "type", "description")
+
+
+def json_size(value: Any, limit: Optional[int] = None) -> int:
+    """
+    Get the size of the compact JSON encoding of a value without
+    building it, stopping early once a limit is exceeded.
+
+    Args:
+        value (Any): The value to measure.
+        limit (Optional[int]): The size to stop at, in bytes.
+
+    Returns:
+        int: The size in bytes, or a size above ``limit``.
+    """
+    size = 0
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            size += 2 + max(2 * len(value) - 1, 0)
+            for key, item in value.items():
+                size += len(json.dumps(str(key)).encode())
+                stack.append(item)
+        elif isinstance(value, (list, tuple)):
+            size += 2 + max(len(value) - 1, 0)
+            stack.extend(value)
+        else:
+            size += len(
+                json.dumps(value, default=json_default).encode()
+            )
+        if limit is not None and size > limit:
+            break
+    return size
+
+
+def _exceeds_depth(value: Any, remaining: int) -> bool:
+    if isinstance(value, dict):
+        value = list(value.values())
+    elif not isinstance(value, (list, tuple)):
+        return False
+    if remaining <= 0:
+        return True
+    return any(_exceeds_depth(item, remaining - 1) for item in value)
+
+
+def _cut_depth(value: Any, remaining: int, marker: Any) -> Any:
+    if not isinstance(value, (dict, list, tuple)):
+        return value
+    if remaining <= 0:
+        return dict(marker)
+    if isinstance(value, dict):
+        return {
+            key: _cut_depth(item, remaining - 1, marker)
+            for key, item in value.items()
+        }
+    return [_cut_depth(item, remaining - 1, marker) for item in value]
+
+
+def limit_schema(
+    schema: Any,
+    max_bytes: Optional[int] = None,
+    max_depth: Optional[int] = None,
+) -> Tuple[Any, Optional[str]]:
+    """
+    Truncate a schema or example exceeding a depth or size budget.
+
+    Objects and arrays nested deeper than ``max_depth`` are replaced by
+    a marker; a schema still larger than ``max_bytes`` is summarised
+    to its title, type and description next to a marker.
+
+    Args:
+        schema (Any): The schema or example.
+        max_bytes (Optional[int]): The size budget, in bytes.
+        max_depth (Optional[int]): The nesting budget.
+
+    Returns:
+        Tuple[Any, Optional[str]]: The schema within the budgets and
+        why it was cut, or ``None`` if it was kept as is.
+    """
+    reasons = []
+    if max_depth is not None and _exceeds_depth(schema, max_depth):
+        schema = _cut_depth(
+            schema,
+            max_depth,
+            {TRUNCATED_KEY: f"nested deeper than {max_depth}"},
+        )
+        reasons.append(f"depth > {max_depth}")
+    if max_bytes is not None:
+        size = json_size(schema, max_bytes)
+        if size > max_bytes:
+            summary = {
+                key: schema[key]
+                for key in _SUMMARY_KEYS
+                if isinstance(schema, dict)
+                and isinstance(schema.get(key), str)
+            }
+            summary[TRUNCATED_KEY] = f"larger than {max_bytes} bytes"
+            schema = summary
+            reasons.append(f"size > {max_bytes} bytes")
+    return schema, ", ".join(reasons) or None
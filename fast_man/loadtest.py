@@ -0,0 +1,304 @@
+import json
+import keyword
+import logging
+import pprint
+import re
+from typing import Any, Dict, List, Optional
+
+from .collection import route_key
+from .encoding import json_default
+from .smoke import build_request
+
+logger = logging.getLogger(__name__)
+
+# Default output file of each load test format.
+LOAD_TEST_OUTPUTS = {
+    "locust": "locustfile.py",
+    "k6": "k6_script.js",
+}
+
+_AUTHORIZATION = "Bearer {{access_token}}"
+
+_LOCUST_HEADER = '''"""
+Locust load test generated by fast-man.
+
+Run with ``locust -f {output}``. Postman variables in headers, such as
+``{{{{access_token}}}}``, are read from the upper-cased environment
+variables (``ACCESS_TOKEN``).
+"""
+import os
+import random
+import re
+
+from locust import HttpUser, task
+
+_VARIABLE = re.compile(r"\\{{\\{{([^}}]+)\\}}\\}}")
+
+
+def resolve(value):
+    return _VARIABLE.sub(
+        lambda match: os.environ.get(match.group(1).upper(), ""),
+        value,
+    )
+
+
+class FolderUser(HttpUser):
+    abstract = True
+    host = os.environ.get("BASE_URL", {host!r})
+    requests = []
+
+    @task
+    def send(self):
+        request = random.choice(self.requests)
+        self.client.request(
+            request["method"],
+            request["url"],
+            name=request["name"],
+            params=request["params"],
+            headers={{
+                key: resolve(value)
+                for key, value in request["headers"].items()
+            }},
+            json=request["json"],
+        )
+'''
+
+_K6_SCRIPT = '''// k6 load test generated by fast-man.
+//
+// Run with `k6 run {output}`. Postman variables in headers, such as
+// {{{{access_token}}}}, are read from the upper-cased environment
+// variables (ACCESS_TOKEN).
+import http from "k6/http";
+import {{ check }} from "k6";
+
+const BASE_URL = __ENV.BASE_URL || {host};
+
+const FOLDERS = {folders};
+
+const TOTAL_WEIGHT = FOLDERS.reduce(
+    (total, folder) => total + folder.weight,
+    0,
+);
+
+function resolve(value) {{
+    return value.replace(
+        /\\{{\\{{([^}}]+)\\}}\\}}/g,
+        (_, name) => __ENV[name.toUpperCase()] || "",
+    );
+}}
+
+function pickFolder() {{
+    let pick = Math.random() * TOTAL_WEIGHT;
+    for (const folder of FOLDERS) {{
+        pick -= folder.weight;
+        if (pick < 0) {{
+            return folder;
+        }}
+    }}
+    return FOLDERS[FOLDERS.length - 1];
+}}
+
+export default function () {{
+    const folder = pickFolder();
+    const requests = folder.requests;
+    const request = requests[Math.floor(Math.random() * requests.length)];
+    const query = Object.entries(request.params)
+        .map(([key, value]) => (
+            `${{encodeURIComponent(key)}}=${{encodeURIComponent(value)}}`
+        ))
+        .join("&");
+    const headers = {{}};
+    for (const [key, value] of Object.entries(request.headers)) {{
+        headers[key] = resolve(value);
+    }}
+    if (request.json !== null) {{
+        headers["Content-Type"] = "application/json";
+    }}
+    const response = http.request(
+        request.method,
+        BASE_URL + request.url + (query ? `?${{query}}` : ""),
+        request.json === null ? null : JSON.stringify(request.json),
+        {{
+            headers: headers,
+            tags: {{ name: request.name, folder: folder.name }},
+        }},
+    );
+    check(response, {{
+        "status is 2xx": (r) => r.status >= 200 && r.status < 300,
+    }});
+}}
+'''
+
+
+def extract_load_requests(
+    collection: Dict[str, Any],
+    input_host: str = "",
+    tag_weights: Optional[Dict[str, int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Get the requests of every tag folder of a generated collection,
+    ready to be replayed by a load test.
+
+    Path parameters are filled like the smoke test does; header values
+    keep their Postman variables, to be resolved when the test runs.
+    Every request carries the collection bearer token header.
+
+    Args:
+        collection (Dict[str, Any]):
+            The generated Postman collection.
+        input_host (str):
+            The host URL the collection was generated with.
+        tag_weights (Optional[Dict[str, int]]):
+            The weight of each tag folder, its number of requests by
+            default.
+
+    Returns:
+        List[Dict[str, Any]]: The folder names, weights and requests.
+    """
+    folders = []
+    for folder in collection.get("item", []):
+        requests = []
+        for item in folder.get("item", []):
+            if "request" not in item:
+                continue
+            arguments = build_request(item, input_host)
+            headers = {"Authorization": _AUTHORIZATION}
+            for header in item["request"].get("header") or []:
+                headers[header["key"]] = header.get("value", "")
+            requests.append(
+                {
+                    "name": route_key(item, input_host),
+                    "method": arguments["method"],
+                    "url": arguments["url"],
+                    "params": {
+                        key: str(value).lower()
+                        if isinstance(value, bool)
+                        else str(value)
+                        for key, value in arguments["params"].items()
+                    },
+                    "headers": headers,
+                    "json": arguments["json"],
+                }
+            )
+        if requests:
+            name = folder.get("name", "")
+            folders.append(
+                {
+                    "name": name,
+                    "weight": (tag_weights or {}).get(name, len(requests)),
+                    "requests": requests,
+                }
+            )
+    return folders
+
+
+def _class_name(name: str, taken: List[str]) -> str:
+    words = re.findall(r"[A-Za-z0-9]+", name)
+    base = "".join(word[:1].upper() + word[1:] for word in words) or "Folder"
+    if base[0].isdigit() or keyword.iskeyword(base):
+        base = f"Folder{base}"
+    base = f"{base}User"
+    class_name = base
+    suffix = 2
+    while class_name in taken:
+        class_name = f"{base}{suffix}"
+        suffix += 1
+    taken.append(class_name)
+    return class_name
+
+
+def render_locust(
+    folders: List[Dict[str, Any]],
+    input_host: str = "http://localhost",
+    output: str = "locustfile.py",
+) -> str:
+    """
+    Render a Locust load test with one weighted user class per tag.
+
+    Args:
+        folders (List[Dict[str, Any]]): The folders to load test.
+        input_host (str): The default host URL for the API.
+        output (str): The output file, for the usage note.
+
+    Returns:
+        str: The Python source of the locustfile.
+    """
+    lines = [_LOCUST_HEADER.format(host=input_host, output=output)]
+    taken: List[str] = []
+    for folder in folders:
+        lines.extend(
+            [
+                "",
+                f"class {_class_name(folder['name'], taken)}(FolderUser):",
+                f"    # Tag: {folder['name']!r}",
+                f"    weight = {folder['weight']}",
+                "    requests = [",
+            ]
+        )
+        for request in folder["requests"]:
+            source = pprint.pformat(request, width=68, sort_dicts=False)
+            lines.append(
+                "        " + source.replace("\n", "\n        ") + ","
+            )
+        lines.extend(["    ]", ""])
+    return "\n".join(lines)
+
+
+def render_k6(
+    folders: List[Dict[str, Any]],
+    input_host: str = "http://localhost",
+    output: str = "k6_script.js",
+) -> str:
+    """
+    Render a k6 load test picking a tag by weight on each iteration.
+
+    Args:
+        folders (List[Dict[str, Any]]): The folders to load test.
+        input_host (str): The default host URL for the API.
+        output (str): The output file, for the usage note.
+
+    Returns:
+        str: The JavaScript source of the k6 script.
+    """
+    return _K6_SCRIPT.format(
+        host=json.dumps(input_host),
+        output=output,
+        folders=json.dumps(folders, indent=4, default=json_default),
+    )
+
+
+def write_load_test(
+    collection: Dict[str, Any],
+    output_file: str,
+    file_format: str = "locust",
+    input_host: str = "http://localhost",
+    tag_weights: Optional[Dict[str, int]] = None,
+) -> None:
+    """
+    Write a Locust or k6 load test for a generated collection.
+
+    Args:
+        collection (Dict[str, Any]):
+            The generated Postman collection.
+        output_file (str):
+            The output file of the load test.
+        file_format (str):
+            Either ``locust`` or ``k6``.
+        input_host (str):
+            The host URL the collection was generated with.
+        tag_weights (Optional[Dict[str, int]]):
+            The weight of each tag folder, its number of requests by
+            default.
+    """
+    folders = extract_load_requests(collection, input_host, tag_weights)
+    render = render_locust if file_format == "locust" else render_k6
+    try:
+        with open(output_file, "w") as f:
+            f.write(render(folders, input_host, output_file))
+        logger.info(
+            f"{file_format} load test saved to {output_file}"
+        )
+    except Exception as e:
+        logger.error(
+            f"Error saving load test to {output_file}: {e}"
+        )
@@ -0,0 +1,104 @@
+import logging
+from typing import Any, Dict
+
+from .collection import (
+    index_items,
+    iter_collection_items,
+    route_key,
+    walk_collection,
+)
+from .utils import RESPONSE_TIME_SCRIPT
+
+logger = logging.getLogger(__name__)
+
+# Prefix of the markers the generator writes (content hash, stubs...),
+# which are never carried over from an existing item.
+GENERATED_KEY_PREFIX = "x-fast-man-"
+
+
+def merge_item(
+    item: Dict[str, Any],
+    existing: Dict[str, Any],
+) -> None:
+    """
+    Carry user-added fields of an existing item over onto a
+    regenerated one.
+
+    Fields the generator does not produce (test and pre-request
+    scripts, saved examples, ids...) are copied from the existing
+    item, both at item level and inside ``request``. Generated
+    fields always win, except that hand-written events are kept next
+    to the generated response time test, and ``x-fast-man-*`` markers
+    belong to the generator. Merging the same existing item twice
+    changes nothing.
+
+    Args:
+        item (Dict[str, Any]): The regenerated item, updated in place.
+        existing (Dict[str, Any]): The previously generated item.
+    """
+    for key, value in existing.items():
+        if key.startswith(GENERATED_KEY_PREFIX):
+            continue
+        if key == "event" and isinstance(value, list):
+            # The response time test is regenerated, or dropped along
+            # with its budget.
+            events = list(item.get(key, []))
+            for event in value:
+                if (
+                    (event.get("script") or {}).get("name")
+                    != RESPONSE_TIME_SCRIPT
+                    and event not in events
+                ):
+                    events.append(event)
+            if events or key in item:
+                item[key] = events
+        elif key not in item:
+            item[key] = value
+    request = item.get("request")
+    existing_request = existing.get("request")
+    if isinstance(request, dict) and isinstance(existing_request, dict):
+        for key, value in existing_request.items():
+            if key not in request:
+                request[key] = value
+
+
+def merge_collection(
+    collection: Dict[str, Any],
+    existing_file: str,
+    input_host: str = "",
+) -> int:
+    """
+    Merge a previously generated collection into a regenerated one.
+
+    The regenerated items are indexed by route identity
+    (method + path) and the existing file is streamed item by item,
+    so the merge is a single linear pass that never holds two full
+    collections in memory. The item of a route with several tags is
+    the same object in each tag folder, and is indexed once.
+
+    Args:
+        collection (Dict[str, Any]):
+            The regenerated collection, updated in place.
+        existing_file (str):
+            Path to the existing Postman collection.
+        input_host (str):
+            The host URL both collections were generated with.
+
+    Returns:
+        int: The number of regenerated items that received fields.
+    """
+    index = {
+        key: list({id(item): item for item in items}.values())
+        for key, items in index_items(
+            walk_collection(collection), input_host
+        ).items()
+    }
+    merged = set()
+    for _, _, existing in iter_collection_items(existing_file):
+        for item in index.get(route_key(existing, input_host), []):
+            merge_item(item, existing)
+            merged.add(id(item))
+    logger.info(
+        f"Merged {len(merged)} items from {existing_file}"
+    )
+    return len(merged)
@@ -0,0 +1,322 @@
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+from .collection import walk_collection
+from .routes import RouteSources, iter_routes
+
+
+class _ErrorCounter(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__(logging.ERROR)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.count += 1
+
+
+def _cache_infos() -> Dict[str, Dict[str, int]]:
+    from . import docs, examples
+    from .validation import compile_postman_validator
+
+    validators = compile_postman_validator.cache_info()
+    return {
+        "model_examples": examples.cache_info(),
+        "docs": docs.cache_info(),
+        "postman_validators": {
+            "hits": validators.hits,
+            "misses": validators.misses,
+            "size": validators.currsize,
+        },
+    }
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Get the peak resident set size of the process and its workers.
+
+    Returns:
+        Optional[int]: The peak RSS in bytes, or ``None`` where the
+        ``resource`` module is not available.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in kilobytes on Linux, in bytes on macOS.
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def _label_value(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    )
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(
+        f'{key}="{_label_value(str(value))}"'
+        for key, value in labels.items()
+    ) + "}"
+
+
+def _number(value: float) -> str:
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+class GenerationMetrics:
+    """
+    Metrics of a generation run: route and item counts, per-phase
+    durations, cache hit ratios, output size, peak RSS and the number
+    of errors logged, exported as a Prometheus textfile or JSON.
+
+    Errors are counted from the ``fast_man`` logger between the
+    creation of the metrics and ``close``.
+    """
+
+    def __init__(self, collection_name: str = "API Collection") -> None:
+        self.collection_name = collection_name
+        self.started_at = time.time()
+        self.phases: Dict[str, float] = {}
+        self.routes = 0
+        self.items = 0
+        self.items_per_tag: Dict[str, int] = {}
+        self.output_bytes = 0
+        self.total_seconds: Optional[float] = None
+        self._start = time.perf_counter()
+        self._caches_start = _cache_infos()
+        self._caches: Optional[Dict[str, Dict[str, int]]] = None
+        self._errors = _ErrorCounter()
+        logging.getLogger("fast_man").addHandler(self._errors)
+
+    @property
+    def errors(self) -> int:
+        return self._errors.count
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a phase of the run, adding up repeated phases.
+
+        Args:
+            name (str): The name of the phase, e.g. ``"build"``.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = (
+                self.phases.get(name, 0.0) + time.perf_counter() - start
+            )
+
+    def observe_routes(self, app: RouteSources) -> None:
+        """
+        Count the API routes of the apps and routers a collection is
+        generated from; a multi-method route counts once.
+
+        Args:
+            app (RouteSources): The app, router, ``(router, prefix)``
+                pair or a list of them.
+        """
+        self.routes = sum(1 for _ in iter_routes(app))
+
+    def observe_collection(self, collection: Dict[str, Any]) -> None:
+        """
+        Count the items, and the items per tag folder, of a collection.
+
+        An item is generated per route and method; the item of a route
+        with several tags counts once in total and once per folder.
+
+        Args:
+            collection (Dict[str, Any]): The Postman collection.
+        """
+        items = set()
+        self.items_per_tag = {}
+        for folders, _, item in walk_collection(collection):
+            items.add(id(item))
+            tag = folders[0] if folders else ""
+            self.items_per_tag[tag] = self.items_per_tag.get(tag, 0) + 1
+        self.items = len(items)
+
+    def observe_output(self, path: str) -> None:
+        """
+        Add the size of a written output file.
+
+        Args:
+            path (str): The path to the file.
+        """
+        try:
+            self.output_bytes += os.path.getsize(path)
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        """
+        Stop the run clock, snapshot the caches and stop counting
+        errors.
+        """
+        if self.total_seconds is None:
+            self.total_seconds = time.perf_counter() - self._start
+            self._caches = _cache_infos()
+            logging.getLogger("fast_man").removeHandler(self._errors)
+
+    def caches(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the hits, misses and hit ratio of each cache during the run.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The statistics per cache.
+        """
+        current = self._caches or _cache_infos()
+        caches = {}
+        for name, info in current.items():
+            start = self._caches_start.get(name, {})
+            hits = info["hits"] - start.get("hits", 0)
+            misses = info["misses"] - start.get("misses", 0)
+            caches[name] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else None,
+            }
+        return caches
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the metrics as a JSON-serialisable dictionary.
+
+        Returns:
+            Dict[str, Any]: The metrics.
+        """
+        total = self.total_seconds
+        if total is None:
+            total = time.perf_counter() - self._start
+        return {
+            "collection": self.collection_name,
+            "started_at": self.started_at,
+            "routes": self.routes,
+            "items": self.items,
+            "items_per_tag": self.items_per_tag,
+            "duration_seconds": dict(self.phases, total=total),
+            "caches": self.caches(),
+            "output_bytes": self.output_bytes,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "errors": self.errors,
+        }
+
+    def to_prometheus(self) -> str:
+        """
+        Get the metrics in the Prometheus text exposition format, for
+        the node exporter textfile collector.
+
+        Returns:
+            str: The metrics.
+        """
+        data = self.to_dict()
+        base = {"collection": self.collection_name}
+        lines: List[str] = []
+
+        def metric(
+            name: str,
+            help_text: str,
+            samples: List[Any],
+        ) -> None:
+            samples = [
+                (labels, value) for labels, value in samples
+                if value is not None
+            ]
+            if not samples:
+                return
+            lines.append(f"# HELP fast_man_{name} {help_text}")
+            lines.append(f"# TYPE fast_man_{name} gauge")
+            for labels, value in samples:
+                lines.append(
+                    f"fast_man_{name}{_labels(dict(base, **labels))} "
+                    f"{_number(value)}"
+                )
+
+        metric("routes", "API routes the collection is generated from.", [
+            ({}, data["routes"]),
+        ])
+        metric("items_generated", "Items in the generated collection.", [
+            ({}, data["items"]),
+        ])
+        metric("items", "Items per tag folder.", [
+            ({"tag": tag}, count)
+            for tag, count in sorted(data["items_per_tag"].items())
+        ])
+        metric("duration_seconds", "Duration of each generation phase.", [
+            ({"phase": phase}, seconds)
+            for phase, seconds in data["duration_seconds"].items()
+        ])
+        metric("cache_hits", "Cache hits during the run.", [
+            ({"cache": name}, cache["hits"])
+            for name, cache in data["caches"].items()
+        ])
+        metric("cache_misses", "Cache misses during the run.", [
+            ({"cache": name}, cache["misses"])
+            for name, cache in data["caches"].items()
+        ])
+        metric("cache_hit_ratio", "Cache hit ratio during the run.", [
+            ({"cache": name}, cache["hit_ratio"])
+            for name, cache in data["caches"].items()
+        ])
+        metric("output_bytes", "Size of the written output.", [
+            ({}, data["output_bytes"]),
+        ])
+        metric("peak_rss_bytes", "Peak resident set size.", [
+            ({}, data["peak_rss_bytes"]),
+        ])
+        metric("errors", "Errors logged during the run.", [
+            ({}, data["errors"]),
+        ])
+        metric("last_run_timestamp_seconds", "Start time of the run.", [
+            ({}, data["started_at"]),
+        ])
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str, file_format: Optional[str] = None) -> None:
+        """
+        Write the metrics atomically, so that collectors never read a
+        partial file.
+
+        Args:
+            path (str): The output file.
+            file_format (Optional[str]): ``"prometheus"`` or ``"json"``,
+                inferred from the file extension by default.
+        """
+        if file_format is None:
+            file_format = "json" if path.endswith(".json") else "prometheus"
+        if file_format == "json":
+            text = json.dumps(self.to_dict(), indent=4)
+        else:
+            text = self.to_prometheus()
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as f:
+            f.write(text)
+        os.replace(temporary, path)
+
+
+def timed_phase(
+    metrics: Optional[GenerationMetrics], name: str
+) -> ContextManager[None]:
+    """
+    Time a phase of the run when metrics are collected.
+
+    Args:
+        metrics (Optional[GenerationMetrics]): The metrics, if any.
+        name (str): The name of the phase.
+
+    Returns:
+        ContextManager[None]: The context timing the phase.
+    """
+    return metrics.phase(name) if metrics else nullcontext()
@@ -0,0 +1,247 @@
+import json
+import time
+from typing import Any, Callable, Dict, List, TypeVar
+
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+from .encoding import json_default
+
+T = TypeVar("T")
+
+
+def schema_depth(schema: Any) -> int:
+    """
+    Get the nesting depth of a JSON schema.
+
+    Args:
+        schema (Any): The JSON schema.
+
+    Returns:
+        int: The number of nested objects and arrays.
+    """
+    if isinstance(schema, dict):
+        return 1 + max((schema_depth(v) for v in schema.values()), default=0)
+    if isinstance(schema, list):
+        return 1 + max((schema_depth(v) for v in schema), default=0)
+    return 0
+
+
+def count_defs(schema: Any) -> int:
+    """
+    Count the ``$defs`` entries of a JSON schema, at any depth.
+
+    Args:
+        schema (Any): The JSON schema.
+
+    Returns:
+        int: The number of ``$defs`` entries.
+    """
+    if isinstance(schema, dict):
+        return len(schema.get("$defs") or {}) + sum(
+            count_defs(value) for value in schema.values()
+        )
+    if isinstance(schema, list):
+        return sum(count_defs(value) for value in schema)
+    return 0
+
+
+def _route_models(route: APIRoute) -> List[type]:
+    models = []
+    for response in (route.responses or {}).values():
+        if isinstance(response, dict) and "model" in response:
+            models.append(response["model"])
+    models.append(route.response_model)
+    if route.body_field is not None:
+        models.append(route.body_field.type_)
+    return [
+        model
+        for model in models
+        if isinstance(model, type) and issubclass(model, BaseModel)
+    ]
+
+
+class GenerationReport:
+    """
+    Per-route output size, schema depth and helper timing statistics
+    collected while a collection is built.
+    """
+
+    def __init__(self) -> None:
+        self.routes: List[Dict[str, Any]] = []
+        self.models: Dict[str, Dict[str, Any]] = {}
+        self.stubs: List[Dict[str, str]] = []
+        self._timings: Dict[str, float] = {}
+
+    def timed(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Call a helper and add its duration to the current route.
+
+        Args:
+            func (Callable[..., T]): The helper to call.
+            *args (Any): The helper arguments.
+
+        Returns:
+            T: The helper result.
+        """
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            name = func.__name__
+            self._timings[name] = self._timings.get(name, 0.0) + (
+                time.perf_counter() - start
+            ) * 1000
+
+    def add_route(
+        self,
+        route: APIRoute,
+        items: List[Dict[str, Any]],
+        prefix: str = "",
+    ) -> None:
+        """
+        Record the statistics of the items built for a route, one per
+        method.
+
+        The helper timings of the route are split evenly between its
+        items, and its models are counted once.
+
+        Args:
+            route (APIRoute): The route the items were built for.
+            items (List[Dict[str, Any]]): The Postman items.
+            prefix (str): The prefix the route's router is included
+                under.
+        """
+        for model in _route_models(route):
+            entry = self.models.get(model.__name__)
+            if entry is None:
+                schema = model.model_json_schema()
+                entry = self.models[model.__name__] = {
+                    "model": model.__name__,
+                    "schema_bytes": len(json.dumps(schema)),
+                    "schema_depth": schema_depth(schema),
+                    "defs": count_defs(schema),
+                    "routes": 0,
+                }
+            entry["routes"] += 1
+        body = {}
+        if route.body_field is not None:
+            body = self.models.get(
+                getattr(route.body_field.type_, "__name__", ""), {}
+            )
+        share = max(1, len(items))
+        timings = {
+            name: round(elapsed / share, 3)
+            for name, elapsed in self._timings.items()
+        }
+        self._timings = {}
+        for item in items:
+            request = item.get("request", {})
+            responses = request.get("responses") or {}
+            self.routes.append(
+                {
+                    "route": (
+                        f"{request.get('method')} {prefix}{route.path}"
+                    ),
+                    "item_bytes": len(
+                        json.dumps(item, default=json_default)
+                    ),
+                    "response_schema_depth": schema_depth(responses),
+                    "body_schema_depth": body.get("schema_depth", 0),
+                    "defs": count_defs(responses) + body.get("defs", 0),
+                    "helpers_ms": dict(timings),
+                    "total_ms": round(sum(timings.values()), 3),
+                }
+            )
+
+    def add_stub(self, route: str, reason: str) -> None:
+        """
+        Record a route replaced by a stub item.
+
+        Args:
+            route (str): The route, e.g. ``"GET /items"``.
+            reason (str): Why the route was not extracted.
+        """
+        self.stubs.append({"route": route, "reason": reason})
+
+    def merge(self, other: Dict[str, Any]) -> None:
+        """
+        Add the statistics of a report built elsewhere, e.g. in an
+        isolated worker.
+
+        Args:
+            other (Dict[str, Any]): The other report, as ``to_dict``.
+        """
+        self.routes.extend(other.get("routes", []))
+        for model in other.get("models", []):
+            entry = self.models.get(model["model"])
+            if entry is None:
+                self.models[model["model"]] = dict(model)
+            else:
+                entry["routes"] += model["routes"]
+        self.stubs.extend(other.get("stubs", []))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the full report.
+
+        Returns:
+            Dict[str, Any]: The routes and models, heaviest first, and
+            the routes replaced by stub items.
+        """
+        return {
+            "routes": sorted(
+                self.routes,
+                key=lambda entry: entry["item_bytes"],
+                reverse=True,
+            ),
+            "models": sorted(
+                self.models.values(),
+                key=lambda entry: entry["schema_bytes"],
+                reverse=True,
+            ),
+            "stubs": list(self.stubs),
+        }
+
+    def summary(self, top: int = 10) -> str:
+        """
+        Format the heaviest routes and models as a text table.
+
+        Args:
+            top (int): The number of routes and models to list.
+
+        Returns:
+            str: The summary.
+        """
+        report = self.to_dict()
+        lines = [
+            f"Heaviest routes (of {len(self.routes)}):",
+            f"{'bytes':>12} {'depth':>6} {'$defs':>6} {'ms':>9}  route",
+        ]
+        for entry in report["routes"][:top]:
+            lines.append(
+                f"{entry['item_bytes']:>12} "
+                f"{entry['response_schema_depth']:>6} "
+                f"{entry['defs']:>6} "
+                f"{entry['total_ms']:>9.2f}  {entry['route']}"
+            )
+        lines.extend(
+            [
+                "",
+                f"Heaviest models (of {len(self.models)}):",
+                f"{'bytes':>12} {'depth':>6} {'$defs':>6} {'routes':>7}"
+                "  model",
+            ]
+        )
+        for entry in report["models"][:top]:
+            lines.append(
+                f"{entry['schema_bytes']:>12} "
+                f"{entry['schema_depth']:>6} "
+                f"{entry['defs']:>6} "
+                f"{entry['routes']:>7}  {entry['model']}"
+            )
+        if self.stubs:
+            lines.extend(["", f"Stub items ({len(self.stubs)}):"])
+            for stub in self.stubs:
+                lines.append(f"  {stub['route']}: {stub['reason']}")
+        return "\n".join(lines)
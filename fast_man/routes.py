@@ -0,0 +1,54 @@
+from typing import Iterator, List, Tuple, Union
+
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+
+# An app, a router, or either with the prefix it is included under.
+Router = Union[FastAPI, APIRouter]
+RouteSource = Union[Router, Tuple[Router, str]]
+RouteSources = Union[RouteSource, List[RouteSource]]
+
+
+def _normalise_prefix(prefix: str) -> str:
+    # "v1", "/v1" and "/v1/" are the same prefix; "/" is no prefix.
+    prefix = prefix.strip("/")
+    return f"/{prefix}" if prefix else ""
+
+
+def route_sources(app: RouteSources) -> List[Tuple[Router, str]]:
+    """
+    Normalise an app, a router or a list of them to
+    ``(app or router, include prefix)`` pairs, with prefixes in the
+    ``/prefix`` form.
+
+    Args:
+        app (RouteSources): The app, router, ``(router, prefix)`` pair
+            or a list of them.
+
+    Returns:
+        List[Tuple[Router, str]]: The sources.
+    """
+    sources = list(app) if isinstance(app, list) else [app]
+    return [
+        (source[0], _normalise_prefix(source[1]))
+        if isinstance(source, tuple)
+        else (source, "")
+        for source in sources
+    ]
+
+
+def iter_routes(app: RouteSources) -> Iterator[Tuple[str, APIRoute]]:
+    """
+    Iterate over the API routes of an app, a router or a list of them.
+
+    Args:
+        app (RouteSources): The app, router, ``(router, prefix)`` pair
+            or a list of them.
+
+    Yields:
+        Tuple[str, APIRoute]: The include prefix and the route.
+    """
+    for source, prefix in route_sources(app):
+        for route in source.routes:
+            if isinstance(route, APIRoute):
+                yield prefix, route
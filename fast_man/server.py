@@ -0,0 +1,245 @@
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .collection import route_key
+from .encoding import json_default
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+# (name, host, readme, seed)
+_CacheKey = Tuple[str, str, str, int]
+
+
+def remove_stale_socket(socket_path: str) -> None:
+    """
+    Remove the socket a previous server left behind at a path.
+
+    Args:
+        socket_path (str): The path of the Unix socket.
+
+    Raises:
+        FileExistsError: If the path is not a socket, or a server is
+            still listening on it.
+    """
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{socket_path} exists and is not a socket")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            os.unlink(socket_path)
+            return
+    raise FileExistsError(f"A server is already listening on {socket_path}")
+
+
+def filter_collection(
+    collection: Dict[str, Any],
+    tags: Optional[List[str]] = None,
+    paths: Optional[List[str]] = None,
+    input_host: str = "",
+) -> Dict[str, Any]:
+    """
+    Get a copy of a collection restricted to some folders and paths.
+
+    Args:
+        collection (Dict[str, Any]):
+            The Postman collection.
+        tags (Optional[List[str]]):
+            The folders (tags) to keep, all when empty.
+        paths (Optional[List[str]]):
+            The path prefixes of the items to keep, all when empty.
+        input_host (str):
+            The host URL the collection was generated with.
+
+    Returns:
+        Dict[str, Any]: The filtered collection.
+    """
+    folders = []
+    for folder in collection.get("item", []):
+        if tags and folder.get("name") not in tags:
+            continue
+        items = [
+            item
+            for item in folder.get("item", [])
+            if not paths
+            or any(
+                route_key(item, input_host).split(" ", 1)[1].startswith(path)
+                for path in paths
+            )
+        ]
+        if items:
+            folders.append(dict(folder, item=items))
+    return dict(collection, item=folders)
+
+
+class CollectionServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Keeps a FastAPI app and its built collections resident and serves
+    them over a local Unix socket.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: str,
+        app: "FastAPI",
+        defaults: Dict[str, Any],
+    ) -> None:
+        self.app = app
+        self.defaults = defaults
+        self.collections: Dict[_CacheKey, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+        remove_stale_socket(socket_path)
+        super().__init__(socket_path, _CollectionHandler)
+
+    def get_collection(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get a (filtered) collection, building it on first use.
+
+        Args:
+            request (Dict[str, Any]): The client request.
+
+        Returns:
+            Dict[str, Any]: The Postman collection.
+        """
+        options = dict(self.defaults)
+        options.update(
+            {
+                key: value
+                for key, value in request.items()
+                if key in ("name", "host", "readme", "seed")
+            }
+        )
+        key = (
+            options["name"],
+            options["host"],
+            options["readme"],
+            int(options["seed"]),
+        )
+        with self.lock:
+            collection = self.collections.get(key)
+            if collection is None:
+                from .converter import build_postman_collection
+
+                collection = build_postman_collection(
+                    self.app, *key
+                )
+                self.collections[key] = collection
+        return filter_collection(
+            collection,
+            request.get("tags"),
+            request.get("paths"),
+            options["host"],
+        )
+
+
+class _CollectionHandler(socketserver.StreamRequestHandler):
+    server: CollectionServer
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline() or b"{}")
+            response = {"collection": self.server.get_collection(request)}
+        except Exception as e:
+            logger.error(
+                f"Error serving collection request: {e}"
+            )
+            response = {"error": str(e)}
+        self.wfile.write(
+            json.dumps(response, default=json_default).encode() + b"\n"
+        )
+
+
+def serve(
+    app: "FastAPI",
+    socket_path: str,
+    input_name: str = "API Collection",
+    input_host: str = "http://localhost",
+    readme_file: str = "README.md",
+    seed: int = 0,
+) -> None:
+    """
+    Serve collections of a resident app over a Unix socket until
+    interrupted.
+
+    Args:
+        app (FastAPI):
+            The FastAPI app instance.
+        socket_path (str):
+            The path of the Unix socket.
+        input_name (str):
+            The default name of the Postman collection.
+        input_host (str):
+            The default host URL for the API.
+        readme_file (str):
+            The default path to the README.md file for documentation.
+        seed (int):
+            The default seed for synthesised body examples.
+    """
+    server = CollectionServer(
+        socket_path,
+        app,
+        {
+            "name": input_name,
+            "host": input_host,
+            "readme": readme_file,
+            "seed": seed,
+        },
+    )
+    server.get_collection({})
+    logger.info(
+        f"Serving Postman collections on {socket_path}"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def request_collection(
+    socket_path: str,
+    timeout: Optional[float] = 60.0,
+    **request: Any,
+) -> Dict[str, Any]:
+    """
+    Request a collection from a running ``fast-man serve`` daemon.
+
+    Args:
+        socket_path (str):
+            The path of the Unix socket.
+        timeout (Optional[float]):
+            The socket timeout, in seconds.
+        **request (Any):
+            The ``name``, ``host``, ``readme``, ``seed``, ``tags`` and
+            ``paths`` of the requested collection.
+
+    Returns:
+        Dict[str, Any]: The Postman collection.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(socket_path)
+        client.sendall(json.dumps(request).encode() + b"\n")
+        with client.makefile("rb") as f:
+            response = json.loads(f.readline())
+    if "error" in response:
+        raise RuntimeError(response["error"])
+    return response["collection"]
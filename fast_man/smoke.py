@@ -0,0 +1,239 @@
+import asyncio
+import logging
+import math
+import re
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from fastapi import FastAPI
+
+from .collection import route_key, walk_collection
+
+logger = logging.getLogger(__name__)
+
+_PATH_PARAM = re.compile(r"\{([^}:]+)(?::[^}]*)?\}")
+_VARIABLE = re.compile(r"\{\{([^}]+)\}\}")
+_PLACEHOLDERS = {
+    "int": 1,
+    "float": 1.0,
+    "Decimal": 1.0,
+    "bool": "true",
+    "UUID": "00000000-0000-0000-0000-000000000001",
+}
+
+
+def _param_value(param: Dict[str, Any]) -> Optional[Any]:
+    schema = param.get("schema") or {}
+    for key in ("example", "default"):
+        if schema.get(key) not in ("", None):
+            return schema[key]
+    if not param.get("required"):
+        return None
+    return _PLACEHOLDERS.get(schema.get("type"), "string")
+
+
+def build_request(
+    item: Dict[str, Any],
+    input_host: str = "",
+    token: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Turn a generated Postman item into in-process request arguments.
+
+    Path parameters are filled from their example, default or a
+    placeholder for their type; headers whose Postman variables
+    cannot be resolved are left out.
+
+    Args:
+        item (Dict[str, Any]): The Postman item.
+        input_host (str): The host URL the item was generated with.
+        token (Optional[str]): The bearer token for ``{{access_token}}``.
+
+    Returns:
+        Dict[str, Any]: The method, url, params, headers and body.
+    """
+    request = item["request"]
+    path = route_key(item, input_host).split(" ", 1)[1]
+    params = {
+        param["name"]: _param_value(param)
+        for param in request.get("params") or []
+    }
+    path = _PATH_PARAM.sub(
+        lambda match: str(params.get(match.group(1)) or "1"),
+        path,
+    )
+    query = {
+        param["name"]: params[param["name"]]
+        for param in request.get("params") or []
+        if param.get("in") == "query" and params[param["name"]] is not None
+    }
+    variables = {"access_token": token} if token else {}
+    headers = {}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    for header in request.get("header") or []:
+        names = _VARIABLE.findall(header.get("value", ""))
+        if all(name in variables for name in names):
+            headers[header["key"]] = _VARIABLE.sub(
+                lambda match: variables[match.group(1)],
+                header.get("value", ""),
+            )
+    body = (request.get("body") or {}).get("raw")
+    return {
+        "method": request.get("method", "GET"),
+        "url": path,
+        "params": query,
+        "headers": headers,
+        "json": body if body not in ({}, [], "", None) else None,
+    }
+
+
+def _expected_statuses(item: Dict[str, Any]) -> Set[int]:
+    return {
+        int(code)
+        for code in (item["request"].get("responses") or {})
+        if str(code).isdigit() and 200 <= int(code) < 300
+    }
+
+
+def _percentile(samples: List[float], percent: float) -> float:
+    ordered = sorted(samples)
+    index = max(0, math.ceil(percent / 100 * len(ordered)) - 1)
+    return round(ordered[index], 3)
+
+
+async def _smoke(
+    app: FastAPI,
+    requests: List[Tuple[str, Dict[str, Any], Set[int]]],
+    repeat: int,
+    concurrency: int,
+) -> Dict[str, Dict[str, Any]]:
+    import httpx
+
+    semaphore = asyncio.Semaphore(concurrency)
+    results: Dict[str, Dict[str, Any]] = {
+        key: {"latencies": [], "statuses": []} for key, _, _ in requests
+    }
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://testserver",
+    ) as client:
+
+        async def _send(key: str, arguments: Dict[str, Any]) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    response = await client.request(**arguments)
+                    status = response.status_code
+                except Exception as e:
+                    logger.error(
+                        f"Error sending {key}: {e}"
+                    )
+                    status = 0
+                elapsed = (time.perf_counter() - start) * 1000
+            results[key]["latencies"].append(elapsed)
+            results[key]["statuses"].append(status)
+
+        await asyncio.gather(
+            *(
+                _send(key, arguments)
+                for key, arguments, _ in requests
+                for _ in range(repeat)
+            )
+        )
+    return results
+
+
+def smoke_test(
+    app: FastAPI,
+    collection: Dict[str, Any],
+    input_host: str = "",
+    repeat: int = 1,
+    concurrency: int = 10,
+    token: Optional[str] = None,
+    annotate: bool = False,
+) -> Dict[str, Any]:
+    """
+    Send every generated request to the app in-process over ASGI and
+    report status mismatches and per-route latency percentiles.
+
+    Args:
+        app (FastAPI):
+            The FastAPI app instance.
+        collection (Dict[str, Any]):
+            The generated Postman collection.
+        input_host (str):
+            The host URL the collection was generated with.
+        repeat (int):
+            The number of requests per route.
+        concurrency (int):
+            The maximum number of requests in flight.
+        token (Optional[str]):
+            The bearer token for authenticated routes.
+        annotate (bool):
+            Whether to write the measured latencies into the item
+            descriptions of ``collection``.
+
+    Returns:
+        Dict[str, Any]: The smoke test report.
+    """
+    requests: List[Tuple[str, Dict[str, Any], Set[int]]] = []
+    items: Dict[str, List[Dict[str, Any]]] = {}
+    for _, _, item in walk_collection(collection):
+        key = route_key(item, input_host)
+        if key not in items:
+            requests.append(
+                (
+                    key,
+                    build_request(item, input_host, token),
+                    _expected_statuses(item),
+                )
+            )
+        items.setdefault(key, []).append(item)
+
+    results = asyncio.run(
+        _smoke(app, requests, max(1, repeat), max(1, concurrency))
+    )
+
+    routes = []
+    for key, _, expected in requests:
+        statuses = results[key]["statuses"]
+        latencies = results[key]["latencies"]
+        mismatches = sum(
+            1
+            for status in statuses
+            if (status not in expected if expected else status // 100 != 2)
+        )
+        entry = {
+            "route": key,
+            "expected": sorted(expected),
+            "statuses": sorted(set(statuses)),
+            "requests": len(statuses),
+            "mismatches": mismatches,
+            "p50_ms": _percentile(latencies, 50),
+            "p95_ms": _percentile(latencies, 95),
+            "p99_ms": _percentile(latencies, 99),
+        }
+        routes.append(entry)
+        if annotate:
+            for item in {id(item): item for item in items[key]}.values():
+                request = item["request"]
+                request["description"] = (
+                    f"{request.get('description') or ''}\n\n"
+                    f"Measured latency: p50 {entry['p50_ms']} ms, "
+                    f"p95 {entry['p95_ms']} ms, p99 {entry['p99_ms']} ms"
+                ).lstrip()
+
+    report = {
+        "routes": routes,
+        "mismatches": [
+            entry["route"] for entry in routes if entry["mismatches"]
+        ],
+    }
+    logger.info(
+        f"Smoke tested {len(routes)} routes, "
+        f"{len(report['mismatches'])} with status mismatches"
+    )
+    return report
@@ -0,0 +1,378 @@
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .collection import route_key, walk_collection
+from .diff import item_digest
+from .encoding import json_default
+
+logger = logging.getLogger(__name__)
+
+POSTMAN_API_URL = "https://api.getpostman.com"
+
+# Statuses with which the API rejects a request without processing it,
+# so that even a ``POST`` can be sent again.
+_UNPROCESSED_STATUSES = frozenset({429, 503})
+
+# (method, url path, JSON body, route identity, folder names)
+_Operation = Tuple[
+    str, str, Optional[Dict[str, Any]], str, Tuple[str, ...]
+]
+
+
+class _Retry(Retry):
+    # ``POST`` is not in ``allowed_methods``, so it is never retried on
+    # read errors or on statuses a create may have got past, but it is
+    # on rate limits and unavailability.
+    def is_retry(
+        self,
+        method: str,
+        status_code: int,
+        has_retry_after: bool = False,
+    ) -> bool:
+        if method.upper() == "POST":
+            return bool(self.total) and status_code in _UNPROCESSED_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def create_session(
+    api_key: str,
+    concurrency: int = 4,
+    retries: int = 3,
+    backoff: float = 0.5,
+) -> requests.Session:
+    """
+    Create a pooled keep-alive session for the Postman API.
+
+    Idempotent requests are retried on rate limits, server errors and
+    read errors. A ``POST`` is only retried when the API rejected it
+    unprocessed (429, 503), so a create that timed out after reaching
+    the API never creates a duplicate item.
+
+    Args:
+        api_key (str): The Postman API key.
+        concurrency (int): The maximum number of pooled connections.
+        retries (int): The number of retries for failed requests.
+        backoff (float): The exponential backoff factor, in seconds.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    retry = _Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "PUT", "DELETE"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=concurrency,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(
+        {
+            "X-Api-Key": api_key,
+            "Content-Type": "application/json",
+        }
+    )
+    return session
+
+
+def _folder_ids(
+    items: List[Dict[str, Any]],
+    folders: Tuple[str, ...] = (),
+) -> Dict[Tuple[str, ...], str]:
+    ids: Dict[Tuple[str, ...], str] = {}
+    for item in items:
+        if "item" in item:
+            path = folders + (item.get("name", ""),)
+            if item.get("id"):
+                ids[path] = item["id"]
+            ids.update(_folder_ids(item["item"], path))
+    return ids
+
+
+def _raw_url(url: Any) -> str:
+    if isinstance(url, dict):
+        return url.get("raw") or ""
+    return url or ""
+
+
+def _raw_body(raw: Any) -> Any:
+    if isinstance(raw, str):
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return raw
+    return raw
+
+
+def synced_fields(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the fields of an item that the Postman API stores, normalised
+    so that a generated item and its remote copy compare equal.
+
+    The API keeps the URL as an object and the raw body as a string,
+    and drops the request keys it does not know (``params``,
+    ``responses``), which therefore never make an item change.
+
+    Args:
+        item (Dict[str, Any]): The generated or remote Postman item.
+
+    Returns:
+        Dict[str, Any]: The normalised fields.
+    """
+    request = item.get("request") or {}
+    if isinstance(request, str):
+        request = {"url": request}
+    description = request.get("description") or ""
+    if isinstance(description, dict):
+        description = description.get("content") or ""
+    body = request.get("body") or {}
+    return {
+        "name": item.get("name") or "",
+        "method": str(request.get("method") or "GET").upper(),
+        "url": _raw_url(request.get("url")),
+        "description": description,
+        "header": [
+            (header.get("key"), header.get("value"))
+            for header in request.get("header") or []
+        ],
+        "body": (body.get("mode"), _raw_body(body.get("raw"))),
+        "event": [
+            (
+                event.get("listen"),
+                (event.get("script") or {}).get("exec"),
+            )
+            for event in item.get("event") or []
+        ],
+    }
+
+
+def request_payload(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map a generated item to the flat request format of the Postman
+    API request endpoints.
+
+    Args:
+        item (Dict[str, Any]): The generated Postman item.
+
+    Returns:
+        Dict[str, Any]: The request payload, with the raw body as a
+        string.
+    """
+    fields = synced_fields(item)
+    mode, raw = fields["body"]
+    return {
+        "name": fields["name"],
+        "method": fields["method"],
+        "url": fields["url"],
+        "description": fields["description"],
+        "headerData": [
+            {"key": key, "value": value} for key, value in fields["header"]
+        ],
+        "dataMode": mode or "raw",
+        "rawModeData": (
+            "" if raw is None
+            else raw if isinstance(raw, str)
+            else json.dumps(raw, default=json_default)
+        ),
+        "events": [
+            {"listen": listen, "script": {"exec": script}}
+            for listen, script in fields["event"]
+        ],
+    }
+
+
+def plan_operations(
+    remote: Dict[str, Any],
+    collection: Dict[str, Any],
+    input_host: str = "",
+) -> Tuple[List[Tuple[str, ...]], List[_Operation]]:
+    """
+    Plan the item-level requests that bring a remote collection in
+    line with a regenerated one.
+
+    Items are matched by folder and route identity and compared on
+    the fields the Postman API stores (see ``synced_fields``), so
+    unchanged items are not sent.
+
+    Args:
+        remote (Dict[str, Any]):
+            The remote collection, as returned by the API.
+        collection (Dict[str, Any]):
+            The regenerated collection.
+        input_host (str):
+            The host URL both collections were generated with.
+
+    Returns:
+        Tuple[List[Tuple[str, ...]], List[_Operation]]:
+            The folders to create, parents first, and the item
+            operations.
+    """
+    folder_ids = _folder_ids(remote.get("item", []))
+    remote_items: Dict[Tuple[Tuple[str, ...], str], Dict[str, Any]] = {}
+    for folders, _, item in walk_collection(remote):
+        remote_items.setdefault((folders, route_key(item, input_host)), item)
+
+    new_folders: List[Tuple[str, ...]] = []
+    operations: List[_Operation] = []
+    seen = set()
+    for folders, _, item in walk_collection(collection):
+        key = route_key(item, input_host)
+        slot = (folders, key)
+        if slot in seen:
+            continue
+        seen.add(slot)
+        existing = remote_items.get(slot)
+        if existing is None:
+            for size in range(1, len(folders) + 1):
+                if (
+                    folders[:size] not in folder_ids
+                    and folders[:size] not in new_folders
+                ):
+                    new_folders.append(folders[:size])
+            operations.append(("POST", "/requests", item, key, folders))
+        elif item_digest(synced_fields(item)) != item_digest(
+            synced_fields(existing)
+        ):
+            operations.append(
+                (
+                    "PUT",
+                    f"/requests/{existing.get('id')}",
+                    item,
+                    key,
+                    folders,
+                )
+            )
+
+    for (folders, key), item in remote_items.items():
+        if (folders, key) not in seen:
+            operations.append(
+                (
+                    "DELETE",
+                    f"/requests/{item.get('id')}",
+                    None,
+                    key,
+                    folders,
+                )
+            )
+    return new_folders, operations
+
+
+def push_collection(
+    collection: Dict[str, Any],
+    collection_id: str,
+    api_key: str,
+    api_url: str = POSTMAN_API_URL,
+    input_host: str = "",
+    batch_size: int = 25,
+    concurrency: int = 4,
+    retries: int = 3,
+    backoff: float = 0.5,
+) -> Dict[str, int]:
+    """
+    Update a remote collection through the Postman API by sending
+    only the items that were added, changed or removed.
+
+    Requests go over a single pooled keep-alive session, in batches
+    of ``batch_size`` with at most ``concurrency`` in flight, and are
+    retried with exponential backoff on rate limits and server errors.
+
+    Args:
+        collection (Dict[str, Any]):
+            The regenerated collection.
+        collection_id (str):
+            The uid of the remote collection.
+        api_key (str):
+            The Postman API key.
+        api_url (str):
+            The base URL of the Postman-compatible API.
+        input_host (str):
+            The host URL the collections were generated with.
+        batch_size (int):
+            The number of item requests per batch.
+        concurrency (int):
+            The maximum number of concurrent requests.
+        retries (int):
+            The number of retries for failed requests.
+        backoff (float):
+            The exponential backoff factor, in seconds.
+
+    Returns:
+        Dict[str, int]:
+            The number of items created, updated, deleted and failed.
+    """
+    base = f"{api_url.rstrip('/')}/collections/{collection_id}"
+    summary = {"created": 0, "updated": 0, "deleted": 0, "failed": 0}
+    labels = {"POST": "created", "PUT": "updated", "DELETE": "deleted"}
+
+    with create_session(api_key, concurrency, retries, backoff) as session:
+        response = session.get(base)
+        response.raise_for_status()
+        remote = response.json().get("collection", {})
+
+        new_folders, operations = plan_operations(
+            remote, collection, input_host
+        )
+        folder_ids = _folder_ids(remote.get("item", []))
+        for folders in new_folders:
+            parent = folder_ids.get(folders[:-1])
+            response = session.post(
+                f"{base}/folders",
+                params={"folder": parent} if parent else None,
+                json={"name": folders[-1]},
+            )
+            response.raise_for_status()
+            body = response.json()
+            folder_ids[folders] = (
+                body.get("data", {}).get("id") or body.get("model_id")
+            )
+
+        def _send(operation: _Operation) -> bool:
+            method, path, body, key, folders = operation
+            folder = folder_ids.get(folders) if method == "POST" else None
+            try:
+                response = session.request(
+                    method,
+                    f"{base}{path}",
+                    params={"folder": folder} if folder else None,
+                    data=(
+                        json.dumps(request_payload(body))
+                        if body is not None
+                        else None
+                    ),
+                )
+                response.raise_for_status()
+                return True
+            except Exception as e:
+                logger.error(
+                    f"Error pushing {key}: {e}"
+                )
+                return False
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for start in range(0, len(operations), batch_size):
+                batch = operations[start:start + batch_size]
+                results = executor.map(_send, batch)
+                for operation, ok in zip(batch, results):
+                    summary[labels[operation[0]] if ok else "failed"] += 1
+                logger.info(
+                    f"Pushed batch of {len(batch)} items to {collection_id}"
+                )
+
+    logger.info(
+        f"Pushed {collection_id}: "
+        + ", ".join(f"{count} {label}" for label, count in summary.items())
+    )
+    return summary
@@ -1,26 +1,57 @@
 from fastapi.routing import APIRoute
 from fastapi.openapi.models import APIKey
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
+import json
 import logging
 import traceback
+from .examples import model_example
+from .limits import limit_schema
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def get_request_body_example(route: APIRoute) -> Dict[str, Any]:
+def _limit(
+    route: APIRoute,
+    name: str,
+    schema: Any,
+    max_schema_bytes: Optional[int],
+    max_schema_depth: Optional[int],
+) -> Any:
+    if max_schema_bytes is None and max_schema_depth is None:
+        return schema
+    schema, reason = limit_schema(schema, max_schema_bytes, max_schema_depth)
+    if reason:
+        logger.warning(
+            f"Truncated {name} of {route.path} ({reason})"
+        )
+    return schema
+
+
+def get_request_body_example(
+    route: APIRoute,
+    seed: int = 0,
+    max_schema_bytes: Optional[int] = None,
+    max_schema_depth: Optional[int] = None,
+) -> Dict[str, Any]:
     """
     Get the example request body for a given route.
 
+    Declared examples win; otherwise an example is synthesised from
+    the model fields with a generator compiled once per model class.
+
     Args:
         route (APIRoute): The route to get the request body example for.
+        seed (int): The seed for synthesised examples.
+        max_schema_bytes (Optional[int]): The size budget of the example.
+        max_schema_depth (Optional[int]): The nesting budget of the example.
 
     Returns:
         Dict[str, Any]: The example request body.
     """
     try:
+        example: Any = {}
         if route.body_field:
             if issubclass(route.body_field.type_, BaseModel):
                 if route.body_field.field_info.examples:
@@ -29,14 +60,24 @@ def get_request_body_example(route: APIRoute) -> Dict[str, Any]:
                     ).get("value", {})
                 else:
                     example = route.body_field.type_.model_json_schema().get(
-                        "example", {}
+                        "example"
                     )
-                return example
+                    if example is None:
+                        example = model_example(
+                            route.body_field.type_,
+                            seed
+                        )
             elif isinstance(route.body_field.type_, dict):
-                return route.body_field.type_
+                example = route.body_field.type_
             elif isinstance(route.body_field.type_, list):
-                return [route.body_field.type_[0].model_json_schema()]
-        return {}
+                example = [route.body_field.type_[0].model_json_schema()]
+        return _limit(
+            route,
+            "request body",
+            example,
+            max_schema_bytes,
+            max_schema_depth
+        )
     except Exception as e:
         logger.error(
             f"Error in get_request_body_example: {e}\n{traceback.format_exc()}"
@@ -185,12 +226,18 @@ def get_parameters(route: APIRoute) -> List[Dict[str, Any]]:
         return []
 
 
-def get_responses(route: APIRoute) -> Dict[str, Dict[str, Any]]:
+def get_responses(
+    route: APIRoute,
+    max_schema_bytes: Optional[int] = None,
+    max_schema_depth: Optional[int] = None,
+) -> Dict[str, Dict[str, Any]]:
     """
     Get the responses for a given route.
 
     Args:
         route (APIRoute): The route to get the responses for.
+        max_schema_bytes (Optional[int]): The size budget of a schema.
+        max_schema_depth (Optional[int]): The nesting budget of a schema.
 
     Returns:
         Dict[str, Dict[str, Any]]: The dictionary of responses.
@@ -243,9 +290,89 @@ def get_responses(route: APIRoute) -> Dict[str, Dict[str, Any]]:
                     }
                 },
             }
+        for status_code, response in responses.items():
+            content = response["content"]["application/json"]
+            content["schema"] = _limit(
+                route,
+                f"{status_code} response schema",
+                content["schema"],
+                max_schema_bytes,
+                max_schema_depth
+            )
         return responses
     except Exception as e:
         logger.error(
             f"Error in get_responses: {e}\n{traceback.format_exc()}"
         )
         return {}
+
+
+RESPONSE_TIME_SCRIPT = "fast-man: response time"
+
+
+def get_response_time_tests(
+    route: APIRoute,
+    responses: Dict[str, Dict[str, Any]],
+    slo_ms: Optional[int] = None,
+    tag_slo_ms: Optional[Dict[str, int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Get the Postman test event asserting the response time budget and
+    the documented status codes of a given route.
+
+    The budget comes from the route ``openapi_extra`` (``x-slo-ms``),
+    then from the first tag with a default, then from ``slo_ms``.
+
+    Args:
+        route (APIRoute): The route to get the test event for.
+        responses (Dict[str, Dict[str, Any]]): The route responses.
+        slo_ms (Optional[int]): The default budget, in milliseconds.
+        tag_slo_ms (Optional[Dict[str, int]]): The budgets per tag.
+
+    Returns:
+        List[Dict[str, Any]]: The test events, empty without a budget.
+    """
+    try:
+        budget = (route.openapi_extra or {}).get("x-slo-ms")
+        if budget is None:
+            budget = next(
+                (
+                    (tag_slo_ms or {})[tag]
+                    for tag in route.tags
+                    if tag in (tag_slo_ms or {})
+                ),
+                slo_ms,
+            )
+        if budget is None:
+            return []
+        codes = sorted(
+            {int(code) for code in responses if str(code).isdigit()}
+            | {route.status_code or 200}
+        )
+        return [
+            {
+                "listen": "test",
+                "script": {
+                    "name": RESPONSE_TIME_SCRIPT,
+                    "type": "text/javascript",
+                    "exec": [
+                        f'pm.test("Response time is below {budget} ms", '
+                        "function () {",
+                        "    pm.expect(pm.response.responseTime)"
+                        f".to.be.below({budget});",
+                        "});",
+                        'pm.test("Status code is documented", '
+                        "function () {",
+                        "    pm.expect(pm.response.code)"
+                        f".to.be.oneOf({json.dumps(codes)});",
+                        "});",
+                    ],
+                },
+            }
+        ]
+    except Exception as e:
+        logger.error(
+            f"Error in get_response_time_tests: {e}\n"
+            f"{traceback.format_exc()}"
+        )
+        return []
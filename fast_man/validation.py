@@ -0,0 +1,460 @@
+import logging
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Validators append "path: message" strings to the error list.
+Validator = Callable[[Any, str, List[str]], None]
+
+_STRING_LIST: Dict[str, Any] = {"type": "array", "items": {"type": "string"}}
+
+# fast-man keeps the parameters and responses of a route in its request,
+# and JSON bodies as objects. These known deviations from the schema,
+# relative to the item path, are warnings rather than errors.
+KNOWN_DEVIATIONS = (
+    ".request: unexpected property 'params'",
+    ".request: unexpected property 'responses'",
+    ".request.body.raw: expected string, got ",
+)
+
+# The parts of the Postman v2.1 collection schema fast-man produces:
+# https://schema.getpostman.com/json/collection/v2.1.0/collection.json
+POSTMAN_SCHEMA: Dict[str, Any] = {
+    "$ref": "#/definitions/collection",
+    "definitions": {
+        "collection": {
+            "type": "object",
+            "required": ["info", "item"],
+            "properties": {
+                "info": {"$ref": "#/definitions/info"},
+                "item": {
+                    "type": "array",
+                    "items": {
+                        "anyOf": [
+                            {"$ref": "#/definitions/item"},
+                            {"$ref": "#/definitions/item-group"},
+                        ]
+                    },
+                },
+                "event": {"$ref": "#/definitions/event-list"},
+                "variable": {"type": "array"},
+                "auth": {"$ref": "#/definitions/auth"},
+            },
+        },
+        "info": {
+            "type": "object",
+            "required": ["name", "schema"],
+            "properties": {
+                "name": {"type": "string"},
+                "_postman_id": {"type": "string"},
+                "description": {"$ref": "#/definitions/description"},
+                "version": {"type": ["string", "object"]},
+                "schema": {"type": "string"},
+            },
+        },
+        "description": {"type": ["string", "object", "null"]},
+        "item-group": {
+            "type": "object",
+            "required": ["item"],
+            "properties": {
+                "name": {"type": "string"},
+                "description": {"$ref": "#/definitions/description"},
+                "variable": {"type": "array"},
+                "item": {
+                    "type": "array",
+                    "items": {
+                        "anyOf": [
+                            {"$ref": "#/definitions/item"},
+                            {"$ref": "#/definitions/item-group"},
+                        ]
+                    },
+                },
+                "event": {"$ref": "#/definitions/event-list"},
+                "auth": {"$ref": "#/definitions/auth"},
+            },
+        },
+        "item": {
+            "type": "object",
+            "required": ["request"],
+            "properties": {
+                "id": {"type": "string"},
+                "name": {"type": "string"},
+                "description": {"$ref": "#/definitions/description"},
+                "variable": {"type": "array"},
+                "event": {"$ref": "#/definitions/event-list"},
+                "request": {"$ref": "#/definitions/request"},
+                "response": {"type": "array"},
+                "protocolProfileBehavior": {"type": "object"},
+            },
+        },
+        "request": {
+            "anyOf": [
+                {"type": "string"},
+                {
+                    "type": "object",
+                    "additionalProperties": False,
+                    "properties": {
+                        "url": {"$ref": "#/definitions/url"},
+                        "auth": {"$ref": "#/definitions/auth"},
+                        "proxy": {"type": "object"},
+                        "certificate": {"type": "object"},
+                        "method": {"type": "string"},
+                        "description": {
+                            "$ref": "#/definitions/description"
+                        },
+                        "header": {
+                            "anyOf": [
+                                {
+                                    "type": "array",
+                                    "items": {"$ref": "#/definitions/header"},
+                                },
+                                {"type": "string"},
+                            ]
+                        },
+                        "body": {"$ref": "#/definitions/body"},
+                    },
+                },
+            ]
+        },
+        "url": {
+            "anyOf": [
+                {"type": "string"},
+                {
+                    "type": "object",
+                    "properties": {
+                        "raw": {"type": "string"},
+                        "protocol": {"type": "string"},
+                        "host": {"type": ["string", "array"]},
+                        "path": {"type": ["string", "array"]},
+                        "port": {"type": "string"},
+                        "query": {"type": "array"},
+                        "hash": {"type": "string"},
+                        "variable": {"type": "array"},
+                    },
+                },
+            ]
+        },
+        "header": {
+            "type": "object",
+            "required": ["key", "value"],
+            "properties": {
+                "key": {"type": "string"},
+                "value": {"type": "string"},
+                "disabled": {"type": "boolean"},
+                "description": {"$ref": "#/definitions/description"},
+            },
+        },
+        "body": {
+            "anyOf": [
+                {
+                    "type": "object",
+                    "properties": {
+                        "mode": {
+                            "enum": [
+                                "raw",
+                                "urlencoded",
+                                "formdata",
+                                "file",
+                                "graphql",
+                            ]
+                        },
+                        "raw": {"type": "string"},
+                        "urlencoded": {"type": "array"},
+                        "formdata": {"type": "array"},
+                        "file": {"type": "object"},
+                        "graphql": {"type": "object"},
+                        "options": {"type": "object"},
+                        "disabled": {"type": "boolean"},
+                    },
+                },
+                {"type": "null"},
+            ]
+        },
+        "event-list": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/event"},
+        },
+        "event": {
+            "type": "object",
+            "required": ["listen"],
+            "properties": {
+                "id": {"type": "string"},
+                "listen": {"type": "string"},
+                "script": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "string"},
+                        "type": {"type": "string"},
+                        "exec": {
+                            "anyOf": [_STRING_LIST, {"type": "string"}]
+                        },
+                        "src": {"$ref": "#/definitions/url"},
+                        "name": {"type": "string"},
+                    },
+                },
+                "disabled": {"type": "boolean"},
+            },
+        },
+        "auth": {
+            "type": ["object", "null"],
+            "required": ["type"],
+            "properties": {
+                "type": {
+                    "enum": [
+                        "apikey",
+                        "awsv4",
+                        "basic",
+                        "bearer",
+                        "digest",
+                        "edgegrid",
+                        "hawk",
+                        "noauth",
+                        "oauth1",
+                        "oauth2",
+                        "ntlm",
+                    ]
+                },
+            },
+        },
+    },
+}
+
+_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    "integer": lambda value: (
+        isinstance(value, int) and not isinstance(value, bool)
+    ),
+    "number": lambda value: (
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+    ),
+    "null": lambda value: value is None,
+}
+
+
+def compile_schema(
+    schema: Dict[str, Any],
+    root: Optional[Dict[str, Any]] = None,
+    compiled: Optional[Dict[str, Validator]] = None,
+) -> Validator:
+    """
+    Compile a JSON schema into a validator function.
+
+    Supports the keywords the Postman collection schema relies on:
+    ``$ref``, ``type``, ``enum``, ``anyOf``, ``required``,
+    ``properties``, ``additionalProperties: false`` and ``items``.
+
+    Args:
+        schema (Dict[str, Any]): The schema to compile.
+        root (Optional[Dict[str, Any]]): The document ``$ref`` resolve in.
+        compiled (Optional[Dict[str, Validator]]): The compiled ``$ref``s.
+
+    Returns:
+        Validator: The validator function.
+    """
+    root = schema if root is None else root
+    compiled = {} if compiled is None else compiled
+    checks: List[Validator] = []
+
+    if "$ref" in schema:
+        ref = schema["$ref"]
+        if ref not in compiled:
+            target: Any = root
+            for part in ref.lstrip("#/").split("/"):
+                target = target[part]
+            placeholder: List[Validator] = []
+            compiled[ref] = lambda value, path, errors: placeholder[0](
+                value, path, errors
+            )
+            placeholder.append(compile_schema(target, root, compiled))
+        checks.append(compiled[ref])
+
+    if "type" in schema:
+        names = schema["type"]
+        names = [names] if isinstance(names, str) else list(names)
+        tests = [_TYPES[name] for name in names]
+        expected = " or ".join(names)
+
+        def check_type(value: Any, path: str, errors: List[str]) -> None:
+            if not any(test(value) for test in tests):
+                errors.append(
+                    f"{path}: expected {expected}, "
+                    f"got {type(value).__name__}"
+                )
+
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = schema["enum"]
+
+        def check_enum(value: Any, path: str, errors: List[str]) -> None:
+            if value not in allowed:
+                errors.append(f"{path}: {value!r} is not one of {allowed}")
+
+        checks.append(check_enum)
+
+    if "anyOf" in schema:
+        options = [
+            compile_schema(option, root, compiled)
+            for option in schema["anyOf"]
+        ]
+
+        def check_any(value: Any, path: str, errors: List[str]) -> None:
+            # Report the option matching the value type with the
+            # fewest errors.
+            mismatch = f"{path}: expected "
+            best: Optional[List[str]] = None
+            best_rank = None
+            for option in options:
+                found: List[str] = []
+                option(value, path, found)
+                if not found:
+                    return
+                rank = (
+                    any(error.startswith(mismatch) for error in found),
+                    len(found),
+                )
+                if best_rank is None or rank < best_rank:
+                    best, best_rank = found, rank
+            errors.extend(best or [])
+
+        checks.append(check_any)
+
+    required = schema.get("required", [])
+    properties = {
+        name: compile_schema(subschema, root, compiled)
+        for name, subschema in schema.get("properties", {}).items()
+    }
+    closed = schema.get("additionalProperties") is False
+    if required or properties or closed:
+
+        def check_object(value: Any, path: str, errors: List[str]) -> None:
+            if not isinstance(value, dict):
+                return
+            for name in required:
+                if name not in value:
+                    errors.append(f"{path}: missing required {name!r}")
+            for name, item in value.items():
+                check = properties.get(name)
+                if check is not None:
+                    check(item, f"{path}.{name}", errors)
+                elif closed:
+                    errors.append(f"{path}: unexpected property {name!r}")
+
+        checks.append(check_object)
+
+    if "items" in schema:
+        check_item = compile_schema(schema["items"], root, compiled)
+
+        def check_items(value: Any, path: str, errors: List[str]) -> None:
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    check_item(item, f"{path}[{index}]", errors)
+
+        checks.append(check_items)
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def validate(value: Any, path: str, errors: List[str]) -> None:
+        for check in checks:
+            check(value, path, errors)
+
+    return validate
+
+
+@lru_cache(maxsize=None)
+def compile_postman_validator(definition: str) -> Validator:
+    """
+    Compile, once per process, the validator of a Postman v2.1
+    schema definition.
+
+    Args:
+        definition (str): The definition name, e.g. ``item``.
+
+    Returns:
+        Validator: The cached validator function.
+    """
+    return compile_schema(
+        {"$ref": f"#/definitions/{definition}"},
+        POSTMAN_SCHEMA,
+    )
+
+
+class CollectionValidator:
+    """
+    Validates a Postman collection against the v2.1 schema while it is
+    built: every request item is checked once as it is produced, and
+    the collection shell is checked without walking the items again.
+
+    Violations in ``KNOWN_DEVIATIONS`` go to ``warnings``, all others
+    to ``errors``.
+    """
+
+    def __init__(self) -> None:
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self._item = compile_postman_validator("item")
+        self._collection = compile_postman_validator("collection")
+
+    def validate_item(self, item: Dict[str, Any], path: str) -> None:
+        """
+        Validate a request item.
+
+        Args:
+            item (Dict[str, Any]): The Postman item.
+            path (str): The location of the item, for error messages.
+        """
+        found: List[str] = []
+        self._item(item, path, found)
+        for error in found:
+            if error[len(path):].startswith(KNOWN_DEVIATIONS):
+                self.warnings.append(error)
+            else:
+                self.errors.append(error)
+
+    def validate_collection(self, collection: Dict[str, Any]) -> None:
+        """
+        Validate the collection info, auth and folders, skipping the
+        request items already checked by ``validate_item``.
+
+        Args:
+            collection (Dict[str, Any]): The Postman collection.
+        """
+        shell = dict(collection)
+        shell["item"] = [
+            dict(folder, item=[])
+            if isinstance(folder, dict) and "item" in folder
+            else folder
+            for folder in collection.get("item", [])
+        ]
+        self._collection(shell, "collection", self.errors)
+
+    def log_errors(self, limit: int = 20) -> None:
+        """
+        Log the validation errors.
+
+        Args:
+            limit (int): The maximum number of errors to log.
+        """
+        for error in self.errors[:limit]:
+            logger.error(
+                f"Postman schema violation: {error}"
+            )
+        if len(self.errors) > limit:
+            logger.error(
+                f"... and {len(self.errors) - limit} more violations"
+            )
+
+    def log_warnings(self) -> None:
+        """
+        Log a summary of the known deviations from the schema.
+        """
+        if self.warnings:
+            logger.warning(
+                f"{len(self.warnings)} known deviations from the Postman "
+                f"schema (request params and responses, object raw bodies)"
+            )
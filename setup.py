@@ -13,9 +13,14 @@ setup(
         "pydantic",
         "requests"
     ],
+    extras_require={
+        "smoke": [
+            "httpx"
+        ],
+    },
     entry_points={
         "console_scripts": [
-            "fast-man=fast_man.converter:main",
+            "fast-man=fast_man.cli:main",
         ],
     },
     classifiers=[
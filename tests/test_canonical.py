@@ -0,0 +1,138 @@
+import copy
+import json
+import os
+import subprocess
+import sys
+from fastapi import FastAPI
+from fast_man.canonical import (
+    HASH_KEY,
+    canonicalize_collection,
+    content_hash,
+    sort_keys,
+)
+from fast_man.converter import build_postman_collection, main
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    zeta: str
+    alpha: int
+
+
+def _app(reverse=False):
+    app = FastAPI()
+    routes = [
+        ("/zebras", "zebras", ["Zoo"]),
+        ("/items/{item_id}", "item", ["Items"]),
+        ("/apes", "apes", ["Zoo"]),
+    ]
+    for path, name, tags in reversed(routes) if reverse else routes:
+
+        def endpoint(item_id: int = 0, q: str = "", b: int = 0) -> Item:
+            return Item(zeta="", alpha=0)
+
+        app.add_api_route(
+            path,
+            endpoint,
+            name=name,
+            tags=tags,
+            response_model=Item,
+            status_code=200,
+        )
+    return app
+
+
+app = _app()
+
+
+def test_sort_keys():
+    value = sort_keys({"b": {"d": 1, "c": 2}, "a": [{"f": 1, "e": 2}]})
+    assert list(value) == ["a", "b"]
+    assert list(value["b"]) == ["c", "d"]
+    assert list(value["a"][0]) == ["e", "f"]
+
+
+def test_canonical_output_ignores_route_order():
+    first, second = (
+        build_postman_collection(
+            _app(reverse),
+            readme_file="missing.md",
+            canonical=True,
+        )
+        for reverse in (False, True)
+    )
+    assert first == second
+    assert [folder["name"] for folder in first["item"]] == ["Items", "Zoo"]
+    assert [item["name"] for item in first["item"][1]["item"]] == [
+        "apes",
+        "zebras",
+    ]
+    item = first["item"][0]["item"][0]
+    assert [
+        (param["in"], param["name"]) for param in item["request"]["params"]
+    ] == [("path", "item_id"), ("query", "b"), ("query", "q")]
+    schema = item["request"]["responses"]["200"]["content"][
+        "application/json"
+    ]["schema"]
+    assert list(schema) == sorted(schema)
+    assert list(schema["properties"]) == ["alpha", "zeta"]
+
+
+def test_hashes_track_content():
+    collection = build_postman_collection(
+        app,
+        readme_file="missing.md",
+        canonical=True,
+    )
+    item = collection["item"][1]["item"][0]
+    assert item[HASH_KEY] == content_hash(item)
+    collection_hash = collection["info"][HASH_KEY]
+
+    again = canonicalize_collection(copy.deepcopy(collection))
+    assert again["info"][HASH_KEY] == collection_hash
+
+    item["request"]["description"] = "changed"
+    canonicalize_collection(collection)
+    assert item[HASH_KEY] == content_hash(item)
+    assert collection["info"][HASH_KEY] != collection_hash
+
+
+def test_cli_canonical_is_stable_across_processes(tmp_path):
+    outputs = []
+    for seed in ("1", "2"):
+        output_file = tmp_path / f"collection_{seed}.json"
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "fast_man.cli",
+                "--app",
+                "tests.test_canonical:app",
+                "--output",
+                str(output_file),
+                "--readme",
+                str(tmp_path / "missing.md"),
+                "--canonical",
+            ],
+            check=True,
+            capture_output=True,
+            env=dict(os.environ, PYTHONHASHSEED=seed),
+        )
+        outputs.append(output_file.read_bytes())
+    assert outputs[0] == outputs[1]
+    assert HASH_KEY in json.loads(outputs[0])["info"]
+
+
+def test_cli_without_canonical_has_no_hashes(tmp_path):
+    output_file = tmp_path / "collection.json"
+    main(
+        [
+            "--app",
+            "tests.test_canonical:app",
+            "--output",
+            str(output_file),
+            "--readme",
+            str(tmp_path / "missing.md"),
+        ]
+    )
+    assert HASH_KEY not in output_file.read_text()
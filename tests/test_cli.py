@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import time
+import pytest
+
+HEAVY_MODULES = ("fastapi", "pydantic", "starlette")
+
+# Cold-start budget of ``python -m fast_man.cli --help``, in seconds.
+STARTUP_BUDGET = float(os.environ.get("FAST_MAN_STARTUP_BUDGET", "1.0"))
+
+
+def _imported_modules(argv):
+    script = (
+        "import sys\n"
+        "from fast_man.cli import main\n"
+        "try:\n"
+        f"    main({argv!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(' '.join(sorted(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--help"],
+        [],
+        ["diff", "--help"],
+        ["push", "--app", "core.main:app"],
+        ["client", "--help"],
+    ],
+)
+def test_cli_does_not_import_fastapi_before_running(argv):
+    modules = _imported_modules(argv)
+    assert not modules & set(HEAVY_MODULES)
+
+
+def test_cli_help_startup_budget():
+    command = [sys.executable, "-m", "fast_man.cli", "--help"]
+    subprocess.run(command, capture_output=True, check=True)
+    elapsed = []
+    for _ in range(3):
+        start = time.perf_counter()
+        subprocess.run(command, capture_output=True, check=True)
+        elapsed.append(time.perf_counter() - start)
+    assert min(elapsed) < STARTUP_BUDGET
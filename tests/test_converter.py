@@ -17,7 +17,11 @@ from fastapi.security import (
     OAuth2PasswordRequestForm,
 )
 from fastapi.testclient import TestClient
-from fast_man.converter import generate_postman_collection
+from fast_man import converter
+from fast_man.converter import (
+    build_postman_collection,
+    generate_postman_collection,
+)
 from pydantic import BaseModel, Field
 import pytest
 from typing import Optional
@@ -669,3 +673,43 @@ def test_generate_postman_collection_with_auth(
         "name": "test",
         "description": "test description",
     }
+
+
+def test_multi_method_routes_get_one_item_per_method(monkeypatch):
+    multi_app = FastAPI()
+
+    @multi_app.api_route(
+        "/things/{thing_id}",
+        methods=["GET", "HEAD", "PUT"],
+        tags=["Things"],
+        status_code=200,
+    )
+    def thing(thing_id: int, q: str = "") -> Item:
+        return Item(name="", description="")
+
+    calls = []
+    get_responses = converter.get_responses
+
+    def counted(*args):
+        calls.append(args[0].path)
+        return get_responses(*args)
+
+    monkeypatch.setattr(converter, "get_responses", counted)
+    collection = build_postman_collection(
+        multi_app,
+        readme_file="missing.md",
+    )
+    items = collection["item"][0]["item"]
+    assert [item["request"]["method"] for item in items] == [
+        "GET",
+        "HEAD",
+        "PUT",
+    ]
+    assert calls == ["/things/{thing_id}"]
+    requests = [item["request"] for item in items]
+    assert all(
+        request["params"] is requests[0]["params"]
+        and request["responses"] is requests[0]["responses"]
+        for request in requests
+    )
+    assert requests[0] is not requests[1]
@@ -0,0 +1,164 @@
+import json
+from fastapi import FastAPI
+from fast_man.collection import iter_collection_items, walk_collection
+from fast_man.converter import (
+    build_postman_collection,
+    generate_postman_collection,
+    main,
+)
+from fast_man.diff import diff_collections
+
+
+def make_app(version: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}", tags=["Items"], summary=f"v{version}")
+    async def read_item(item_id: int):
+        return {"item_id": item_id}
+
+    @app.post("/items/", tags=["Items"])
+    async def create_item(name: str):
+        return {"name": name}
+
+    if version == 1:
+        @app.delete("/items/{item_id}", tags=["Items"])
+        async def delete_item(item_id: int):
+            return {}
+
+        @app.get("/legacy", tags=["Legacy"])
+        async def legacy():
+            return {}
+    else:
+        @app.get("/users/me", tags=["Users"])
+        async def read_users_me():
+            return {}
+
+        @app.put("/items/{item_id}", tags=["Items"])
+        async def update_item(item_id: int):
+            return {}
+
+    return app
+
+
+app_v2 = make_app(2)
+
+
+def apply_patch(document, patch):
+    for operation in patch:
+        *parents, last = operation["path"].split("/")[1:]
+        target = document
+        for part in parents:
+            target = target[int(part) if isinstance(target, list) else part]
+        if operation["op"] == "remove":
+            del target[int(last)]
+        elif operation["op"] == "replace":
+            target[int(last)] = operation["value"]
+        elif last == "-":
+            target.append(operation["value"])
+        else:
+            target.insert(int(last), operation["value"])
+    return document
+
+
+def items_by_folder(collection):
+    return sorted(
+        (folders, json.dumps(item, sort_keys=True))
+        for folders, _, item in walk_collection(collection)
+    )
+
+
+def test_diff_collections(tmp_path):
+    old_file = tmp_path / "old.json"
+    generate_postman_collection(
+        make_app(1),
+        str(old_file),
+        "Test API",
+        "http://testserver"
+    )
+    new = build_postman_collection(
+        app_v2,
+        "Test API",
+        "http://testserver"
+    )
+
+    result = diff_collections(
+        iter_collection_items(str(old_file)),
+        new,
+        "http://testserver",
+    )
+
+    assert result["added"] == [
+        "GET /users/me",
+        "PUT /items/{item_id}",
+    ]
+    assert result["removed"] == [
+        "DELETE /items/{item_id}",
+        "GET /legacy",
+    ]
+    assert result["changed"] == ["GET /items/{item_id}"]
+
+    with open(old_file) as f:
+        old = json.load(f)
+    patched = apply_patch(old, result["patch"])
+    assert [folder["name"] for folder in patched["item"]] == [
+        "Items",
+        "Users",
+    ]
+    assert items_by_folder(patched) == items_by_folder(new)
+
+
+def test_diff_command(tmp_path, capsys):
+    old_file = tmp_path / "old.json"
+    patch_file = tmp_path / "patch.json"
+    generate_postman_collection(
+        app_v2,
+        str(old_file),
+        "Test API",
+        "http://testserver"
+    )
+
+    main(
+        [
+            "diff",
+            str(old_file),
+            "--app",
+            "tests.test_diff:app_v2",
+            "--host",
+            "http://testserver",
+            "--patch",
+            str(patch_file),
+        ]
+    )
+
+    assert json.loads(capsys.readouterr().out) == {
+        "added": [],
+        "removed": [],
+        "changed": [],
+    }
+    with open(patch_file) as f:
+        assert json.load(f) == []
+
+
+def test_diff_ignores_canonical_hashes(tmp_path):
+    old_file = tmp_path / "old.json"
+    generate_postman_collection(
+        app_v2,
+        str(old_file),
+        "Test API",
+        "http://testserver",
+        canonical=True,
+    )
+    new = build_postman_collection(
+        app_v2,
+        "Test API",
+        "http://testserver"
+    )
+
+    result = diff_collections(
+        iter_collection_items(str(old_file)),
+        new,
+        "http://testserver",
+    )
+
+    assert result["changed"] == []
+    assert result["patch"] == []
@@ -0,0 +1,76 @@
+import json
+import os
+from fastapi import FastAPI
+from fast_man import docs
+from fast_man.converter import main
+from fast_man.docs import get_folder_doc, read_doc
+
+app = FastAPI()
+
+
+@app.get("/users", tags=["User Accounts"])
+def list_users():
+    return []
+
+
+@app.get("/items", tags=["Items"])
+def list_items():
+    return []
+
+
+def test_read_doc_is_cached_by_mtime(tmp_path, monkeypatch):
+    path = tmp_path / "Items.md"
+    path.write_text("# Items")
+    assert read_doc(str(path)) == "# Items"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("file read again")
+
+    monkeypatch.setattr(docs, "open", fail, raising=False)
+    assert read_doc(str(path)) == "# Items"
+    monkeypatch.undo()
+
+    path.write_text("# Items v2")
+    os.utime(path, ns=(0, 10**9))
+    assert read_doc(str(path)) == "# Items v2"
+    assert read_doc(str(tmp_path / "missing.md")) is None
+
+
+def test_get_folder_doc_by_name_or_slug(tmp_path):
+    (tmp_path / "user-accounts.md").write_text("Accounts")
+    (tmp_path / "Items.md").write_text("Items")
+    assert get_folder_doc(str(tmp_path), "User Accounts") == "Accounts"
+    assert get_folder_doc(str(tmp_path), "Items") == "Items"
+    assert get_folder_doc(str(tmp_path), "Orders") is None
+
+
+def test_cli_docs_dir(tmp_path, monkeypatch):
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    (docs_dir / "user-accounts.md").write_text("# Accounts")
+    (docs_dir / "Unused.md").write_text("# Unused")
+    read = []
+    monkeypatch.setattr(
+        docs,
+        "read_doc",
+        lambda path, read_doc=read_doc: read.append(path) or read_doc(path),
+    )
+    output_file = tmp_path / "collection.json"
+    main(
+        [
+            "--app",
+            "tests.test_docs:app",
+            "--output",
+            str(output_file),
+            "--readme",
+            str(tmp_path / "missing.md"),
+            "--docs-dir",
+            str(docs_dir),
+        ]
+    )
+    with open(output_file) as f:
+        collection = json.load(f)
+    folders = {folder["name"]: folder for folder in collection["item"]}
+    assert folders["User Accounts"]["description"] == "# Accounts"
+    assert "description" not in folders["Items"]
+    assert not any(path.endswith("Unused.md") for path in read)
@@ -0,0 +1,118 @@
+import collections
+import dataclasses
+import datetime
+import decimal
+import enum
+import ipaddress
+import json
+import pathlib
+import re
+import uuid
+import warnings
+from fastapi import FastAPI, Query
+from fastapi.encoders import jsonable_encoder
+from fast_man.converter import build_postman_collection
+from fast_man.encoding import encode, json_default
+from pydantic import AnyUrl, BaseModel, NameEmail, SecretStr
+from pydantic.color import Color as PydanticColor
+from pydantic_core import PydanticUndefined
+
+
+class Color(str, enum.Enum):
+    red = "red"
+    blue = "blue"
+
+
+class Point(BaseModel):
+    x: int
+    y: int
+
+
+@dataclasses.dataclass
+class Size:
+    width: int
+    unit: str
+
+
+class Box:
+    def __init__(self):
+        self.depth = 2
+
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    RED = PydanticColor("red")
+
+
+VALUES = {
+    "color": Color.red,
+    "point": Point(x=1, y=2),
+    "tags": {"a"},
+    "pair": (1, 2.5),
+    "when": datetime.datetime(2024, 1, 1, 12, 30),
+    "day": datetime.date(2024, 1, 1),
+    "price": decimal.Decimal("1.5"),
+    "count": decimal.Decimal("3"),
+    "id": uuid.UUID(int=1),
+    "nested": [{"color": Color.blue, "none": None, "flag": True}],
+    "ipv4": ipaddress.IPv4Address("127.0.0.1"),
+    "ipv6": ipaddress.IPv6Address("::1"),
+    "network": ipaddress.IPv4Network("10.0.0.0/8"),
+    "interface": ipaddress.IPv6Interface("::1/128"),
+    "pattern": re.compile("^a+$"),
+    "queue": collections.deque([1, 2]),
+    "path": pathlib.PurePosixPath("/tmp/a"),
+    "pydantic_color": RED,
+    "email": NameEmail("Ann", "ann@example.com"),
+    "secret": SecretStr("hidden"),
+    "url": AnyUrl("https://example.com"),
+    "size": Size(width=3, unit="cm"),
+    "box": Box(),
+}
+
+
+def test_encode_matches_jsonable_encoder():
+    assert encode(VALUES) == jsonable_encoder(VALUES)
+
+
+def test_encode_undefined_and_native_values():
+    assert encode(PydanticUndefined) is None
+    schema = {"type": "object", "properties": {"a": {"type": "string"}}}
+    assert encode(schema) == schema
+
+
+def test_json_default_folds_into_serialisation():
+    assert json.loads(json.dumps(VALUES, default=json_default)) == (
+        jsonable_encoder(VALUES)
+    )
+    value = object()
+    assert json.loads(json.dumps({"value": value}, default=json_default)) == (
+        {"value": str(value)}
+    )
+
+
+def test_collection_parameters_are_encoded():
+    app = FastAPI()
+
+    @app.get("/paint", tags=["Paint"])
+    def paint(color: Color = Color.blue, size: int = 1):
+        return {}
+
+    collection = build_postman_collection(app, readme_file="missing.md")
+    params = collection["item"][0]["item"][0]["request"]["params"]
+    assert [param["schema"]["default"] for param in params] == ["blue", 1]
+    assert type(params[0]["schema"]["default"]) is str
+
+
+def test_unusual_parameter_defaults_keep_the_route():
+    app = FastAPI()
+
+    @app.get("/ping", tags=["Net"])
+    def ping(
+        ip: ipaddress.IPv4Address = Query(ipaddress.IPv4Address("127.0.0.1"))
+    ):
+        return {}
+
+    collection = build_postman_collection(app, readme_file="missing.md")
+    params = collection["item"][0]["item"][0]["request"]["params"]
+    assert params[0]["schema"]["default"] == "127.0.0.1"
@@ -0,0 +1,117 @@
+import datetime
+import enum
+from typing import Dict, List, Literal, Optional
+import uuid
+from fastapi import FastAPI
+from fast_man import examples
+from fast_man.examples import compile_model_example, model_example
+from fast_man.utils import get_request_body_example
+from pydantic import BaseModel, Field
+
+
+class Color(str, enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Tag(BaseModel):
+    label: str = Field(..., min_length=2, max_length=4)
+
+
+class Node(BaseModel):
+    name: str
+    children: List["Node"] = []
+    parent: Optional["Node"] = None
+
+
+class Order(BaseModel):
+    id: uuid.UUID
+    quantity: int = Field(..., ge=10, le=20)
+    price: float = Field(..., gt=0, lt=1)
+    color: Color
+    kind: Literal["online", "store"]
+    status: str = "pending"
+    note: Optional[str] = Field(None, examples=["Leave at the door"])
+    created_at: datetime.datetime
+    tags: List[Tag]
+    extra: Dict[str, int]
+    owner_name: str = Field(..., alias="ownerName")
+
+
+def test_model_example_follows_types_and_constraints():
+    example = model_example(Order, seed=1)
+
+    assert set(example) == {
+        "id",
+        "quantity",
+        "price",
+        "color",
+        "kind",
+        "status",
+        "note",
+        "created_at",
+        "tags",
+        "extra",
+        "ownerName",
+    }
+    uuid.UUID(example["id"])
+    assert 10 <= example["quantity"] <= 20
+    assert 0 <= example["price"] <= 1
+    assert example["color"] in ("red", "blue")
+    assert example["kind"] in ("online", "store")
+    assert example["status"] == "pending"
+    assert example["note"] == "Leave at the door"
+    datetime.datetime.fromisoformat(example["created_at"])
+    assert 2 <= len(example["tags"][0]["label"]) <= 4
+    assert isinstance(example["extra"]["key"], int)
+    Order.model_validate(example)
+
+
+class Bounded(BaseModel):
+    p: float = Field(gt=0, lt=0.01)
+    r: float = Field(ge=1, lt=1.001)
+    s: str = Field(pattern="^[A-Z]{3}$")
+    code: str = Field(pattern=r"^(EU|US)-\d{2,4}$")
+
+
+class UpperBounded(BaseModel):
+    neg: int = Field(le=-5)
+    negf: float = Field(lt=0)
+    mul: float = Field(multiple_of=0.5)
+    step: int = Field(gt=-3, multiple_of=7)
+    code: str = Field(pattern="^[a-z]+$", max_length=2)
+
+
+def test_model_example_respects_exclusive_bounds_and_patterns():
+    for seed in range(50):
+        Bounded.model_validate(model_example(Bounded, seed=seed))
+
+
+def test_model_example_respects_upper_bounds_multiples_and_lengths():
+    for seed in range(50):
+        UpperBounded.model_validate(model_example(UpperBounded, seed=seed))
+
+
+def test_model_example_is_deterministic_and_cached():
+    assert model_example(Order, seed=3) == model_example(Order, seed=3)
+    assert model_example(Order, seed=3) != model_example(Order, seed=4)
+    assert compile_model_example(Order) is compile_model_example(Order)
+    assert Order in examples._model_generators
+
+
+def test_model_example_stops_recursion():
+    example = model_example(Node)
+    Node.model_validate(example)
+
+
+def test_get_request_body_example_synthesises_bodies():
+    app = FastAPI()
+
+    @app.post("/orders")
+    async def create_order(order: Order):
+        return order
+
+    route = app.routes[-1]
+    assert get_request_body_example(route, seed=7) == model_example(
+        Order, seed=7
+    )
@@ -0,0 +1,139 @@
+import json
+import os
+import time
+from fastapi import FastAPI
+from fast_man.converter import build_postman_collection, main
+from fast_man.isolation import STUB_KEY, isolation_supported, run_isolated
+from fast_man.report import GenerationReport
+from pydantic import BaseModel
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not isolation_supported(), reason="fork() is not available"
+)
+
+
+class Item(BaseModel):
+    name: str
+
+
+class SlowItem(BaseModel):
+    name: str
+
+    @classmethod
+    def model_json_schema(cls, *args, **kwargs):
+        time.sleep(30)
+        return super().model_json_schema(*args, **kwargs)
+
+
+class CrashingItem(BaseModel):
+    name: str
+
+    @classmethod
+    def model_json_schema(cls, *args, **kwargs):
+        os._exit(3)
+
+
+app = FastAPI()
+
+
+@app.get("/items", tags=["Items"], response_model=Item)
+def list_items():
+    return {"name": ""}
+
+
+@app.get("/slow", tags=["Items"], response_model=SlowItem)
+def slow():
+    return {"name": ""}
+
+
+@app.api_route(
+    "/crash",
+    methods=["GET", "DELETE"],
+    tags=["Items"],
+    response_model=CrashingItem,
+)
+def crash():
+    return {"name": ""}
+
+
+def _fail():
+    raise ValueError("bad route")
+
+
+def test_run_isolated():
+    start = time.monotonic()
+    results = run_isolated(
+        [lambda: {"value": 1}, lambda: time.sleep(30), _fail],
+        timeout=0.5,
+        workers=2,
+    )
+    assert time.monotonic() - start < 10
+    assert results == [
+        (True, {"value": 1}),
+        (False, "exceeded the 0.5 s time budget"),
+        (False, "failed: ValueError: bad route"),
+    ]
+
+
+def test_over_budget_routes_are_stubbed():
+    report = GenerationReport()
+    collection = build_postman_collection(
+        app,
+        readme_file="missing.md",
+        report=report,
+        route_timeout=2,
+    )
+    items = {
+        f"{item['request']['method']} {item['request']['url']}": item
+        for item in collection["item"][0]["item"]
+    }
+    assert list(items) == [
+        "GET http://localhost/items",
+        "GET http://localhost/slow",
+        "DELETE http://localhost/crash",
+        "GET http://localhost/crash",
+    ]
+    assert STUB_KEY not in items["GET http://localhost/items"]
+    assert items["GET http://localhost/items"]["request"]["responses"]
+    assert items["GET http://localhost/slow"][STUB_KEY] == (
+        "exceeded the 2 s time budget"
+    )
+    for method in ("DELETE", "GET"):
+        assert items[f"{method} http://localhost/crash"][STUB_KEY] == (
+            "worker exited with code 3"
+        )
+    assert [entry["route"] for entry in report.routes] == ["GET /items"]
+    assert [model["model"] for model in report.models.values()] == ["Item"]
+    assert report.to_dict()["stubs"] == [
+        {"route": "GET /slow", "reason": "exceeded the 2 s time budget"},
+        {"route": "DELETE /crash", "reason": "worker exited with code 3"},
+        {"route": "GET /crash", "reason": "worker exited with code 3"},
+    ]
+    assert "Stub items (3):" in report.summary()
+
+
+def test_cli_route_timeout(tmp_path):
+    output_file = tmp_path / "collection.json"
+    main(
+        [
+            "--app",
+            "tests.test_isolation:app",
+            "--output",
+            str(output_file),
+            "--readme",
+            str(tmp_path / "missing.md"),
+            "--route-timeout",
+            "1",
+        ]
+    )
+    with open(output_file) as f:
+        collection = json.load(f)
+    assert [
+        item.get(STUB_KEY) for item in collection["item"][0]["item"]
+    ] == [
+        None,
+        "exceeded the 1 s time budget",
+        "worker exited with code 3",
+        "worker exited with code 3",
+    ]
@@ -0,0 +1,110 @@
+import csv
+import json
+import re
+from typing import Optional
+from fastapi import FastAPI, Query
+from fast_man.converter import main
+from fast_man.iterations import compile_route_rows, write_iterations
+from pydantic import BaseModel, Field
+
+
+class Item(BaseModel):
+    name: str
+    price: float = Field(..., ge=1, le=5)
+
+
+app = FastAPI()
+
+
+@app.get("/items/{item_id}", tags=["Items"])
+async def read_item(
+    item_id: int,
+    q: Optional[str] = Query(None, max_length=3),
+):
+    return {"item_id": item_id}
+
+
+@app.post("/items/", tags=["Items"])
+async def create_item(item: Item, dry_run: bool = False):
+    return item
+
+
+def test_compile_route_rows():
+    columns, generate = compile_route_rows(app.routes[-1])
+    assert columns == ["dry_run", "body"]
+
+
+def test_write_iterations_csv(tmp_path):
+    written = write_iterations(app, str(tmp_path), 500, "csv", seed=1)
+
+    assert [path.rsplit("/", 1)[-1] for path in written] == [
+        "read_item.csv",
+        "create_item.csv",
+    ]
+    with open(written[0], newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 500
+    assert list(rows[0]) == ["item_id", "q"]
+    assert all(int(row["item_id"]) > 0 for row in rows)
+    assert all(len(row["q"]) <= 3 for row in rows)
+
+    with open(written[1], newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["dry_run"] in ("true", "false")
+    assert 1 <= json.loads(rows[0]["body"])["price"] <= 5
+
+
+def test_iterations_command(tmp_path):
+    main(
+        [
+            "--app",
+            "tests.test_iterations:app",
+            "--output",
+            str(tmp_path / "collection.json"),
+            "--iterations",
+            "3",
+            "--iterations-dir",
+            str(tmp_path / "data"),
+            "--iterations-format",
+            "json",
+        ]
+    )
+
+    with open(tmp_path / "data" / "create_item.json") as f:
+        rows = json.load(f)
+    assert len(rows) == 3
+    assert set(rows[0]) == {"dry_run", "body"}
+    assert set(json.loads(rows[0]["body"])) == {"name", "price"}
+
+    with open(tmp_path / "collection.json") as f:
+        collection = json.load(f)
+    items = {
+        item["name"]: item["request"]
+        for item in collection["item"][0]["item"]
+    }
+    assert items["read_item"]["url"] == (
+        "http://localhost/items/{{item_id}}?q={{q}}"
+    )
+    assert items["create_item"]["url"] == (
+        "http://localhost/items/?dry_run={{dry_run}}"
+    )
+    assert items["create_item"]["body"]["raw"] == "{{body}}"
+
+    # Newman substitutes every column of a row into the item.
+    for name, request in items.items():
+        with open(tmp_path / "data" / f"{name}.json") as f:
+            row = json.load(f)[0]
+        text = json.dumps(request)
+        assert set(re.findall(r"\{\{(\w+)\}\}", text)) == set(row)
+
+
+def test_collection_without_iterations_has_no_variables(tmp_path):
+    main(
+        [
+            "--app",
+            "tests.test_iterations:app",
+            "--output",
+            str(tmp_path / "collection.json"),
+        ]
+    )
+    assert "{{item_id}}" not in (tmp_path / "collection.json").read_text()
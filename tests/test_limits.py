@@ -0,0 +1,116 @@
+import json
+import logging
+from typing import List, Optional
+from fastapi import FastAPI
+from fast_man.converter import main
+from fast_man.limits import TRUNCATED_KEY, json_size, limit_schema
+from fast_man.report import schema_depth
+from pydantic import BaseModel
+import pytest
+
+
+class Leaf(BaseModel):
+    name: str
+    note: Optional[str] = None
+
+
+class Branch(BaseModel):
+    title: str
+    leaves: List[Leaf]
+
+
+class Tree(BaseModel):
+    branches: List[Branch]
+    labels: List[str] = []
+
+
+app = FastAPI()
+
+
+@app.get(
+    "/trees",
+    response_model=Tree,
+    status_code=200,
+    tags=["Trees"],
+)
+def get_tree():
+    return {"branches": []}
+
+
+@app.post("/trees", tags=["Trees"])
+def create_tree(tree: Tree):
+    return tree
+
+
+@app.get("/ping", tags=["Health"])
+def ping():
+    return {}
+
+
+@pytest.mark.parametrize(
+    "value",
+    [{}, [], "é", {"a": [1, "x", None, {"b": True}], "c": {}}, [[], [{}]]],
+)
+def test_json_size_matches_compact_encoding(value):
+    assert json_size(value) == len(
+        json.dumps(value, separators=(",", ":")).encode()
+    )
+
+
+def test_json_size_stops_at_limit():
+    value = ["x" * 1000] * 3
+    assert 10 < json_size(value, limit=10) < json_size(value)
+
+
+def test_limit_schema_depth():
+    schema = {"type": "object", "properties": {"a": {"type": "object"}}}
+    assert limit_schema(schema, max_depth=3) == (schema, None)
+    limited, reason = limit_schema(schema, max_depth=1)
+    assert reason == "depth > 1"
+    assert limited == {
+        "type": "object",
+        "properties": {TRUNCATED_KEY: "nested deeper than 1"},
+    }
+
+
+def test_limit_schema_bytes():
+    schema = {"title": "Big", "type": "object", "enum": ["x" * 100]}
+    limited, reason = limit_schema(schema, max_bytes=64)
+    assert reason == "size > 64 bytes"
+    assert limited == {
+        "title": "Big",
+        "type": "object",
+        TRUNCATED_KEY: "larger than 64 bytes",
+    }
+
+
+def test_cli_schema_budgets(tmp_path, caplog):
+    output_file = tmp_path / "collection.json"
+    with caplog.at_level(logging.WARNING, logger="fast_man.utils"):
+        main(
+            [
+                "--app",
+                "tests.test_limits:app",
+                "--output",
+                str(output_file),
+                "--readme",
+                str(tmp_path / "missing.md"),
+                "--max-schema-depth",
+                "4",
+                "--max-schema-bytes",
+                "2000",
+            ]
+        )
+    with open(output_file) as f:
+        collection = json.load(f)
+    folders = {folder["name"]: folder for folder in collection["item"]}
+    get_tree, create_tree = folders["Trees"]["item"]
+    schema = get_tree["request"]["responses"]["200"]["content"][
+        "application/json"
+    ]["schema"]
+    assert schema_depth(schema) <= 5
+    assert TRUNCATED_KEY in json.dumps(schema)
+    assert json_size(schema) <= 2000
+    assert folders["Health"]["item"][0]["request"]["responses"] == {}
+    assert "Truncated 200 response schema of /trees" in caplog.text
+    assert "/ping" not in caplog.text
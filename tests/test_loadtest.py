@@ -0,0 +1,99 @@
+import shutil
+import subprocess
+from fastapi import FastAPI, Header
+from fast_man.converter import build_postman_collection, main
+from fast_man.loadtest import extract_load_requests, render_locust
+from pydantic import BaseModel
+import pytest
+
+
+class Order(BaseModel):
+    sku: str
+    quantity: int = 1
+
+
+app = FastAPI()
+
+
+@app.get("/orders/{order_id}", tags=["Orders"])
+def read_order(order_id: int, expand: bool = False):
+    return {}
+
+
+@app.post("/orders", tags=["Orders"])
+def create_order(order: Order, x_tenant: str = Header(...)):
+    return order
+
+
+@app.get("/health", tags=["Health checks"])
+def health():
+    return {}
+
+
+def test_extract_load_requests():
+    collection = build_postman_collection(
+        app,
+        input_host="http://api",
+        readme_file="missing.md",
+    )
+    folders = extract_load_requests(
+        collection,
+        "http://api",
+        {"Health checks": 10},
+    )
+    assert [(folder["name"], folder["weight"]) for folder in folders] == [
+        ("Orders", 2),
+        ("Health checks", 10),
+    ]
+    read_order, create_order = folders[0]["requests"]
+    assert read_order == {
+        "name": "GET /orders/{order_id}",
+        "method": "GET",
+        "url": "/orders/1",
+        "params": {"expand": "false"},
+        "headers": {"Authorization": "Bearer {{access_token}}"},
+        "json": None,
+    }
+    assert create_order["headers"]["x_tenant"] == "{{x_tenant}}"
+    assert create_order["json"]["quantity"] == 1
+
+
+def test_render_locust_compiles():
+    collection = build_postman_collection(app, readme_file="missing.md")
+    source = render_locust(extract_load_requests(collection, "http://local"))
+    compile(source, "locustfile.py", "exec")
+    assert "class OrdersUser(FolderUser):" in source
+    assert "class HealthChecksUser(FolderUser):" in source
+    assert "    weight = 2" in source
+
+
+@pytest.mark.parametrize(
+    "file_format, output, expected",
+    [
+        ("locust", "locustfile.py", "from locust import HttpUser, task"),
+        ("k6", "k6_script.js", 'import http from "k6/http";'),
+    ],
+)
+def test_cli_load_test_formats(
+    tmp_path, monkeypatch, file_format, output, expected
+):
+    monkeypatch.chdir(tmp_path)
+    main(
+        [
+            "--app",
+            "tests.test_loadtest:app",
+            "--format",
+            file_format,
+            "--tag-weight",
+            "Orders=5",
+            "--readme",
+            "missing.md",
+        ]
+    )
+    source = (tmp_path / output).read_text()
+    assert expected in source
+    assert not (tmp_path / "postman_collection.json").exists()
+    if file_format == "k6" and shutil.which("node"):
+        script = tmp_path / "script.mjs"
+        script.write_text(source)
+        subprocess.run(["node", "--check", str(script)], check=True)
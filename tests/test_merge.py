@@ -0,0 +1,210 @@
+import json
+from fastapi import FastAPI
+from fast_man.collection import iter_collection_items, route_key
+from fast_man.converter import (
+    build_postman_collection,
+    generate_postman_collection,
+)
+from fast_man.isolation import STUB_KEY, stub_item
+from fast_man.merge import merge_item
+import pytest
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+
+    @app.get("/items/{item_id}", tags=["Items"])
+    async def read_item(item_id: int):
+        return {"item_id": item_id}
+
+    @app.post("/items/", tags=["Items"])
+    async def create_item(name: str):
+        return {"name": name}
+
+    @app.get("/users/me", tags=["Users"])
+    async def read_users_me():
+        return {}
+
+    return app
+
+
+def test_iter_collection_items_streams_nested_folders(tmp_path):
+    collection = {
+        "info": {"name": "Test API", "description": "x" * 1000},
+        "item": [
+            {
+                "name": "Items",
+                "item": [
+                    {"name": "a", "request": {"url": "/a", "method": "GET"}},
+                    {
+                        "name": "Nested",
+                        "item": [
+                            {
+                                "name": "b",
+                                "request": {"url": "/b", "method": "POST"},
+                            }
+                        ],
+                    },
+                ],
+            }
+        ],
+        "auth": {"type": "bearer"},
+    }
+    source = tmp_path / "collection.json"
+    source.write_text(json.dumps(collection, indent=4))
+
+    entries = list(iter_collection_items(str(source), chunk_size=7))
+
+    assert entries == [
+        (("Items",), (0, 0), collection["item"][0]["item"][0]),
+        (
+            ("Items", "Nested"),
+            (0, 1, 0),
+            collection["item"][0]["item"][1]["item"][0],
+        ),
+    ]
+
+
+def test_route_key():
+    item = {"request": {"url": "http://host/api/items/", "method": "post"}}
+    assert route_key(item, "http://host/api") == "POST /items/"
+    assert route_key(item) == "POST /api/items/"
+    item = {
+        "request": {"url": {"raw": "{{base_url}}/items?q=1"}, "method": "GET"}
+    }
+    assert route_key(item) == "GET /items"
+
+
+def test_merge_into_preserves_user_fields(app, tmp_path):
+    output_file = tmp_path / "postman_collection.json"
+    generate_postman_collection(
+        app,
+        str(output_file),
+        "Test API",
+        "http://testserver"
+    )
+
+    with open(output_file) as f:
+        collection = json.load(f)
+    items_folder = collection["item"][0]
+    read_item = items_folder["item"][0]
+    read_item["event"] = [
+        {
+            "listen": "test",
+            "script": {"type": "text/javascript", "exec": ["pm.test()"]},
+        }
+    ]
+    read_item["response"] = [{"name": "Saved example"}]
+    read_item["request"]["auth"] = {"type": "noauth"}
+    read_item["request"]["description"] = "Edited by hand"
+    items_folder["item"].append(
+        {
+            "name": "removed_route",
+            "request": {"url": "http://testserver/gone", "method": "GET"},
+            "event": [],
+        }
+    )
+    with open(output_file, "w") as f:
+        json.dump(collection, f)
+
+    generate_postman_collection(
+        app,
+        str(output_file),
+        "Test API",
+        "http://testserver",
+        merge_into=str(output_file),
+    )
+
+    with open(output_file) as f:
+        merged = json.load(f)
+
+    items_folder = merged["item"][0]
+    assert [item["name"] for item in items_folder["item"]] == [
+        "read_item",
+        "create_item",
+    ]
+    read_item = items_folder["item"][0]
+    assert read_item["event"][0]["script"]["exec"] == ["pm.test()"]
+    assert read_item["response"] == [{"name": "Saved example"}]
+    assert read_item["request"]["auth"] == {"type": "noauth"}
+    assert read_item["request"]["description"] == ""
+    assert "event" not in items_folder["item"][1]
+
+
+def test_merge_into_multi_tag_route_is_idempotent(tmp_path):
+    app = FastAPI()
+
+    @app.get("/shared", tags=["Items", "Users"])
+    async def shared():
+        return {}
+
+    output_file = tmp_path / "postman_collection.json"
+    generate_postman_collection(
+        app,
+        str(output_file),
+        "Test API",
+        "http://testserver"
+    )
+    with open(output_file) as f:
+        collection = json.load(f)
+    test_event = {
+        "listen": "test",
+        "script": {"type": "text/javascript", "exec": ["pm.test()"]},
+    }
+    for folder in collection["item"]:
+        folder["item"][0]["event"] = [test_event]
+    with open(output_file, "w") as f:
+        json.dump(collection, f)
+
+    for _ in range(2):
+        generate_postman_collection(
+            app,
+            str(output_file),
+            "Test API",
+            "http://testserver",
+            merge_into=str(output_file),
+        )
+        with open(output_file) as f:
+            merged = json.load(f)
+        assert [
+            folder["item"][0]["event"] for folder in merged["item"]
+        ] == [[test_event], [test_event]]
+
+
+def test_merge_into_does_not_carry_generator_markers(app, tmp_path):
+    output_file = tmp_path / "postman_collection.json"
+    generate_postman_collection(
+        app,
+        str(output_file),
+        "Test API",
+        "http://testserver",
+        canonical=True,
+    )
+
+    generate_postman_collection(
+        app,
+        str(output_file),
+        "Test API",
+        "http://testserver",
+        merge_into=str(output_file),
+    )
+
+    with open(output_file) as f:
+        merged = json.load(f)
+    for folder in merged["item"]:
+        for item in folder["item"]:
+            assert "x-fast-man-hash" not in item
+
+
+def test_merge_item_does_not_carry_stub_marker(app):
+    collection = build_postman_collection(app, "Test API", "http://testserver")
+    item = collection["item"][0]["item"][0]
+    stub = stub_item(
+        app.routes[-3], "exceeded the 2 s time budget", "http://testserver"
+    )
+
+    merge_item(item, stub)
+
+    assert STUB_KEY not in item
+    assert item["request"]["description"] != stub["request"]["description"]
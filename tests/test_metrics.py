@@ -0,0 +1,144 @@
+import json
+import logging
+from fastapi import FastAPI
+from fast_man.converter import main
+from fast_man.metrics import GenerationMetrics, peak_rss_bytes
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    name: str
+
+
+app = FastAPI()
+
+
+@app.get("/items", tags=["Items"], response_model=Item)
+def list_items():
+    return {"name": ""}
+
+
+@app.post("/items", tags=["Items"], response_model=Item)
+def create_item(item: Item):
+    return item
+
+
+@app.api_route("/users", methods=["GET", "HEAD"], tags=["Users"])
+def list_users():
+    return []
+
+
+def test_metrics_count_items_and_errors():
+    metrics = GenerationMetrics("Shop")
+    with metrics.phase("build"):
+        pass
+    with metrics.phase("build"):
+        pass
+    metrics.observe_collection(
+        {
+            "item": [
+                {
+                    "name": "Items",
+                    "item": [
+                        {"request": {"method": "GET", "url": "h/items"}},
+                        {"request": {"method": "POST", "url": "h/items"}},
+                    ],
+                },
+                {
+                    "name": "Users",
+                    "item": [
+                        {"request": {"method": "GET", "url": "h/users"}},
+                    ],
+                },
+            ]
+        },
+    )
+    metrics.observe_routes(app)
+    logging.getLogger("fast_man.converter").error("boom")
+    metrics.close()
+    logging.getLogger("fast_man.converter").error("after close")
+
+    data = metrics.to_dict()
+    assert data["routes"] == 3
+    assert data["items"] == 3
+    assert data["items_per_tag"] == {"Items": 2, "Users": 1}
+    assert set(data["duration_seconds"]) == {"build", "total"}
+    assert data["errors"] == 1
+    assert set(data["caches"]) == {
+        "model_examples",
+        "docs",
+        "postman_validators",
+    }
+
+    text = metrics.to_prometheus()
+    assert "# TYPE fast_man_routes gauge" in text
+    assert 'fast_man_routes{collection="Shop"} 3' in text
+    assert 'fast_man_items{collection="Shop",tag="Items"} 2' in text
+    assert 'fast_man_errors{collection="Shop"} 1' in text
+    assert 'phase="build"' in text
+
+
+def test_peak_rss_bytes():
+    rss = peak_rss_bytes()
+    assert rss is None or rss > 1 << 20
+
+
+def test_cli_metrics_files(tmp_path):
+    readme = tmp_path / "README.md"
+    readme.write_text("# Shop")
+    for name, metrics_format in (
+        ("metrics.prom", None),
+        ("metrics.json", None),
+        ("metrics.txt", "json"),
+    ):
+        output_file = tmp_path / "collection.json"
+        metrics_file = tmp_path / name
+        argv = [
+            "--app",
+            "tests.test_metrics:app",
+            "--output",
+            str(output_file),
+            "--readme",
+            str(readme),
+            "--metrics-file",
+            str(metrics_file),
+        ]
+        if metrics_format:
+            argv += ["--metrics-format", metrics_format]
+        main(argv)
+        text = metrics_file.read_text()
+        if name == "metrics.prom":
+            assert 'fast_man_output_bytes{collection="API Collection"} ' + (
+                str(output_file.stat().st_size)
+            ) in text
+            assert 'phase="import"' in text
+            continue
+        data = json.loads(text)
+        assert data["routes"] == 3
+        assert data["items"] == 4
+        assert data["items_per_tag"] == {"Items": 2, "Users": 2}
+        assert data["output_bytes"] == output_file.stat().st_size
+        assert {"import", "build", "write", "total"} <= set(
+            data["duration_seconds"]
+        )
+        assert data["errors"] == 0
+        assert data["caches"]["docs"]["hits"] + (
+            data["caches"]["docs"]["misses"]
+        ) == 1
+
+
+def test_cli_metrics_count_failures(tmp_path):
+    metrics_file = tmp_path / "metrics.json"
+    main(
+        [
+            "--app",
+            "tests.missing_module:app",
+            "--output",
+            str(tmp_path / "collection.json"),
+            "--metrics-file",
+            str(metrics_file),
+        ]
+    )
+    data = json.loads(metrics_file.read_text())
+    assert data["errors"] >= 1
+    assert data["output_bytes"] == 0
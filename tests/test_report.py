@@ -0,0 +1,124 @@
+import json
+from typing import List
+from fastapi import APIRouter, FastAPI
+from fast_man.converter import build_postman_collection, main
+from fast_man.report import GenerationReport, count_defs, schema_depth
+from pydantic import BaseModel
+
+
+class Leaf(BaseModel):
+    value: int
+
+
+class Branch(BaseModel):
+    leaves: List[Leaf]
+
+
+class Tree(BaseModel):
+    branches: List[Branch]
+
+
+app = FastAPI()
+
+
+@app.get("/trees/{tree_id}", tags=["Trees"], response_model=Tree)
+async def read_tree(tree_id: int):
+    return {"branches": []}
+
+
+@app.post("/leaves/", tags=["Trees"], response_model=Leaf)
+async def create_leaf(leaf: Leaf):
+    return leaf
+
+
+def test_schema_statistics():
+    schema = Tree.model_json_schema()
+    assert count_defs(schema) == 2
+    assert schema_depth({"a": [{"b": 1}]}) == 3
+    assert schema_depth(1) == 0
+
+
+def test_generation_report():
+    report = GenerationReport()
+    build_postman_collection(app, report=report)
+
+    result = report.to_dict()
+    routes = {entry["route"]: entry for entry in result["routes"]}
+    assert list(routes) == ["GET /trees/{tree_id}", "POST /leaves/"]
+    tree = routes["GET /trees/{tree_id}"]
+    assert tree["defs"] == 2
+    assert tree["response_schema_depth"] > 5
+    assert set(tree["helpers_ms"]) == {
+        "get_responses",
+        "get_headers",
+        "get_request_body_example",
+        "get_parameters",
+        "get_response_time_tests",
+    }
+    assert routes["POST /leaves/"]["body_schema_depth"] > 0
+    models = {entry["model"]: entry for entry in result["models"]}
+    assert [entry["model"] for entry in result["models"]] == [
+        "Tree",
+        "Leaf",
+    ]
+    assert models["Leaf"]["routes"] == 2
+
+    summary = report.summary(top=1)
+    assert "Heaviest routes (of 2):" in summary
+    assert "GET /trees/{tree_id}" in summary
+    assert "POST /leaves/" not in summary
+
+
+def test_report_routes_include_router_prefix():
+    router = APIRouter()
+
+    @router.get("/leaves/{leaf_id}", tags=["Trees"], response_model=Leaf)
+    async def read_leaf(leaf_id: int):
+        return {"value": leaf_id}
+
+    report = GenerationReport()
+    build_postman_collection((router, "/v1"), report=report)
+    assert [entry["route"] for entry in report.routes] == [
+        "GET /v1/leaves/{leaf_id}"
+    ]
+
+
+def test_multi_method_route_is_recorded_once():
+    multi_app = FastAPI()
+
+    @multi_app.api_route(
+        "/trees/{tree_id}",
+        methods=["GET", "HEAD"],
+        tags=["Trees"],
+        response_model=Tree,
+    )
+    async def read_tree(tree_id: int):
+        return {"branches": []}
+
+    report = GenerationReport()
+    build_postman_collection(multi_app, report=report)
+
+    entries = {entry["route"]: entry for entry in report.routes}
+    assert list(entries) == ["GET /trees/{tree_id}", "HEAD /trees/{tree_id}"]
+    get, head = entries.values()
+    assert get["helpers_ms"] == head["helpers_ms"]
+    assert set(head["helpers_ms"]) == set(get["helpers_ms"]) != set()
+    assert report.models["Tree"]["routes"] == 1
+
+
+def test_report_command(tmp_path, capsys):
+    main(
+        [
+            "--app",
+            "tests.test_report:app",
+            "--output",
+            str(tmp_path / "collection.json"),
+            "--report",
+            "--report-file",
+            str(tmp_path / "report.json"),
+        ]
+    )
+
+    assert "Heaviest models (of 2):" in capsys.readouterr().out
+    with open(tmp_path / "report.json") as f:
+        assert len(json.load(f)["routes"]) == 2
@@ -0,0 +1,134 @@
+import json
+from fastapi import APIRouter, FastAPI
+from fast_man.converter import build_postman_collection, main
+from fast_man.routes import iter_routes, route_sources
+
+users = APIRouter(prefix="/users", tags=["Users"])
+
+
+@users.get("/")
+def list_users():
+    return []
+
+
+@users.get("/{user_id}")
+def get_user(user_id: int):
+    return {}
+
+
+items = APIRouter(tags=["Items"])
+
+
+@items.post("/items")
+def create_item():
+    return {}
+
+
+@items.get("/users/{user_id}/items", tags=["Users"])
+def list_user_items(user_id: int):
+    return []
+
+
+app = FastAPI()
+app.include_router(users, prefix="/v1")
+app.include_router(items, prefix="/v1")
+
+
+def _urls(collection):
+    return {
+        folder["name"]: [
+            f"{item['request']['method']} {item['request']['url']}"
+            for item in folder["item"]
+        ]
+        for folder in collection["item"]
+    }
+
+
+def test_route_sources():
+    assert route_sources(users) == [(users, "")]
+    assert route_sources([app, (items, "/v1/")]) == [
+        (app, ""),
+        (items, "/v1"),
+    ]
+    assert route_sources([(users, "v1"), (items, "/")]) == [
+        (users, "/v1"),
+        (items, ""),
+    ]
+    assert [
+        (prefix, route.name) for prefix, route in iter_routes((users, "/v1"))
+    ] == [("/v1", "list_users"), ("/v1", "get_user")]
+
+
+def test_routers_match_included_app():
+    from_app = build_postman_collection(app, readme_file="missing.md")
+    from_routers = build_postman_collection(
+        [(users, "/v1"), (items, "/v1")],
+        readme_file="missing.md",
+    )
+    assert from_routers == from_app
+    assert _urls(from_routers) == {
+        "Users": [
+            "GET http://localhost/v1/users/",
+            "GET http://localhost/v1/users/{user_id}",
+            "GET http://localhost/v1/users/{user_id}/items",
+        ],
+        "Items": [
+            "POST http://localhost/v1/items",
+            "GET http://localhost/v1/users/{user_id}/items",
+        ],
+    }
+
+
+def test_single_router_without_app():
+    collection = build_postman_collection(users, readme_file="missing.md")
+    assert _urls(collection) == {
+        "Users": [
+            "GET http://localhost/users/",
+            "GET http://localhost/users/{user_id}",
+        ],
+    }
+
+
+def test_cli_router(tmp_path):
+    output_file = tmp_path / "collection.json"
+    main(
+        [
+            "--router",
+            "tests.test_routes:items@/api",
+            "--output",
+            str(output_file),
+            "--readme",
+            str(tmp_path / "missing.md"),
+        ]
+    )
+    with open(output_file) as f:
+        collection = json.load(f)
+    assert _urls(collection) == {
+        "Items": [
+            "POST http://localhost/api/items",
+            "GET http://localhost/api/users/{user_id}/items",
+        ],
+        "Users": ["GET http://localhost/api/users/{user_id}/items"],
+    }
+
+
+def test_cli_router_prefix_without_slash(tmp_path):
+    output_file = tmp_path / "collection.json"
+    main(
+        [
+            "--router",
+            "tests.test_routes:users@v1",
+            "--output",
+            str(output_file),
+            "--readme",
+            str(tmp_path / "missing.md"),
+        ]
+    )
+    with open(output_file) as f:
+        collection = json.load(f)
+    assert _urls(collection) == {
+        "Users": [
+            "GET http://localhost/v1/users/",
+            "GET http://localhost/v1/users/{user_id}",
+        ],
+    }
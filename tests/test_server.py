@@ -0,0 +1,152 @@
+import json
+import socket
+import threading
+from fastapi import FastAPI
+from fast_man import converter as converter_module
+from fast_man.converter import main
+from fast_man.server import (
+    CollectionServer,
+    filter_collection,
+    remove_stale_socket,
+    request_collection,
+)
+import pytest
+
+
+app = FastAPI()
+
+
+@app.get("/items/{item_id}", tags=["Items"])
+async def read_item(item_id: int):
+    return {"item_id": item_id}
+
+
+@app.post("/items/", tags=["Items"])
+async def create_item(name: str):
+    return {"name": name}
+
+
+@app.get("/users/me", tags=["Users"])
+async def read_users_me():
+    return {}
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    path = str(tmp_path / "fast-man.sock")
+    server = CollectionServer(
+        path,
+        app,
+        {
+            "name": "API",
+            "host": "http://localhost",
+            "readme": "README.md",
+            "seed": 0,
+        },
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+
+
+def test_filter_collection():
+    collection = {
+        "item": [
+            {
+                "name": "Items",
+                "item": [
+                    {"request": {"url": "http://h/items/1", "method": "GET"}},
+                    {"request": {"url": "http://h/other", "method": "GET"}},
+                ],
+            },
+            {"name": "Users", "item": []},
+        ]
+    }
+    filtered = filter_collection(collection, ["Items"], ["/items"], "http://h")
+    assert filtered["item"] == [
+        {
+            "name": "Items",
+            "item": [
+                {"request": {"url": "http://h/items/1", "method": "GET"}}
+            ],
+        }
+    ]
+    assert len(collection["item"][0]["item"]) == 2
+
+
+def test_request_collection_reuses_resident_build(socket_path, monkeypatch):
+    collection = request_collection(socket_path)
+    assert [folder["name"] for folder in collection["item"]] == [
+        "Items",
+        "Users",
+    ]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("collection rebuilt")
+
+    monkeypatch.setattr(
+        converter_module, "build_postman_collection", fail
+    )
+    collection = request_collection(socket_path, tags=["Users"])
+    assert [folder["name"] for folder in collection["item"]] == ["Users"]
+
+    with pytest.raises(RuntimeError, match="collection rebuilt"):
+        request_collection(socket_path, host="http://other")
+
+
+def test_client_command(socket_path, tmp_path):
+    output_file = tmp_path / "collection.json"
+    main(
+        [
+            "client",
+            "--socket",
+            socket_path,
+            "--output",
+            str(output_file),
+            "--path",
+            "/users",
+            "--host",
+            "http://api",
+        ]
+    )
+
+    with open(output_file) as f:
+        collection = json.load(f)
+    assert [
+        item["request"]["url"] for item in collection["item"][0]["item"]
+    ] == ["http://api/users/me"]
+
+
+def test_remove_stale_socket(socket_path, tmp_path):
+    with pytest.raises(FileExistsError):
+        remove_stale_socket(socket_path)
+
+    other_file = tmp_path / "not-a-socket"
+    other_file.write_text("data")
+    with pytest.raises(FileExistsError):
+        remove_stale_socket(str(other_file))
+    assert other_file.read_text() == "data"
+
+    stale_path = str(tmp_path / "stale.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(stale_path)
+    remove_stale_socket(stale_path)
+    remove_stale_socket(stale_path)
+    assert not (tmp_path / "stale.sock").exists()
+
+
+def test_serve_command_refuses_live_socket(socket_path):
+    with pytest.raises(SystemExit) as exit_info:
+        main(
+            [
+                "serve",
+                "--app",
+                "tests.test_server:app",
+                "--socket",
+                socket_path,
+            ]
+        )
+    assert exit_info.value.code == 1
+    assert request_collection(socket_path)["item"]
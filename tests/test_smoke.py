@@ -0,0 +1,91 @@
+import json
+from fastapi import FastAPI, Header, HTTPException
+from fast_man.converter import build_postman_collection, main
+from fast_man.smoke import smoke_test
+from pydantic import BaseModel, Field
+
+
+class Item(BaseModel):
+    name: str
+    price: float = Field(..., ge=1, le=5)
+
+
+class ResponseItem(BaseModel):
+    id: int
+
+
+app = FastAPI()
+
+
+@app.get("/items/{item_id}", tags=["Items"], response_model=ResponseItem)
+async def read_item(item_id: int):
+    return {"id": item_id}
+
+
+@app.post("/items/", tags=["Items"], status_code=201)
+async def create_item(item: Item):
+    return item
+
+
+@app.get("/broken", tags=["Items"], response_model=ResponseItem)
+async def broken():
+    raise HTTPException(status_code=500)
+
+
+@app.get("/secure", tags=["Secure"], response_model=ResponseItem)
+async def secure(authorization: str = Header(None)):
+    if authorization != "Bearer secret":
+        raise HTTPException(status_code=401)
+    return {"id": 1}
+
+
+def test_smoke_test_reports_mismatches_and_latency():
+    collection = build_postman_collection(app, input_host="http://api")
+
+    report = smoke_test(
+        app,
+        collection,
+        "http://api",
+        repeat=5,
+        concurrency=3,
+        token="secret",
+        annotate=True,
+    )
+
+    routes = {entry["route"]: entry for entry in report["routes"]}
+    assert set(routes) == {
+        "GET /items/{item_id}",
+        "POST /items/",
+        "GET /broken",
+        "GET /secure",
+    }
+    assert report["mismatches"] == ["GET /broken"]
+    assert routes["GET /broken"]["statuses"] == [500]
+    assert routes["POST /items/"]["statuses"] == [201]
+    assert routes["GET /secure"]["statuses"] == [200]
+    entry = routes["GET /items/{item_id}"]
+    assert entry["requests"] == 5
+    assert 0 < entry["p50_ms"] <= entry["p95_ms"] <= entry["p99_ms"]
+
+    description = collection["item"][0]["item"][0]["request"]["description"]
+    assert description.startswith("Measured latency: p50 ")
+
+
+def test_smoke_command(tmp_path, capsys):
+    main(
+        [
+            "smoke",
+            "--app",
+            "tests.test_smoke:app",
+            "--annotate",
+            str(tmp_path / "annotated.json"),
+        ]
+    )
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["mismatches"] == ["GET /broken", "GET /secure"]
+    with open(tmp_path / "annotated.json") as f:
+        collection = json.load(f)
+    assert "Measured latency" in (
+        collection["item"][0]["item"][0]["request"]["description"]
+    )
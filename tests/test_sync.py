@@ -0,0 +1,208 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from fastapi import FastAPI
+from fast_man.converter import build_postman_collection, main
+from fast_man.sync import push_collection
+import pytest
+
+
+def make_app(version: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}", tags=["Items"], summary=f"v{version}")
+    async def read_item(item_id: int):
+        return {"item_id": item_id}
+
+    @app.post("/items/", tags=["Items"])
+    async def create_item(name: str):
+        return {"name": name}
+
+    if version == 1:
+        @app.get("/legacy", tags=["Items"])
+        async def legacy():
+            return {}
+    else:
+        @app.get("/users/me", tags=["Users"])
+        async def read_users_me():
+            return {}
+
+    return app
+
+
+app_v2 = make_app(2)
+
+
+class StubPostman(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self):
+        server = self.server
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        with server.lock:
+            server.calls.append((self.command, self.path, body))
+            server.ports.add(self.client_address[1])
+            if self.headers.get("X-Api-Key") != "secret":
+                return self._reply(401, {})
+            if "/requests" in self.path:
+                if self.command in ("POST", "PUT"):
+                    check_payload(server, body)
+                status = server.fail_once.pop(self.command, None)
+                if status:
+                    return self._reply(status, {})
+        if self.command == "GET":
+            return self._reply(200, {"collection": server.collection})
+        if self.path.endswith("/folders"):
+            return self._reply(200, {"data": {"id": "folder-new"}})
+        return self._reply(200, {})
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+REQUEST_FIELDS = {
+    "name",
+    "method",
+    "url",
+    "description",
+    "headerData",
+    "dataMode",
+    "rawModeData",
+    "events",
+}
+
+
+def check_payload(server, body):
+    # The request endpoints take the flat request format.
+    if set(body) != REQUEST_FIELDS:
+        server.errors.append(f"fields {sorted(body)}")
+    elif not isinstance(body["url"], str):
+        server.errors.append("url is not a string")
+    elif not isinstance(body["rawModeData"], str):
+        server.errors.append("rawModeData is not a string")
+
+
+def postman_shape(item):
+    # The Postman API returns URL objects and raw bodies as strings,
+    # and drops the request keys it does not know.
+    request = item["request"]
+    url = request["url"]
+    request["url"] = {
+        "raw": url,
+        "host": ["http://api"],
+        "path": url[len("http://api/"):].split("/"),
+    }
+    request["body"]["raw"] = json.dumps(request["body"]["raw"])
+    for header in request["header"]:
+        header["type"] = "text"
+    del request["params"]
+    del request["responses"]
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubPostman)
+    server.calls = []
+    server.ports = set()
+    server.lock = threading.Lock()
+    server.errors = []
+    server.fail_once = {"PUT": 503, "POST": 429}
+    remote = build_postman_collection(make_app(1), input_host="http://api")
+    for index, folder in enumerate(remote["item"]):
+        folder["id"] = f"folder-{index}"
+        for position, item in enumerate(folder["item"]):
+            item["id"] = f"request-{position}"
+            postman_shape(item)
+    server.collection = remote
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_push_collection_sends_only_changes(stub):
+    collection = build_postman_collection(app_v2, input_host="http://api")
+
+    summary = push_collection(
+        collection,
+        "uid-1",
+        "secret",
+        api_url=f"http://127.0.0.1:{stub.server_port}",
+        input_host="http://api",
+        batch_size=2,
+        concurrency=2,
+        backoff=0,
+    )
+
+    assert summary == {"created": 1, "updated": 1, "deleted": 1, "failed": 0}
+    calls = [(method, path) for method, path, _ in stub.calls]
+    assert calls[0] == ("GET", "/collections/uid-1")
+    assert calls[1] == ("POST", "/collections/uid-1/folders")
+    assert sorted(calls[2:]) == [
+        ("DELETE", "/collections/uid-1/requests/request-2"),
+        ("POST", "/collections/uid-1/requests?folder=folder-new"),
+        ("POST", "/collections/uid-1/requests?folder=folder-new"),
+        ("PUT", "/collections/uid-1/requests/request-0"),
+        ("PUT", "/collections/uid-1/requests/request-0"),
+    ]
+    assert len(stub.ports) <= 2
+    assert stub.errors == []
+    put = next(body for method, _, body in stub.calls if method == "PUT")
+    assert put["method"] == "GET"
+    assert put["url"] == "http://api/items/{item_id}"
+    assert put["description"] == "v2"
+    assert json.loads(put["rawModeData"]) == {}
+
+
+def test_failed_create_is_not_retried(stub):
+    stub.fail_once = {"POST": 500}
+    collection = build_postman_collection(app_v2, input_host="http://api")
+
+    summary = push_collection(
+        collection,
+        "uid-1",
+        "secret",
+        api_url=f"http://127.0.0.1:{stub.server_port}",
+        input_host="http://api",
+        backoff=0,
+    )
+
+    assert summary["failed"] == 1
+    assert [
+        method for method, path, _ in stub.calls
+        if method == "POST" and "/requests" in path
+    ] == ["POST"]
+
+
+def test_push_command(stub, monkeypatch):
+    monkeypatch.setenv("POSTMAN_API_KEY", "secret")
+    stub.fail_once = {}
+
+    main(
+        [
+            "push",
+            "--app",
+            "tests.test_sync:app_v2",
+            "--collection-id",
+            "uid-1",
+            "--api-url",
+            f"http://127.0.0.1:{stub.server_port}",
+            "--host",
+            "http://api",
+        ]
+    )
+
+    methods = sorted(method for method, _, _ in stub.calls)
+    assert methods == ["DELETE", "GET", "POST", "POST", "PUT"]
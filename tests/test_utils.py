@@ -0,0 +1,97 @@
+from fastapi import FastAPI
+from fast_man.converter import build_postman_collection
+from fast_man.merge import merge_item
+from fast_man.utils import RESPONSE_TIME_SCRIPT, get_response_time_tests
+from pydantic import BaseModel
+import pytest
+
+
+class ErrorResponse(BaseModel):
+    detail: str
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+
+    @app.get(
+        "/items/{item_id}",
+        tags=["Items"],
+        openapi_extra={"x-slo-ms": 150},
+        responses={404: {"model": ErrorResponse}},
+    )
+    async def read_item(item_id: int):
+        return {"item_id": item_id}
+
+    @app.post("/items/", tags=["Items"], status_code=201)
+    async def create_item(name: str):
+        return {"name": name}
+
+    @app.get("/users/me", tags=["Users"])
+    async def read_users_me():
+        return {}
+
+    return app
+
+
+def test_get_response_time_tests_budget_precedence(app):
+    read_item, create_item, read_users_me = app.routes[-3:]
+
+    event = get_response_time_tests(
+        read_item, {"404": {}}, 500, {"Items": 300}
+    )[0]
+    assert event["listen"] == "test"
+    assert event["script"]["name"] == RESPONSE_TIME_SCRIPT
+    script = "\n".join(event["script"]["exec"])
+    assert "pm.expect(pm.response.responseTime).to.be.below(150);" in script
+    assert "pm.expect(pm.response.code).to.be.oneOf([200, 404]);" in script
+
+    script = "\n".join(
+        get_response_time_tests(
+            create_item, {}, 500, {"Items": 300}
+        )[0]["script"]["exec"]
+    )
+    assert ".to.be.below(300);" in script
+    assert ".to.be.oneOf([201]);" in script
+
+    script = "\n".join(
+        get_response_time_tests(
+            read_users_me, {}, 500, {"Items": 300}
+        )[0]["script"]["exec"]
+    )
+    assert ".to.be.below(500);" in script
+    assert get_response_time_tests(read_users_me, {}) == []
+
+
+def test_collection_items_carry_response_time_tests(app):
+    collection = build_postman_collection(app, slo_ms=1000)
+
+    items = [item for folder in collection["item"] for item in folder["item"]]
+    assert all(item["event"][0]["listen"] == "test" for item in items)
+    assert "event" not in build_postman_collection(app)["item"][1]["item"][0]
+
+
+def test_merge_keeps_hand_written_events_next_to_generated_test(app):
+    collection = build_postman_collection(app, slo_ms=1000)
+    item = collection["item"][0]["item"][0]
+    generated = item["event"][0]
+    hand_written = {"listen": "prerequest", "script": {"exec": ["x"]}}
+
+    merge_item(item, {"event": [dict(generated), hand_written]})
+
+    assert item["event"] == [generated, hand_written]
+
+
+def test_merge_drops_response_time_test_of_removed_budget(app):
+    generated = build_postman_collection(app, slo_ms=1000)
+    existing = generated["item"][0]["item"][1]
+    item = build_postman_collection(app)["item"][0]["item"][1]
+    assert "event" not in item
+
+    merge_item(item, existing)
+    assert "event" not in item
+
+    hand_written = {"listen": "prerequest", "script": {"exec": ["x"]}}
+    existing["event"].append(hand_written)
+    merge_item(item, existing)
+    assert item["event"] == [hand_written]
@@ -0,0 +1,135 @@
+from fastapi import FastAPI
+import json
+from fast_man.converter import (
+    build_postman_collection,
+    generate_postman_collection,
+    main,
+)
+from fast_man.validation import (
+    CollectionValidator,
+    compile_postman_validator,
+)
+import pytest
+
+
+app = FastAPI()
+
+
+@app.get("/items/{item_id}", tags=["Items"])
+async def read_item(item_id: int):
+    return {"item_id": item_id}
+
+
+def test_validator_is_compiled_once():
+    assert compile_postman_validator("item") is compile_postman_validator(
+        "item"
+    )
+
+
+def test_valid_collection_has_no_errors():
+    validator = CollectionValidator()
+    item = {
+        "name": "read_item",
+        "request": {
+            "url": "http://localhost/items/1",
+            "method": "GET",
+            "header": [{"key": "X-Trace", "value": "1"}],
+            "body": {"mode": "raw", "raw": "{}"},
+        },
+        "event": [
+            {
+                "listen": "test",
+                "script": {"type": "text/javascript", "exec": ["x"]},
+            }
+        ],
+    }
+    validator.validate_item(item, "GET /items/1")
+    validator.validate_collection(
+        {
+            "info": {"name": "API", "schema": "v2.1"},
+            "item": [{"name": "Items", "item": [item]}],
+            "auth": {"type": "bearer"},
+        }
+    )
+    assert validator.errors == []
+
+
+def test_generated_collection_is_validated_while_built():
+    validator = CollectionValidator()
+    build_postman_collection(app, validator=validator)
+
+    assert validator.errors == []
+    assert sorted(validator.warnings) == [
+        "GET /items/{item_id}.request.body.raw: expected string, got dict",
+        "GET /items/{item_id}.request: unexpected property 'params'",
+        "GET /items/{item_id}.request: unexpected property 'responses'",
+    ]
+
+
+def test_merged_fields_are_validated(tmp_path):
+    output_file = tmp_path / "collection.json"
+    existing = build_postman_collection(app)
+    existing["item"][0]["item"][0]["event"] = [{"listen": 1}]
+    output_file.write_text(json.dumps(existing))
+
+    validator = CollectionValidator()
+    generate_postman_collection(
+        app,
+        str(output_file),
+        merge_into=str(output_file),
+        validator=validator,
+    )
+    assert (
+        "GET /items/{item_id}.event[0].listen: expected string, got int"
+        in validator.errors
+    )
+    assert len(validator.errors) == len(set(validator.errors))
+
+
+def test_validator_reports_structural_errors():
+    validator = CollectionValidator()
+    validator.validate_collection(
+        {"info": {"name": 1}, "item": [], "auth": {"type": "magic"}}
+    )
+    assert sorted(validator.errors) == [
+        "collection.auth.type: 'magic' is not one of "
+        "['apikey', 'awsv4', 'basic', 'bearer', 'digest', 'edgegrid', "
+        "'hawk', 'noauth', 'oauth1', 'oauth2', 'ntlm']",
+        "collection.info.name: expected string, got int",
+        "collection.info: missing required 'schema'",
+    ]
+
+
+def test_validate_command_passes_on_generated_output(tmp_path):
+    output_file = tmp_path / "collection.json"
+    main(
+        [
+            "--app",
+            "tests.test_validation:app",
+            "--output",
+            str(output_file),
+            "--validate",
+        ]
+    )
+    assert output_file.exists()
+
+
+def test_validate_command_fails_on_violations(tmp_path):
+    output_file = tmp_path / "collection.json"
+    existing = build_postman_collection(app)
+    existing["item"][0]["item"][0]["event"] = [{"listen": 1}]
+    output_file.write_text(json.dumps(existing))
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(
+            [
+                "--app",
+                "tests.test_validation:app",
+                "--output",
+                str(output_file),
+                "--merge-into",
+                str(output_file),
+                "--validate",
+            ]
+        )
+    assert exit_info.value.code == 1